@@ -0,0 +1,51 @@
+"""config.yaml 전략 설정 몬테카를로 평가
+
+    python benchmarks/bench_monte_carlo.py [--sessions N] [--steps N] [--gold G]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+import yaml
+
+from domain.rates import GameRates
+from domain.strategy.strategies import (
+    PolicyTableStrategy, SpecialWeaponFarming, TargetEnforcementStrategy,
+)
+from simulation.monte_carlo import evaluate, policy_for
+from simulation.solver import solve
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--sessions', type=int, default=100_000)
+    ap.add_argument('--steps', type=int, default=1_000)
+    ap.add_argument('--gold', type=int, default=1_000_000)
+    ap.add_argument('--seed', type=int, default=0)
+    args = ap.parse_args()
+
+    with open(os.path.join(ROOT, 'config.yaml'), 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    rates = GameRates.from_dict(config.get('rates'))
+
+    strategies = [
+        SpecialWeaponFarming(config['strategies']['special_farming']),
+        TargetEnforcementStrategy(config['strategies']['target']),
+        PolicyTableStrategy({}, solve(rates)),
+    ]
+    for strategy in strategies:
+        started = time.perf_counter()
+        result = evaluate(policy_for(strategy), rates,
+                          sessions=args.sessions, steps=args.steps,
+                          gold=args.gold, seed=args.seed)
+        elapsed = time.perf_counter() - started
+        print(f"== {type(strategy).__name__} ({elapsed:.2f}s) ==")
+        print(result.report())
+
+
+if __name__ == "__main__":
+    main()
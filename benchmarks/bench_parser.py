@@ -0,0 +1,174 @@
+"""ChatParser 벤치마크 - 합성 채팅(CHAT.md 형식) 크기별 처리량/메모리
+
+    python benchmarks/bench_parser.py                      # 1k ~ 100k 줄
+    python benchmarks/bench_parser.py --sizes 1000 1000000
+    python benchmarks/bench_parser.py --save               # 기준값 저장
+    python benchmarks/bench_parser.py --compare            # 기준값과 비교
+
+기준값은 benchmarks/baseline.json에 저장되며, --compare는 기준 대비
+threshold(기본 20%) 이상 느려진 항목을 표시하고 종료 코드 1을 반환한다.
+측정 항목과 기준값 항목이 다르면(이름을 바꿨는데 기준값을 다시 저장하지
+않은 경우 등) 역시 실패한다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+import yaml
+
+from infrastructure.parser import ChatParser
+from simulation import transcript
+from simulation.transcript import TranscriptGenerator
+
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+# _scan 결과별 입력 (parse가 넘기는 것과 같은 마지막 봇 채팅들)
+SCAN_CASES = {
+    'success': transcript.success(3, 4, "낡은 검", 9_000, 100, 600),
+    'success +10': transcript.success(10, 11, "낡은 검", 9_000, 100, 600),
+    'kept': transcript.kept(5, "낡은 검", 9_000, 100, 600),
+    'destroy': transcript.destroyed(11, "낡은 검", "나무 검", 9_000, 100, 600),
+    'sell': transcript.sold(100, 9_000, "나무 검", 600),
+}
+
+
+def load_special_weapons() -> set:
+    with open(os.path.join(ROOT, 'config.yaml'), 'r', encoding='utf-8') as f:
+        return set(yaml.safe_load(f)['special_weapons'])
+
+
+def measure(fn, min_time: float = 0.2) -> float:
+    """fn 1회 평균 실행 시간(초) - min_time 이상 반복"""
+    fn()
+    count, started = 0, time.perf_counter()
+    while True:
+        fn()
+        count += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return elapsed / count
+
+
+def peak_memory(fn) -> int:
+    """fn 실행 중 최대 할당 메모리(바이트)"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_size(lines: int, special_weapons: set) -> dict:
+    text = TranscriptGenerator(special_weapons, seed=lines).generate(lines)
+    parser = ChatParser(special_weapons)
+    tail = ChatParser(special_weapons, tail=True)
+    name = parser.parse(text).weapon.name
+
+    def check_special():
+        parser._special_matcher.match.cache_clear()
+        parser._check_special(name)
+
+    timings = {
+        'parse': measure(lambda: parser.parse(text)),
+        'parse (tail)': measure(lambda: tail.parse(text)),
+        '_split_chats': measure(lambda: parser._split_chats(text)),
+        '_tail_chats': measure(lambda: tail._tail_chats(text)),
+        '_check_special': measure(check_special),
+        '_check_special (cached)': measure(lambda: parser._check_special(name)),
+    }
+    for case, chat in SCAN_CASES.items():
+        bot_chats = '\n'.join(c for c in tail._tail_chats(chat)
+                              if '[플레이봇]' in c)
+        timings[f'_scan ({case})'] = measure(
+            lambda bot_chats=bot_chats: parser._scan(bot_chats))
+    return {
+        'lines': lines,
+        'bytes': len(text.encode('utf-8')),
+        'seconds': timings,
+        'lines_per_sec': lines / timings['parse'],
+        'mb_per_sec': len(text.encode('utf-8')) / timings['parse'] / 1e6,
+        'peak_bytes': peak_memory(lambda: parser.parse(text)),
+    }
+
+
+def report(results: list):
+    for r in results:
+        print(f"\n== {r['lines']:,} lines ({r['bytes'] / 1e6:.1f} MB) ==")
+        for name, seconds in r['seconds'].items():
+            print(f"  {name:<26}{seconds * 1e6:>14,.1f} us")
+        print(f"  {'throughput':<26}{r['lines_per_sec']:>14,.0f} lines/s"
+              f"  ({r['mb_per_sec']:.1f} MB/s)")
+        print(f"  {'peak memory':<26}{r['peak_bytes'] / 1e6:>14,.2f} MB")
+
+
+def compare(results: list, baseline: dict, threshold: float) -> bool:
+    """기준값 대비 변화 출력, 회귀가 있거나 기준값 항목이 다르면 False"""
+    ok = True
+    print(f"\n== 기준값 비교 (threshold {threshold:.0%}) ==")
+    for r in results:
+        base = baseline.get(str(r['lines']))
+        if not base:
+            print(f"  {r['lines']:,} lines: 기준값 없음 (--save)  <-- 실패")
+            ok = False
+            continue
+        for name in sorted(set(base['seconds']) - set(r['seconds'])):
+            print(f"  {r['lines']:>9,} {name:<26}측정 안 함 (기준값에만 있음)"
+                  f"  <-- 실패")
+            ok = False
+        for name, seconds in r['seconds'].items():
+            before = base['seconds'].get(name)
+            if not before:
+                print(f"  {r['lines']:>9,} {name:<26}기준값 없음 (--save)"
+                      f"  <-- 실패")
+                ok = False
+                continue
+            change = seconds / before - 1
+            mark = ''
+            if change > threshold:
+                mark, ok = '  <-- 회귀', False
+            print(f"  {r['lines']:>9,} {name:<26}{change:>+8.1%}{mark}")
+        mem_change = r['peak_bytes'] / base['peak_bytes'] - 1
+        mark = ''
+        if mem_change > threshold:
+            mark, ok = '  <-- 회귀', False
+        print(f"  {r['lines']:>9,} {'peak memory':<26}{mem_change:>+8.1%}{mark}")
+    return ok
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    ap.add_argument('--save', action='store_true', help='기준값 저장')
+    ap.add_argument('--compare', action='store_true', help='기준값과 비교')
+    ap.add_argument('--threshold', type=float, default=0.2)
+    args = ap.parse_args()
+
+    special_weapons = load_special_weapons()
+    results = [bench_size(lines, special_weapons) for lines in args.sizes]
+    report(results)
+
+    if args.compare and os.path.exists(BASELINE):
+        with open(BASELINE, 'r', encoding='utf-8') as f:
+            if not compare(results, json.load(f), args.threshold):
+                sys.exit(1)
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(BASELINE):
+            with open(BASELINE, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update({str(r['lines']): r for r in results})
+        with open(BASELINE, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False, sort_keys=True)
+        print(f"\n기준값 저장: {BASELINE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""SimulatedGame 위에서 GameBot 전략 처리량 측정
+
+    python benchmarks/bench_simulator.py [명령 수]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+import yaml
+
+from domain.strategy.strategies import (
+    SpecialWeaponFarming, TargetEnforcementStrategy,
+)
+from domain.rates import GameRates
+from simulation.game import SimulatedGame
+from simulation.runner import simulate
+
+
+def main():
+    commands = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with open(os.path.join(ROOT, 'config.yaml'), 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    rates = GameRates.from_dict(config.get('rates'))
+    strategies = [
+        SpecialWeaponFarming(config['strategies']['special_farming']),
+        TargetEnforcementStrategy(config['strategies']['target']),
+    ]
+    for strategy in strategies:
+        game = SimulatedGame(config['special_weapons'], rates)
+        started = time.perf_counter()
+        bot = simulate(strategy, config, game, commands)
+        elapsed = time.perf_counter() - started
+
+        hours = game.elapsed / 3600
+        profit = game.gold_earned - game.gold_spent
+        print(f"== {type(strategy).__name__} ==")
+        print(f"  명령 {game.commands:,}개 / {elapsed:.2f}s "
+              f"({game.commands / elapsed:,.0f}/s, "
+              f"{game.commands / elapsed * 3600:,.0f}/h)")
+        print(f"  강화 {game.enforces:,} (성공 {game.successes:,} / "
+              f"유지 {game.kept:,} / 파괴 {game.destroyed:,}), "
+              f"판매 {game.sells:,}")
+        print(f"  골드 {game.gold:,}G, 게임 시간 {hours:,.1f}h, "
+              f"시간당 {profit / max(hours, 1e-9):,.0f}G")
+        print(f"  종료 상태: running={bot.running} paused={bot.paused} "
+              f"bankrupt={game.bankrupt}")
+
+
+if __name__ == "__main__":
+    main()
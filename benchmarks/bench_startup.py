@@ -0,0 +1,113 @@
+"""시작 시간 벤치마크 - main 모듈 import 시간, --dry-run 실행 시간
+
+    python benchmarks/bench_startup.py                 # 모듈별 import 시간
+    python benchmarks/bench_startup.py --max-ms 80     # 상한 변경 (기본 100)
+
+각 항목은 새 프로세스에서 repeat번 측정한 중앙값이며, 파이썬 자체 시작
+시간(python -c pass)을 뺀 값을 기준으로 비교한다. dry-run 시간이 상한을
+넘거나 import main 이 무거운 의존성(HEAVY)을 불러오면 종료 코드 1을
+반환한다. 같은 상한을 tests/test_startup.py 에서도 확인한다.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+
+# import main 만으로는 불러오면 안 되는 모듈
+HEAVY = ['pyautogui', 'win32clipboard', 'slack_sdk', 'dotenv', 'sqlite3',
+         'numpy', 'http.server', 'yaml']
+# dry-run 시작 시간 상한 (ms, 파이썬 시작 시간 제외)
+BUDGET_MS = 100
+
+
+def run(args: list, stdin: str = None) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env,
+                          input=stdin, capture_output=True, text=True,
+                          encoding='utf-8', check=True)
+
+
+def wall_time(args: list, repeat: int, stdin: str = None) -> float:
+    """중앙값 실행 시간(초)"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(args, stdin)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def import_times(module: str) -> list:
+    """-X importtime 결과: [(누적 µs, 모듈)] 최상위 import만"""
+    lines = run(['-X', 'importtime', '-c', f'import {module}']).stderr
+    rows = []
+    for line in lines.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        depth = len(name) - len(name.lstrip(' '))
+        if depth <= 3:  # main 과 main 이 직접 import 한 모듈
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)
+
+
+def loaded_heavy(module: str) -> list:
+    code = (f"import sys, {module}; "
+            f"print(' '.join(m for m in {HEAVY!r} if m in sys.modules))")
+    return run(['-c', code]).stdout.split()
+
+
+def sample_transcript() -> str:
+    sys.path.insert(0, SRC)
+    from simulation.transcript import TranscriptGenerator
+    return TranscriptGenerator(seed=0).generate(2_000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--top', type=int, default=12)
+    parser.add_argument('--max-ms', type=float, default=BUDGET_MS,
+                        help="dry-run 시작 시간 상한 (파이썬 시작 시간 제외)")
+    args = parser.parse_args()
+
+    print(f"{'import main (top-level)':<40} {'cumulative':>12}")
+    for cumulative, name in import_times('main')[:args.top]:
+        print(f"{name:<40} {cumulative / 1000:>10.1f}ms")
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8',
+                                     delete=False) as f:
+        f.write(sample_transcript())
+    try:
+        interpreter = wall_time(['-c', 'pass'], args.repeat)
+        imported = wall_time(['-c', 'import main'], args.repeat)
+        dry_run = wall_time(['src/main.py', '--dry-run', f.name],
+                            args.repeat)
+    finally:
+        os.unlink(f.name)
+
+    print()
+    print(f"{'python -c pass':<40} {interpreter * 1000:>10.1f}ms")
+    print(f"{'import main':<40} {(imported - interpreter) * 1000:>+10.1f}ms")
+    overhead = (dry_run - interpreter) * 1000
+    print(f"{'main.py --dry-run (2k lines)':<40} {overhead:>+10.1f}ms")
+
+    failed = False
+    heavy = loaded_heavy('main')
+    if heavy:
+        print(f"\nimport main 이 무거운 모듈을 로드함: {', '.join(heavy)}")
+        failed = True
+    if overhead > args.max_ms:
+        print(f"\ndry-run 시작 시간 {overhead:.1f}ms > {args.max_ms:.0f}ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
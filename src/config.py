@@ -1,27 +1,161 @@
-"""간단한 설정 관리"""
-import yaml
+"""간단한 설정 관리
+
+PyYAML은 로드(import + 순수 파이썬 파서)가 느려서, 파싱한 결과를
+'<설정 파일>.cache.json'에 저장해 두고 파일이 그대로면 JSON으로 읽는다.
+--dry-run처럼 짧게 실행할 때는 yaml을 아예 불러오지 않는다.
+"""
+import json
 import os
-from dotenv import load_dotenv
+import threading
 
 
-class Config:
-    def __init__(self, path: str = "config.yaml"):
-        load_dotenv()  # Load environment variables from .env file
+def _stamp(path: str) -> list:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_yaml(path: str):
+    """YAML 파일 읽기 (캐시가 파일과 같으면 yaml 없이 JSON으로)
 
+    YAML 오류는 ValueError.
+    """
+    cache = f"{path}.cache.json"
+    stamp = _stamp(path)
+    try:
+        with open(cache, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('stamp') == stamp:
+            return cached['data']
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
         with open(path, 'r', encoding='utf-8') as f:
-            self.data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"YAML 오류: {e}") from e
+
+    try:
+        # 토큰이 들어 있을 수 있으므로 소유자만 읽기
+        fd = os.open(cache, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump({'stamp': stamp, 'data': data}, f, ensure_ascii=False)
+    except (OSError, TypeError, ValueError):
+        # 쓸 수 없는 위치이거나 JSON으로 못 바꾸는 값(날짜 등) - 캐시 없이
+        try:
+            os.remove(cache)
+        except OSError:
+            pass
+    return data
+
+
+def _number_list(value) -> bool:
+    return isinstance(value, list) and len(value) > 0 and \
+        all(isinstance(v, (int, float)) for v in value)
+
+
+def validate(data: dict):
+    """봇 실행에 필요한 항목 확인 (잘못되면 ValueError)"""
+    if not isinstance(data, dict):
+        raise ValueError("설정 파일 형식 오류")
+
+    weapons = data.get('special_weapons')
+    if not isinstance(weapons, list) or \
+            not all(isinstance(w, str) for w in weapons):
+        raise ValueError("special_weapons: 문자열 목록이어야 함")
+
+    bot = data.get('bot') or {}
+    interval = bot.get('interval')
+    if not isinstance(interval, (int, float)) or interval < 0:
+        raise ValueError("bot.interval: 0 이상의 숫자여야 함")
+    low = bot.get('min_interval', interval)
+    high = bot.get('max_interval', interval)
+    if not all(isinstance(v, (int, float)) and v >= 0 for v in (low, high)) \
+            or low > high:
+        raise ValueError("bot.min_interval/max_interval: 0 <= min <= max")
+
+    strategies = data.get('strategies') or {}
+    special = strategies.get('special_farming') or {}
+    if not _number_list(special.get('safe_money')):
+        raise ValueError("strategies.special_farming.safe_money: 숫자 목록")
+    if not isinstance(special.get('target_level'), int):
+        raise ValueError("strategies.special_farming.target_level: 정수")
+    target = strategies.get('target') or {}
+    if not _number_list(target.get('required_money_per_level')):
+        raise ValueError(
+            "strategies.target.required_money_per_level: 숫자 목록")
+    if not isinstance(target.get('target_level'), int):
+        raise ValueError("strategies.target.target_level: 정수")
+
+    delays = (data.get('automation') or {}).get('delays')
+    if not isinstance(delays, dict) or not all(
+            isinstance(v, (int, float)) and v >= 0 for v in delays.values()):
+        raise ValueError("automation.delays: 0 이상의 숫자")
+
+
+class Config:
+    """config.yaml - reload()로 다시 읽으면 version이 올라감
+
+    다시 읽은 설정이 잘못되었으면 ValueError, 기존 설정은 그대로 둔다.
+    """
+
+    def __init__(self, path: str = "config.yaml", env: bool = True):
+        if env:
+            # Load environment variables from .env file
+            # (python-dotenv는 로드가 느려 Slack 토큰이 필요할 때만)
+            from dotenv import load_dotenv
+            load_dotenv()
+
+        self.path = path
+        self.version = 0
+        self._lock = threading.Lock()
+        self.mtime = os.path.getmtime(path)
+        self.data = self._read()
+        validate(self.data)
+
+    def _read(self) -> dict:
+        data = load_yaml(self.path)
+        if not isinstance(data, dict):
+            raise ValueError("설정 파일 형식 오류")
 
         # Override slack tokens with environment variables if they exist
-        if 'slack' not in self.data:
-            self.data['slack'] = {}
-        
+        if 'slack' not in data:
+            data['slack'] = {}
+
         bot_token = os.getenv("SLACK_BOT_TOKEN")
         if bot_token:
-            self.data['slack']['bot_token'] = bot_token
-        
+            data['slack']['bot_token'] = bot_token
+
         app_token = os.getenv("SLACK_APP_TOKEN")
         if app_token:
-            self.data['slack']['app_token'] = app_token
+            data['slack']['app_token'] = app_token
+        return data
+
+    def changed(self) -> bool:
+        """파일 수정 시각이 바뀌었는지"""
+        try:
+            return os.path.getmtime(self.path) != self.mtime
+        except OSError:
+            return False
+
+    def reload(self) -> dict:
+        """다시 읽고 검증 후 교체, 이전 설정 반환"""
+        with self._lock:
+            mtime = os.path.getmtime(self.path)
+            try:
+                data = self._read()
+            finally:
+                # 잘못된 파일도 다시 수정될 때까지 재시도하지 않음
+                self.mtime = mtime
+            validate(data)
+            previous, self.data = self.data, data
+            self.version += 1
+            return previous
 
     def __getitem__(self, key):
         return self.data[key]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
@@ -0,0 +1,97 @@
+"""최근 상태 기록 - 고정 크기 링 버퍼"""
+import time
+from array import array
+
+from domain.state import ChatbotState, GameState
+
+_STATES = {int(state): state for state in ChatbotState}
+
+
+class StateHistory:
+    """최근 capacity개 상태를 타입 배열 4개(레벨/골드/상태 코드/시각)에 저장
+
+    메모리는 생성할 때 한 번만 잡으므로 며칠을 돌려도 일정하다.
+    history[-1]이 가장 최근 (리스트처럼 음수/양수 번호 모두 O(1)).
+    무기 이름은 저장하지 않음 - 현재 무기는 GameBot.state.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        if capacity <= 0:
+            raise ValueError("capacity: 1 이상이어야 함")
+        self.capacity = capacity
+        self.levels = array('b', bytes(capacity))
+        self.golds = array('q', bytes(8 * capacity))
+        self.codes = array('B', bytes(capacity))
+        self.times = array('d', bytes(8 * capacity))
+        self._next = 0   # 다음에 쓸 위치
+        self._size = 0
+
+    def append(self, state: GameState, t: float = None):
+        i = self._next
+        self.levels[i] = state.weapon.level
+        self.golds[i] = state.gold
+        self.codes[i] = state.bot_state
+        self.times[i] = time.time() if t is None else t
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def clear(self):
+        self._next = self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slot(self, index: int) -> int:
+        """번호(0: 가장 오래된 것, -1: 가장 최근) → 배열 위치"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("StateHistory 범위 밖")
+        return (self._next - self._size + index) % self.capacity
+
+    def __getitem__(self, index: int) -> tuple:
+        """(레벨, 골드, ChatbotState, 시각)"""
+        i = self._slot(index)
+        return (self.levels[i], self.golds[i], _STATES[self.codes[i]],
+                self.times[i])
+
+    def level(self, index: int = -1) -> int:
+        return self.levels[self._slot(index)]
+
+    def gold(self, index: int = -1) -> int:
+        return self.golds[self._slot(index)]
+
+    def state(self, index: int = -1) -> ChatbotState:
+        return _STATES[self.codes[self._slot(index)]]
+
+    def time(self, index: int = -1) -> float:
+        return self.times[self._slot(index)]
+
+    def __iter__(self):
+        """오래된 것부터"""
+        for index in range(self._size):
+            yield self[index]
+
+    def recent(self, n: int) -> list:
+        """최근 n개 (오래된 것부터)"""
+        n = min(n, self._size)
+        return [self[index] for index in range(self._size - n, self._size)]
+
+    def gold_rate(self, seconds: float) -> float:
+        """최근 seconds초 동안 골드 변화량 (시간당) - 시작점은 이분 탐색"""
+        if self._size < 2:
+            return 0.0
+        end = self._size - 1
+        since = self.time(end) - seconds
+        start, hi = 0, end
+        while start < hi:
+            mid = (start + hi) // 2
+            if self.time(mid) < since:
+                start = mid + 1
+            else:
+                hi = mid
+        elapsed = self.time(end) - self.time(start)
+        if elapsed <= 0:
+            return 0.0
+        return (self.gold(end) - self.gold(start)) / elapsed * 3600
@@ -0,0 +1,49 @@
+"""강화/판매 결정표"""
+import json
+
+ENFORCE = 'E'
+SELL = 'S'
+
+
+class PolicyTable:
+    """(레벨, 골드 구간, 특수 여부) → 강화(E) / 판매(S)
+
+    골드 구간은 gold.bit_length() (0: 0G, b: 2^(b-1) ~ 2^b - 1G).
+    범위를 넘는 레벨/구간은 마지막 값을 사용한다.
+    """
+
+    def __init__(self, normal: list, special: list, key: str = None,
+                 meta: dict = None):
+        # 레벨별 문자열, 글자 하나가 골드 구간 하나
+        self.rows = (normal, special)
+        self.key = key
+        self.meta = meta or {}
+
+    @property
+    def levels(self) -> int:
+        return len(self.rows[0])
+
+    @property
+    def buckets(self) -> int:
+        return len(self.rows[0][0])
+
+    def decide(self, level: int, gold: int, is_special: bool) -> str:
+        row = self.rows[bool(is_special)]
+        actions = row[min(level, len(row) - 1)]
+        return actions[min(max(gold, 0).bit_length(), len(actions) - 1)]
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'key': self.key,
+                'meta': self.meta,
+                'normal': self.rows[0],
+                'special': self.rows[1],
+            }, f, indent=1)
+
+    @classmethod
+    def load(cls, path: str) -> 'PolicyTable':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['normal'], data['special'], data.get('key'),
+                   data.get('meta'))
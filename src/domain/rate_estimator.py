@@ -0,0 +1,137 @@
+"""레벨별 강화 확률 온라인 추정"""
+import json
+import math
+import os
+import threading
+
+from domain.rates import GameRates
+from domain.state import ChatbotState, GameState
+
+# 결과 → counts 인덱스
+RESULTS = {
+    ChatbotState.SUCCESS: 0,
+    ChatbotState.REMAINED: 1,
+    ChatbotState.FAILED: 2,
+}
+
+
+class RateEstimator:
+    """레벨별 성공/유지/파괴 확률 - 지수 감쇠 카운트
+
+    레벨마다 관측할 때 그 레벨의 카운트만 decay 배로 줄이고 1을 더하므로
+    메모리와 갱신/조회 모두 O(1)이다. half_life번 관측 전의 결과는 가중치가
+    절반이 된다. 추정값은 prior(GameRates)를 prior_weight번 관측한 것으로
+    섞은 평균이고, 구간은 관측 카운트만으로 계산한 Wilson 신뢰구간이다.
+    여러 인스턴스(스레드)가 하나를 공유하므로 갱신/조회/저장은 잠금 안에서.
+    파일 저장은 틱 스레드를 막지 않도록 종료할 때만 한다 (main의 finally).
+    """
+
+    def __init__(self, prior: GameRates = None, half_life: float = 500,
+                 prior_weight: float = 5, path: str = None):
+        self.prior = prior or GameRates()
+        self.decay = 0.5 ** (1 / half_life)
+        self.prior_weight = prior_weight
+        self.path = path
+        self.counts = {}  # 레벨 → [성공, 유지, 파괴]
+        self._lock = threading.RLock()
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def observe(self, before: GameState, after: GameState):
+        """강화 명령 전후 상태로 결과 반영 (강화 결과가 아니면 무시)"""
+        index = RESULTS.get(after.bot_state)
+        if index is None:
+            return
+        self.add(before.weapon.level, index)
+
+    def add(self, level: int, index: int):
+        with self._lock:
+            counts = self.counts.get(level)
+            if counts is None:
+                counts = self.counts[level] = [0.0, 0.0, 0.0]
+            for i in range(3):
+                counts[i] *= self.decay
+            counts[index] += 1.0
+
+    def levels(self) -> list:
+        """관측된 레벨 (오름차순)"""
+        with self._lock:
+            return sorted(self.counts)
+
+    def samples(self, level: int) -> float:
+        """유효 관측 수 (감쇠 반영)"""
+        with self._lock:
+            return sum(self.counts.get(level, ()))
+
+    def _prior(self, level: int) -> tuple:
+        success = self.prior.success_at(level)
+        destroy = self.prior.destroy_at(level)
+        return success, 1.0 - success - destroy, destroy
+
+    def estimate(self, level: int) -> tuple:
+        """(성공, 유지, 파괴) 확률"""
+        with self._lock:
+            counts = tuple(self.counts.get(level, (0.0, 0.0, 0.0)))
+        n = sum(counts) + self.prior_weight
+        return tuple((c + self.prior_weight * p) / n
+                     for c, p in zip(counts, self._prior(level)))
+
+    def success(self, level: int) -> float:
+        return self.estimate(level)[0]
+
+    def keep(self, level: int) -> float:
+        return self.estimate(level)[1]
+
+    def destroy(self, level: int) -> float:
+        return self.estimate(level)[2]
+
+    def interval(self, level: int, state: ChatbotState = ChatbotState.SUCCESS,
+                 z: float = 1.96) -> tuple:
+        """Wilson 신뢰구간 (관측이 없으면 (0, 1))"""
+        with self._lock:
+            counts = tuple(self.counts.get(level, ()))
+        n = sum(counts) if counts else 0.0
+        if n <= 0:
+            return 0.0, 1.0
+        p = counts[RESULTS[state]] / n
+        z2 = z * z
+        center = (p + z2 / (2 * n)) / (1 + z2 / n)
+        margin = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+    def to_rates(self) -> GameRates:
+        """추정 확률을 반영한 GameRates (비용/판매가는 prior 그대로)"""
+        with self._lock:
+            levels = max([len(self.prior.success), len(self.prior.destroy)]
+                         + [level + 1 for level in self.counts])
+        estimates = [self.estimate(level) for level in range(levels)]
+        return GameRates(
+            success=[e[0] for e in estimates],
+            destroy=[e[2] for e in estimates],
+            cost=list(self.prior.cost),
+            price=list(self.prior.price),
+            special_rate=self.prior.special_rate,
+            special_multiplier=self.prior.special_multiplier,
+        )
+
+    def save(self):
+        """추정 상태 저장 (재시작 후에도 유지)"""
+        if not self.path:
+            return
+        with self._lock:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'decay': self.decay,
+                    'counts': {str(level): counts
+                               for level, counts in self.counts.items()},
+                }, f, indent=1)
+            os.replace(tmp, self.path)
+
+    def load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.decay = data.get('decay', self.decay)
+        self.counts = {int(level): [float(c) for c in counts]
+                       for level, counts in data['counts'].items()}
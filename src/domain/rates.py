@@ -0,0 +1,71 @@
+"""강화 확률/비용 모델"""
+from dataclasses import dataclass, field
+
+# 레벨별 강화 비용 (+N → +N+1, CHAT.md 예시와 required_money_per_level 기준)
+DEFAULT_COSTS = [
+    10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000,
+    20000, 30000, 40000, 50000, 70000, 100000, 150000, 200000, 300000, 500000,
+]
+# 레벨별 판매가 (추정값)
+DEFAULT_PRICES = [
+    10, 20, 50, 120, 300, 700, 1600, 3600, 8000, 18000,
+    40000, 90000, 200000, 450000, 1000000, 2200000, 5000000, 11000000,
+    25000000, 56000000,
+]
+
+
+def _default_success():
+    return [max(0.95 - 0.04 * level, 0.2) for level in range(20)]
+
+
+def _default_destroy():
+    return [0.0 if level < 3 else min(0.03 * (level - 2), 0.4)
+            for level in range(20)]
+
+
+@dataclass
+class GameRates:
+    """레벨별 강화 성공/유지/파괴 확률과 비용, 판매가
+
+    목록 길이를 넘는 레벨은 마지막 값을 사용한다.
+    유지 확률은 1 - 성공 - 파괴.
+    """
+    success: list = field(default_factory=_default_success)
+    destroy: list = field(default_factory=_default_destroy)
+    cost: list = field(default_factory=lambda: list(DEFAULT_COSTS))
+    price: list = field(default_factory=lambda: list(DEFAULT_PRICES))
+    # +0 → +1 성공 시 특수 무기가 나올 확률, 특수 무기 판매가 배율
+    special_rate: float = 0.05
+    special_multiplier: float = 3.0
+
+    def __post_init__(self):
+        for level, (s, d) in enumerate(zip(self.success, self.destroy)):
+            if s < 0 or d < 0 or s + d > 1:
+                raise ValueError(f"invalid rates at +{level}: "
+                                 f"success={s}, destroy={d}")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GameRates':
+        """config.yaml 설정 → GameRates (없는 항목은 기본값)"""
+        return cls(**{k: v for k, v in (data or {}).items()
+                      if k in cls.__dataclass_fields__})
+
+    @staticmethod
+    def _at(values: list, level: int):
+        return values[min(level, len(values) - 1)]
+
+    def success_at(self, level: int) -> float:
+        return self._at(self.success, level)
+
+    def destroy_at(self, level: int) -> float:
+        return self._at(self.destroy, level)
+
+    def keep_at(self, level: int) -> float:
+        return 1.0 - self.success_at(level) - self.destroy_at(level)
+
+    def cost_at(self, level: int) -> int:
+        return self._at(self.cost, level)
+
+    def price_at(self, level: int, is_special: bool = False) -> int:
+        price = self._at(self.price, level)
+        return int(price * self.special_multiplier) if is_special else price
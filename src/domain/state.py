@@ -1,27 +1,41 @@
 """게임 상태 도메인 모델"""
+import sys
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 
-class ChatbotState(Enum):
-    """챗봇 상태"""
-    SUCCESS = "성공"
-    FAILED = "파괴"
-    REMAINED = "유지"
-    SELL = "판매"
-    IDLE = "대기"
-    PROCESSING = "수행중"
+class ChatbotState(IntEnum):
+    """챗봇 상태 - 정수 코드(StateHistory 배열에 저장), label은 표시용 이름
 
+    코드는 1부터 (0은 '상태 없음'으로 남겨 둠)
+    """
+    SUCCESS = 1, "성공"
+    FAILED = 2, "파괴"
+    REMAINED = 3, "유지"
+    SELL = 4, "판매"
+    IDLE = 5, "대기"
+    PROCESSING = 6, "수행중"
 
-@dataclass
+    def __new__(cls, code: int, label: str):
+        member = int.__new__(cls, code)
+        member._value_ = code
+        member.label = label
+        return member
+
+
+@dataclass(frozen=True, slots=True)
 class Weapon:
-    """무기 정보"""
+    """무기 정보 (이름은 intern - 틱마다 파싱해도 같은 문자열 객체 공유)"""
     name: str
     level: int
     is_special: bool
 
+    def __post_init__(self):
+        if isinstance(self.name, str):
+            object.__setattr__(self, 'name', sys.intern(self.name))
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameState:
     """게임 현재 상태"""
     gold: int
@@ -14,6 +14,7 @@ class MacroMode(ABC):
         매크로 한 스텝 실행
 
         Args:
-            gamebot: GameBot 인스턴스
+            gamebot: GameBot 인스턴스 (gamebot.state: 현재 상태,
+                gamebot.history: 최근 상태 기록 StateHistory)
         """
         pass
@@ -0,0 +1,66 @@
+"""전략 등록/생성 - 내장 전략 + 규칙 파일"""
+import os
+
+from domain.strategy.base import MacroMode
+from domain.strategy.rules import RuleStrategy, compile_rules
+
+
+class StrategyRegistry:
+    """전략 이름 → 생성 함수
+
+    규칙 파일(YAML, 이름 → 규칙 세트)은 reload() 때 수정 시각이 바뀌었으면
+    다시 읽어 컴파일한다. 잘못된 파일이면 이전 규칙을 유지하고 ValueError.
+    """
+
+    def __init__(self, rules_path: str = None):
+        self.rules_path = rules_path
+        self._factories = {}
+        self._rule_sets = {}  # 이름 → (규칙 세트, RuleTable)
+        self._mtime = None
+
+    def register(self, name: str, factory):
+        """factory: 인자 없이 MacroMode를 만드는 함수"""
+        self._factories[name] = factory
+
+    def names(self) -> list:
+        return list(self._factories) + \
+            [name for name in self._rule_sets if name not in self._factories]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories or name in self._rule_sets
+
+    def create(self, name: str) -> MacroMode:
+        """이름으로 전략 생성 (없는 이름이면 KeyError)"""
+        if name in self._factories:
+            return self._factories[name]()
+        rule_set, table = self._rule_sets[name]
+        # 전략마다 설정 복사본 - !강화로 바꿔도 등록된 규칙은 그대로
+        return RuleStrategy(dict(rule_set), table)
+
+    def reload(self) -> bool:
+        """규칙 파일이 바뀌었으면 다시 로드 (바뀌었으면 True)"""
+        if not self.rules_path or not os.path.exists(self.rules_path):
+            return False
+        mtime = os.path.getmtime(self.rules_path)
+        if mtime == self._mtime:
+            return False
+
+        import yaml
+
+        try:
+            with open(self.rules_path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"규칙 파일 오류: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError("규칙 파일은 이름 → 규칙 세트 형식이어야 함")
+
+        rule_sets = {}
+        for name, rule_set in data.items():
+            try:
+                rule_sets[name] = (rule_set, compile_rules(rule_set))
+            except (AttributeError, ValueError) as e:
+                raise ValueError(f"{name}: {e}") from e
+        self._rule_sets = rule_sets
+        self._mtime = mtime
+        return True
@@ -0,0 +1,187 @@
+"""규칙 기반 전략 - YAML 규칙을 결정표로 컴파일"""
+from bisect import bisect_right
+
+from domain.state import ChatbotState
+from domain.strategy.base import MacroMode
+
+ACTIONS = ('enforce', 'sell', 'pause', 'stop', 'wait')
+WAIT = ACTIONS.index('wait')
+
+_STATES = list(ChatbotState)
+_STATE_INDEX = {state: i for i, state in enumerate(_STATES)}
+_RULE_KEYS = {'level', 'min_level', 'max_level', 'special', 'state',
+              'min_gold', 'gold_below', 'action'}
+
+
+def _state(value) -> ChatbotState:
+    """'파괴' 또는 'FAILED' → ChatbotState"""
+    for state in _STATES:
+        if value in (state.label, state.name):
+            return state
+    raise ValueError(f"알 수 없는 상태: {value}")
+
+
+def _gold_at(value, level: int) -> int:
+    """레벨별 목록이면 해당 레벨 값 (범위를 넘으면 마지막 값)"""
+    if isinstance(value, (list, tuple)):
+        return value[min(level, len(value) - 1)]
+    return value
+
+
+class Rule:
+    """규칙 하나 - 조건을 모두 만족하면 action
+
+    level: 5 또는 [3, 10] (양 끝 포함), min_level/max_level,
+    special: true/false, state: '파괴' 또는 목록,
+    min_gold 이상 / gold_below 미만 (숫자 또는 레벨별 목록).
+    문자열 값은 규칙 세트의 같은 이름 항목을 가리킨다 (예: safe_money).
+    """
+
+    def __init__(self, spec: dict, params: dict):
+        unknown = set(spec) - _RULE_KEYS
+        if unknown:
+            raise ValueError(f"알 수 없는 조건: {', '.join(sorted(unknown))}")
+        if spec.get('action') not in ACTIONS:
+            raise ValueError(f"알 수 없는 action: {spec.get('action')}")
+        self.action = ACTIONS.index(spec['action'])
+
+        def resolve(key):
+            value = spec.get(key)
+            if isinstance(value, str):
+                if value not in params:
+                    raise ValueError(f"정의되지 않은 값: {value}")
+                value = params[value]
+            return value
+
+        level = resolve('level')
+        if isinstance(level, (list, tuple)):
+            self.min_level, self.max_level = level
+        elif level is not None:
+            self.min_level = self.max_level = level
+        else:
+            self.min_level = resolve('min_level') or 0
+            self.max_level = resolve('max_level')
+
+        self.special = spec.get('special')
+        states = spec.get('state')
+        if states is None:
+            self.states = None
+        else:
+            if not isinstance(states, list):
+                states = [states]
+            self.states = {_state(s) for s in states}
+        self.min_gold = resolve('min_gold')
+        self.gold_below = resolve('gold_below')
+
+    @property
+    def levels(self) -> list:
+        """조건에 쓰인 레벨 경계"""
+        levels = [self.min_level, self.max_level or 0]
+        for value in (self.min_gold, self.gold_below):
+            if isinstance(value, (list, tuple)):
+                levels.append(len(value) - 1)
+        return levels
+
+    def applies(self, state: ChatbotState, special: bool,
+                level: int) -> bool:
+        """골드를 뺀 조건"""
+        return (level >= self.min_level
+                and (self.max_level is None or level <= self.max_level)
+                and (self.special is None or self.special == special)
+                and (self.states is None or state in self.states))
+
+    def bounds(self, level: int) -> tuple:
+        """이 레벨에서의 골드 범위 [low, high)"""
+        low = _gold_at(self.min_gold, level)
+        high = _gold_at(self.gold_below, level)
+        return low, high
+
+
+class RuleTable:
+    """(상태, 특수 여부, 레벨) → 골드 경계/행동 목록
+
+    칸마다 골드 경계를 정렬해 두고 bisect로 구간을 찾는다.
+    범위를 넘는 레벨은 마지막 칸을 사용한다.
+    """
+
+    def __init__(self, rules: list):
+        self.rows = max([level for rule in rules for level in rule.levels],
+                        default=0) + 2
+        self.cells = [
+            self._compile(rules, state, special, level)
+            for state in _STATES
+            for special in (False, True)
+            for level in range(self.rows)
+        ]
+
+    @staticmethod
+    def _compile(rules: list, state, special: bool, level: int) -> tuple:
+        rules = [rule for rule in rules if rule.applies(state, special, level)]
+        bounds = [rule.bounds(level) for rule in rules]
+        edges = sorted({edge for pair in bounds for edge in pair
+                        if edge is not None})
+
+        # 구간마다 대표 골드(구간 시작값)로 처음 맞는 규칙을 찾음
+        starts = [edges[0] - 1 if edges else 0] + edges
+        actions = []
+        for gold in starts:
+            action = WAIT
+            for rule, (low, high) in zip(rules, bounds):
+                if (low is None or gold >= low) and \
+                        (high is None or gold < high):
+                    action = rule.action
+                    break
+            actions.append(action)
+
+        # 같은 행동이 이어지는 경계는 제거
+        thresholds, merged = [], [actions[0]]
+        for edge, action in zip(edges, actions[1:]):
+            if action != merged[-1]:
+                thresholds.append(edge)
+                merged.append(action)
+        return tuple(thresholds), tuple(merged)
+
+    def decide(self, state: ChatbotState, special: bool, level: int,
+               gold: int) -> str:
+        index = (_STATE_INDEX[state] * 2 + bool(special)) * self.rows
+        thresholds, actions = self.cells[index + min(level, self.rows - 1)]
+        if thresholds:
+            return ACTIONS[actions[bisect_right(thresholds, gold)]]
+        return ACTIONS[actions[0]]
+
+
+def compile_rules(rule_set: dict) -> RuleTable:
+    """규칙 세트(dict: rules + 참조할 값) → RuleTable (잘못된 규칙은 ValueError)"""
+    specs = rule_set.get('rules')
+    if not specs:
+        raise ValueError("rules가 비어 있음")
+    rules = []
+    for i, spec in enumerate(specs, 1):
+        try:
+            rules.append(Rule(spec, rule_set))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"규칙 {i}: {e}") from e
+    return RuleTable(rules)
+
+
+class RuleStrategy(MacroMode):
+    """규칙 기반 전략 - 위에서부터 처음 맞는 규칙의 행동 실행
+
+    `!강화 N`으로 target_level이 바뀌면 다시 컴파일한다.
+    """
+
+    def __init__(self, config: dict, table: RuleTable = None):
+        super().__init__(config)
+        self.table = table or compile_rules(config)
+        self._target_level = config.get('target_level')
+
+    def do_step(self, gamebot):
+        if self.config.get('target_level') != self._target_level:
+            self.table = compile_rules(self.config)
+            self._target_level = self.config.get('target_level')
+
+        state = gamebot.state
+        action = self.table.decide(state.bot_state, state.weapon.is_special,
+                                   state.weapon.level, state.gold)
+        if action != 'wait':
+            getattr(gamebot, action)()
@@ -1,6 +1,5 @@
 """구체적 전략 구현"""
-from datetime import datetime, timedelta
-
+from domain.policy_table import SELL, PolicyTable
 from domain.state import ChatbotState
 from domain.strategy.base import MacroMode
 
@@ -31,18 +30,13 @@ class SpecialWeaponFarming(MacroMode):
 
 class TargetEnforcementStrategy(MacroMode):
 
-    def __init__(self, config: dict):
-        super().__init__(config)
-        self.last_executed = datetime.now()
-
     def do_step(self, gamebot):
         state = gamebot.state
 
-        if state.bot_state == ChatbotState.PROCESSING and self.last_executed < (datetime.now() - timedelta(minutes=2)):
+        # 다른 사용자 채팅 등 - 응답 대기/재전송은 GameBot(CommandTracker)이 담당
+        if state.bot_state == ChatbotState.PROCESSING:
             return
 
-        self.last_executed = datetime.now()
-
         if state.gold < self.config['required_money_per_level'][state.weapon.level]:
             gamebot.stop()
             return
@@ -51,4 +45,21 @@ class TargetEnforcementStrategy(MacroMode):
             gamebot.pause()
             return
 
-        gamebot.enforce()
\ No newline at end of file
+        gamebot.enforce()
+
+
+class PolicyTableStrategy(MacroMode):
+    """결정표 전략 - simulation.solver가 계산한 PolicyTable을 그대로 따름"""
+
+    def __init__(self, config: dict, table: PolicyTable):
+        super().__init__(config)
+        self.table = table
+
+    def do_step(self, gamebot):
+        state = gamebot.state
+        action = self.table.decide(state.weapon.level, state.gold,
+                                   state.weapon.is_special)
+        if action == SELL:
+            gamebot.sell()
+        else:
+            gamebot.enforce()
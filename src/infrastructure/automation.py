@@ -3,37 +3,118 @@ import time
 import pyautogui
 import win32clipboard
 
+from infrastructure.calibration import DelayProfile
+from infrastructure.chat_anchor import after_anchor, has_echo, tail_anchor
+from infrastructure.input_arbiter import InputArbiter
+from infrastructure.metrics import Metrics
+
 
 class GameAutomation:
-    def __init__(self, delays: dict):
+    # 명령 에코가 이 시간 안에 보이지 않으면 유실로 판단
+    ECHO_TIMEOUT = 3.0
+
+    def __init__(self, delays: dict, profile: DelayProfile = None,
+                 metrics: Metrics = None, arbiter: InputArbiter = None,
+                 focus: tuple = None, name: str = None):
         self.delays = delays
+        self.profile = profile
+        self.metrics = metrics or Metrics()
+        # 여러 인스턴스 실행 시: 입력 독점, 입력 전 클릭할 채팅창 위치
+        self.arbiter = arbiter
+        self.focus = tuple(focus) if focus else None
+        self.name = name
+        self._pending = None  # (명령, 전송 시각, 전송 전 마지막 채팅들)
+        self._last_anchor = ""
+
+    def _delay(self, step: str) -> float:
+        """단계별 지연 시간 (학습된 프로필 우선)"""
+        if self.profile:
+            return self.profile.get(step)
+        return self.delays.get(step, DelayProfile.DEFAULTS[step])
+
+    def _acquire_input(self):
+        """입력 독점 (인스턴스가 하나면 생략)"""
+        if self.arbiter:
+            with self.metrics.span('input_wait'):
+                self.arbiter.acquire(self.name)
+
+    def _focus(self):
+        """이 인스턴스의 채팅창 선택"""
+        if self.focus:
+            pyautogui.click(*self.focus)
+
+    def _release_input(self):
+        if self.arbiter:
+            self.arbiter.release()
 
     def get_chat(self) -> str:
         """채팅 텍스트 가져오기"""
-        pyautogui.hotkey('ctrl', 'a')
-        time.sleep(0.1)
-        pyautogui.hotkey('ctrl', 'c')
-        time.sleep(0.1)
+        self._acquire_input()
+        try:
+            self._focus()
+            return self._read_chat()
+        finally:
+            self._release_input()
+
+    def _read_chat(self) -> str:
+        with self.metrics.span('chat_capture'):
+            pyautogui.hotkey('ctrl', 'a')
+            time.sleep(self._delay('select'))
+            pyautogui.hotkey('ctrl', 'c')
+            time.sleep(self._delay('copy'))
 
         try:
-            win32clipboard.OpenClipboard()
-            text = win32clipboard.GetClipboardData(
-                win32clipboard.CF_UNICODETEXT
-            )
-            win32clipboard.CloseClipboard()
-            return text
-        except:
+            with self.metrics.span('clipboard_read'):
+                win32clipboard.OpenClipboard()
+                text = win32clipboard.GetClipboardData(
+                    win32clipboard.CF_UNICODETEXT
+                )
+                win32clipboard.CloseClipboard()
+        except Exception:
+            self.metrics.inc('clipboard_failures')
             try:
                 win32clipboard.CloseClipboard()
-            except:
+            except Exception:
                 pass
             return ""
+        self._check_echo(text)
+        return text
+
+    def _check_echo(self, text: str):
+        """직전 명령이 채팅에 반영되었는지 확인해 프로필에 반영"""
+        if not self.profile:
+            return
+        pending = self._pending
+        # 전송 전 마지막 채팅들을 기준점으로 - 그 뒤에서만 에코를 찾음
+        self._last_anchor = tail_anchor(text)
+        if not pending:
+            return
+        cmd, sent_at, anchor = pending
+        elapsed = time.monotonic() - sent_at
+        if has_echo(after_anchor(text, anchor), cmd):
+            self.profile.landed(elapsed)
+            self._pending = None
+        elif elapsed > self.ECHO_TIMEOUT:
+            self.profile.lost()
+            self._pending = None
 
     def send_command(self, cmd: str) -> None:
         """명령 전송"""
-        time.sleep(self.delays.get('before', 0.3))
+        self._acquire_input()
+        try:
+            self._focus()
+            self._type_command(cmd)
+        finally:
+            self._release_input()
+
+        if self.profile:
+            # 이전 명령의 에코를 확인하기 전에 새 명령을 보내면 이전 것은 판정 생략
+            self._pending = (cmd, time.monotonic(), self._last_anchor)
+
+    def _type_command(self, cmd: str):
+        time.sleep(self._delay('before'))
         pyautogui.press('enter')
-        time.sleep(self.delays.get('after', 0.1))
+        time.sleep(self._delay('after'))
 
         # 클립보드로 한글 입력
         win32clipboard.OpenClipboard()
@@ -45,9 +126,9 @@ class GameAutomation:
         win32clipboard.CloseClipboard()
 
         pyautogui.hotkey('ctrl', 'v')
-        time.sleep(self.delays.get('paste', 0.1))
+        time.sleep(self._delay('paste'))
         pyautogui.press('enter')
-        time.sleep(0.3)
+        time.sleep(self._delay('submit'))
         pyautogui.press('enter')
-        time.sleep(0.2)
+        time.sleep(self._delay('close'))
         pyautogui.click()
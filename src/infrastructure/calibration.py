@@ -0,0 +1,147 @@
+"""입력 지연 시간 자동 보정"""
+import json
+import os
+
+
+class DelayProfile:
+    """GameAutomation 입력 단계별 지연 시간 학습
+
+    명령이 채팅에 반영(에코)되면 성공, 시간 안에 보이지 않으면 유실로 본다.
+    - 보정 중: 성공할 때마다 단계 하나씩 돌아가며 shrink 배로 줄이고,
+      유실되면 마지막으로 줄인 단계를 되돌린 뒤 그 값을 해당 단계의
+      최소값으로 확정한다. 모든 단계가 확정되면 프로필을 저장한다.
+    - 보정 후: streak번 연속 성공하면 최소값까지만 모든 단계를 줄이고,
+      유실되면 모든 단계를 grow 배로 늘리며 유실된 값을 새 최소값으로 둔다.
+    지연 시간이 바뀔 때마다 보정 진행 상태까지 전부 저장하므로, 다시
+    시작하면 보정 중이던 곳 / 보정 후 늘이고 줄인 값부터 이어간다.
+    """
+
+    # 단계: send_command(before, after, paste, submit, close) / get_chat(select, copy)
+    DEFAULTS = {
+        'before': 0.3,
+        'after': 0.1,
+        'paste': 0.1,
+        'submit': 0.3,
+        'close': 0.2,
+        'select': 0.1,
+        'copy': 0.1,
+    }
+
+    def __init__(self, delays: dict, path: str = None,
+                 min_delay: float = 0.02, shrink: float = 0.8,
+                 grow: float = 1.5, streak: int = 10):
+        self.delays = {**self.DEFAULTS, **delays}
+        # 유실이 반복되어도 처음 설정값의 2배 이상으로는 늘리지 않음
+        self.ceilings = {step: delay * 2 for step, delay in self.delays.items()}
+        self.floors = {step: min_delay for step in self.delays}
+        self.settled = set()
+        self.path = path
+        self.min_delay = min_delay
+        self.shrink = shrink
+        self.grow = grow
+        self.streak = streak
+        self.calibrated = False
+        self.echo_latency = None  # 명령 → 에코 지연 (지수 이동 평균)
+
+        self._successes = 0
+        self._turn = 0
+        self._last_change = None  # (단계, 줄이기 전 값)
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def get(self, step: str) -> float:
+        return self.delays[step]
+
+    def landed(self, echo_latency: float):
+        """명령 반영 확인"""
+        if self.echo_latency is None:
+            self.echo_latency = echo_latency
+        else:
+            self.echo_latency = 0.8 * self.echo_latency + 0.2 * echo_latency
+
+        self._successes += 1
+        if not self.calibrated:
+            self._shrink_next()
+        elif self._successes >= self.streak:
+            self._successes = 0
+            for step, delay in self.delays.items():
+                self.delays[step] = max(self.floors[step],
+                                        delay * self.shrink)
+            self.save()
+
+    def lost(self):
+        """명령 유실 - 마지막 변경을 되돌리고 늘림"""
+        self._successes = 0
+        if not self.calibrated and self._last_change:
+            step, previous = self._last_change
+            self.delays[step] = previous
+            self.floors[step] = previous
+            self.settled.add(step)
+            self._last_change = None
+            if len(self.settled) == len(self.delays):
+                self._finish()
+            else:
+                self.save()
+            return
+
+        for step, delay in self.delays.items():
+            self.delays[step] = min(delay * self.grow, self.ceilings[step])
+            self.floors[step] = min(max(self.floors[step], delay),
+                                    self.delays[step])
+        self._last_change = None
+        self.save()
+
+    def _shrink_next(self):
+        """확정되지 않은 단계를 하나씩 돌아가며 줄임"""
+        steps = [step for step in self.delays
+                 if step not in self.settled
+                 and self.delays[step] > self.floors[step]]
+        if not steps:
+            self._finish()
+            return
+        step = steps[self._turn % len(steps)]
+        self._turn += 1
+        previous = self.delays[step]
+        self.delays[step] = max(self.floors[step], previous * self.shrink)
+        self._last_change = (step, previous)
+        self.save()
+
+    def _finish(self):
+        self.calibrated = True
+        self._last_change = None
+        self.save()
+
+    def save(self):
+        """프로필 전체(지연/최소/최대값, 보정 진행 상태) 저장"""
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'delays': self.delays,
+                'floors': self.floors,
+                'ceilings': self.ceilings,
+                'settled': sorted(self.settled),
+                'calibrated': self.calibrated,
+                'echo_latency': self.echo_latency,
+                'successes': self._successes,
+                'turn': self._turn,
+                'last_change': self._last_change,
+            }, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def load(self):
+        """저장된 프로필 로드 (보정 상태가 없는 이전 형식은 보정 완료로)"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.delays.update(data['delays'])
+        self.floors.update(data.get('floors', {}))
+        self.ceilings.update(data.get('ceilings', {}))
+        self.echo_latency = data.get('echo_latency')
+        self.calibrated = data.get('calibrated', True)
+        self.settled = set(data.get('settled', self.delays))
+        self._successes = data.get('successes', 0)
+        self._turn = data.get('turn', 0)
+        last_change = data.get('last_change')
+        self._last_change = tuple(last_change) if last_change else None
@@ -0,0 +1,26 @@
+"""채팅 스냅샷 변화 감지"""
+
+
+class ChangeDetector:
+    """길이 + 끝부분 해시로 스냅샷 변화 여부를 판단
+
+    채팅은 항상 끝에 추가되므로 전체를 비교하지 않고 길이와 마지막
+    TAIL_SIZE 글자만 비교한다.
+    """
+
+    TAIL_SIZE = 256
+
+    def __init__(self):
+        self._fingerprint = None
+
+    def changed(self, text: str) -> bool:
+        """직전 스냅샷과 다르면 True (지문 갱신)"""
+        fingerprint = (len(text), hash(text[-self.TAIL_SIZE:]))
+        if fingerprint == self._fingerprint:
+            return False
+        self._fingerprint = fingerprint
+        return True
+
+    def reset(self):
+        """다음 스냅샷을 무조건 변경으로 처리"""
+        self._fingerprint = None
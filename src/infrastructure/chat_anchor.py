@@ -0,0 +1,45 @@
+"""채팅 기준점 - 명령을 보낸 뒤 새로 올라온 채팅만 찾기
+
+보낼 때 마지막 채팅 몇 건(기준점)을 기억해 두고, 나중에 읽은 채팅에서
+그 뒤 부분만 본다. 채팅창이 넘쳐 앞줄이 잘려도 글자 위치 대신 내용으로
+찾으므로 새 채팅만 남는다.
+"""
+import re
+
+# 채팅 한 건의 시작 '[이름] [오후 3:21] '
+CHAT_HEADER = re.compile(r'\[.+?\] \[.+?\] ')
+# 기준점으로 쓰는 마지막 채팅 수
+ANCHOR_CHATS = 3
+BOT_HEADER = '[플레이봇] ['
+
+
+def tail_anchor(text: str, count: int = ANCHOR_CHATS) -> str:
+    """마지막 count개 채팅 (채팅이 그보다 적으면 전체)"""
+    seen, end = 0, len(text)
+    while end > 0:
+        start = text.rfind('\n', 0, end) + 1
+        if CHAT_HEADER.match(text, start):
+            seen += 1
+            if seen == count:
+                return text[start:]
+        end = start - 1
+    return text
+
+
+def after_anchor(text: str, anchor: str) -> str:
+    """text에서 기준점 뒤 부분 (기준점이 이미 잘려 나갔으면 전체가 새 채팅)"""
+    position = text.rfind(anchor) if anchor else -1
+    if position < 0:
+        return text
+    return text[position + len(anchor):]
+
+
+def has_echo(new_chats: str, cmd: str) -> bool:
+    """새 채팅에 보낸 명령(/cmd)의 에코가 있는지"""
+    return f"] /{cmd}" in new_chats
+
+
+def has_bot_chat(new_chats: str) -> bool:
+    """새 채팅 중에 플레이봇 채팅이 있는지"""
+    return new_chats.startswith(BOT_HEADER) or \
+        f"\n{BOT_HEADER}" in new_chats
@@ -0,0 +1,111 @@
+"""보낸 명령 추적 - 응답 왕복 지연, 응답이 없으면 재전송"""
+import time
+from dataclasses import dataclass
+
+from domain.state import GameState
+from infrastructure.chat_anchor import (
+    after_anchor, has_bot_chat, has_echo, tail_anchor,
+)
+from infrastructure.metrics import Histogram
+
+
+@dataclass(frozen=True, slots=True)
+class Reply:
+    """명령과 짝지은 플레이봇 응답"""
+    cmd: str
+    before: GameState  # 보낼 때 상태 (아직 파싱 전이면 None)
+    state: GameState
+    latency: float     # 마지막 전송 → 응답 (초)
+
+
+class CommandTracker:
+    """마지막으로 보낸 명령(/강화, /판매)과 플레이봇 응답을 짝지음
+
+    응답 대기 중인 명령은 여기에만 기록한다 - 왕복 지연, 강화 결과 기록/
+    확률 추정, 대시보드 집계가 모두 observe가 돌려준 Reply를 쓴다.
+    보낼 때의 마지막 채팅들을 기준점(chat_anchor)으로 기억해 두고, 그 뒤에
+    플레이봇 채팅이 하나라도 올라오면 응답으로 본다 (응답 뒤에 다른 사람이
+    채팅해 마지막 채팅이 봇이 아니어도).
+    timeout초 안에 응답이 없을 때, 기준점 뒤에 명령 에코도 없으면(입력 유실)
+    같은 명령을 다시 보내고 다음 대기 시간은 backoff 배씩 늘린다
+    (max_timeout까지). 에코가 있으면 명령은 들어간 것이므로 다시 보내지
+    않고(/강화 중복 → 목표 초과/파괴 위험) 대기만 끝낸다. max_resends번
+    재전송해도 응답이 없으면 포기한다.
+    """
+
+    def __init__(self, timeout: float = 120.0, backoff: float = 2.0,
+                 max_timeout: float = 600.0, max_resends: int = 5,
+                 clock=time.monotonic):
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_timeout = max_timeout
+        self.max_resends = max_resends
+        self.clock = clock
+
+        self.rtt = Histogram()
+        self.resends = 0
+        self.gave_up = 0
+        self.unanswered = 0  # 에코는 있는데 응답이 없어 대기를 끝낸 수
+        # 응답 대기 중인 명령:
+        # (명령, 보낼 때 상태, 마지막 전송 시각, 재전송 횟수, 기준점)
+        self.pending = None
+        self.echoed = False  # 대기 중인 명령의 에코를 봤는지
+
+    @property
+    def waiting(self) -> bool:
+        return self.pending is not None
+
+    def sent(self, cmd: str, state: GameState, chat: str = ""):
+        """새 명령 전송 - chat은 보내기 직전 읽은 채팅 (이전 명령은 버림)"""
+        self.pending = (cmd, state, self.clock(), 0, tail_anchor(chat))
+        self.echoed = False
+
+    def cancel(self):
+        self.pending = None
+
+    def observe(self, state: GameState, chat: str) -> Reply:
+        """파싱한 상태/채팅이 대기 중인 명령의 응답이면 Reply, 아니면 None"""
+        if self.pending is None:
+            return None
+        cmd, before, sent_at, _, anchor = self.pending
+        new_chats = after_anchor(chat, anchor)
+        if not has_bot_chat(new_chats):
+            self.echoed = self.echoed or has_echo(new_chats, cmd)
+            return None
+        self.pending = None
+        latency = self.clock() - sent_at
+        self.rtt.observe(latency)
+        return Reply(cmd, before, state, latency)
+
+    def overdue(self) -> str:
+        """응답 대기 시간이 지났으면 다시 보낼 명령 (재전송으로 기록)"""
+        if self.pending is None:
+            return None
+        cmd, before, sent_at, resends, anchor = self.pending
+        timeout = min(self.timeout * self.backoff ** resends,
+                      self.max_timeout)
+        now = self.clock()
+        if now - sent_at < timeout:
+            return None
+        if self.echoed:
+            # 명령은 채팅에 들어감 - 다시 보내지 않고 대기만 끝냄
+            self.pending = None
+            self.unanswered += 1
+            return None
+        if resends >= self.max_resends:
+            self.pending = None
+            self.gave_up += 1
+            return None
+        self.pending = (cmd, before, now, resends + 1, anchor)
+        self.resends += 1
+        return cmd
+
+    def summary(self) -> str:
+        """!상태용 한 줄"""
+        rtt = self.rtt
+        if not rtt.count:
+            return f"⏱️ 응답: 기록 없음 (재전송 {self.resends:,})"
+        return (f"⏱️ 응답: p50 {rtt.quantile(0.5):.2f}s / "
+                f"p95 {rtt.quantile(0.95):.2f}s "
+                f"(재전송 {self.resends:,} / 포기 {self.gave_up:,} / "
+                f"무응답 {self.unanswered:,})")
@@ -0,0 +1,80 @@
+"""Slack 명령 대기열"""
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class RecentIds:
+    """최근 처리한 ID (크기 제한 LRU) - Socket Mode 재전송 중복 제거용"""
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def seen(self, *ids) -> bool:
+        """하나라도 이미 본 ID면 True, 아니면 모두 기록 후 False"""
+        ids = [i for i in ids if i]
+        with self._lock:
+            if any(i in self._ids for i in ids):
+                for i in ids:
+                    if i in self._ids:
+                        self._ids.move_to_end(i)
+                return True
+            for i in ids:
+                self._ids[i] = None
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+            return False
+
+
+class CommandQueue:
+    """Slack 명령을 모아 두었다가 메인 루프 틱 사이에 순서대로 실행
+
+    명령마다 스레드를 만들지 않고, GameBot 상태 변경이 루프와
+    겹치지 않도록 한 스레드(메인 루프)에서만 실행한다.
+    """
+
+    def __init__(self, max_size: int = 100):
+        self.max_size = max_size
+        self._queue = deque()  # (명령, 도착 시각)
+        self._lock = threading.Lock()
+
+        self.processed = 0
+        self.dropped = 0
+        self.avg_latency = 0.0  # 도착 → 실행 (지수 이동 평균, 초)
+        self.max_latency = 0.0
+
+    def put(self, command: str) -> bool:
+        """명령 추가 (가득 차면 False)"""
+        with self._lock:
+            if len(self._queue) >= self.max_size:
+                self.dropped += 1
+                return False
+            self._queue.append((command, time.monotonic()))
+            return True
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def drain(self, handler) -> int:
+        """쌓인 명령을 모두 handler로 실행, 실행 개수 반환"""
+        count = 0
+        while True:
+            with self._lock:
+                if not self._queue:
+                    return count
+                command, received = self._queue.popleft()
+            latency = time.monotonic() - received
+            self._record(latency)
+            handler(command)
+            count += 1
+
+    def _record(self, latency: float):
+        self.processed += 1
+        if self.processed == 1:
+            self.avg_latency = latency
+        else:
+            self.avg_latency = 0.9 * self.avg_latency + 0.1 * latency
+        self.max_latency = max(self.max_latency, latency)
@@ -0,0 +1,51 @@
+"""Slack/게임 입력 없이 실행 (--no-slack, --dry-run)"""
+import sys
+import threading
+
+from infrastructure.notifier import Notifier
+from infrastructure.slack_outbox import PRIORITY_NORMAL
+
+
+class ConsoleNotifier(Notifier):
+    """SlackBot 대체 - 메시지는 출력, 명령(!...)은 표준 입력에서 읽음"""
+
+    def __init__(self, stdin: bool = True):
+        self.stdin = stdin
+        self.command_handler = None
+
+    def set_command_handler(self, handler):
+        self.command_handler = handler
+
+    def start(self):
+        if self.stdin:
+            threading.Thread(target=self._read_commands, daemon=True).start()
+
+    def _read_commands(self):
+        for line in sys.stdin:
+            text = line.strip()
+            if text.startswith("!") and self.command_handler:
+                self.command_handler(text)
+
+    def stop(self):
+        pass
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        return True
+
+    def send_message(self, text: str, priority: int = PRIORITY_NORMAL):
+        print(f"[SLACK] {text}")
+
+
+class TranscriptAutomation:
+    """GameAutomation 대체 - 주어진 채팅 텍스트를 읽고, 명령은 출력만"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.sent = []
+
+    def get_chat(self) -> str:
+        return self.text
+
+    def send_command(self, cmd: str) -> None:
+        self.sent.append(cmd)
+        print(f"[DRY-RUN] /{cmd}")
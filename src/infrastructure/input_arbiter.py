@@ -0,0 +1,38 @@
+"""키보드/클립보드 입력 독점"""
+import threading
+
+
+class InputArbiter:
+    """여러 GameBot 인스턴스가 키보드/클립보드를 번갈아 쓰도록 조정
+
+    요청한 순서대로(FIFO) 한 인스턴스씩 입력을 잡는다. 한 인스턴스가 응답을
+    기다리며 쉬는 동안 다른 인스턴스가 명령을 보낼 수 있다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._next = 0     # 다음에 발급할 번호
+        self._serving = 0  # 입력을 쓰고 있는 번호
+        self.owner = None
+
+    def acquire(self, owner: str = None):
+        with self._cond:
+            ticket = self._next
+            self._next += 1
+            while ticket != self._serving:
+                self._cond.wait()
+            self.owner = owner
+
+    def release(self):
+        with self._cond:
+            self.owner = None
+            self._serving += 1
+            self._cond.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
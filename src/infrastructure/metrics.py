@@ -0,0 +1,200 @@
+"""단계별 지연 시간/카운터 지표"""
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# 지연 시간 구간 상한 (초) - 100µs ~ 10s
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Histogram:
+    """고정 구간 히스토그램 - 분위수는 구간 안에서 선형 보간"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막: 상한 초과
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                if i == len(self.buckets):
+                    return self.max
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = min(self.buckets[i], self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+
+class _Span:
+    """with 블록 실행 시간 측정 (contextmanager보다 가벼움)"""
+    __slots__ = ('metrics', 'stage', 'started')
+
+    def __init__(self, metrics: 'Metrics', stage: str):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.stage, time.perf_counter() - self.started)
+        return False
+
+
+class Metrics:
+    """단계별 지연 시간(span) 히스토그램과 카운터
+
+    with metrics.span('parse'): ... 로 측정하며, 한 번에 1~2µs 정도 든다.
+    """
+
+    def __init__(self, prefix: str = "playbot", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def span(self, stage: str) -> '_Span':
+        return _Span(self, stage)
+
+    def observe(self, stage: str, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def count(self, name: str) -> int:
+        return self.counters.get(name, 0)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        name = f"{self.prefix}_stage_seconds"
+        lines = [f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, h in sorted(self.histograms.items()):
+                total = 0
+                for bound, n in zip(h.buckets + ('+Inf',), h.counts):
+                    total += n
+                    lines.append(
+                        f'{name}_bucket{{stage="{stage}",le="{bound}"}} {total}'
+                    )
+                lines.append(f'{name}_sum{{stage="{stage}"}} {h.sum:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+            for counter, value in sorted(self.counters.items()):
+                metric = f"{self.prefix}_{counter}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """Slack용 요약 (단계별 p50/p95/p99, 카운터)"""
+        lines = ["📈 *지표*"]
+        with self._lock:
+            for stage, h in sorted(self.histograms.items()):
+                lines.append(
+                    f"• `{stage}` {h.count:,}회 - "
+                    f"p50 {h.quantile(0.5) * 1000:.1f} / "
+                    f"p95 {h.quantile(0.95) * 1000:.1f} / "
+                    f"p99 {h.quantile(0.99) * 1000:.1f}ms"
+                )
+            for counter, value in sorted(self.counters.items()):
+                lines.append(f"• {counter}: {value:,}")
+        return '\n'.join(lines)
+
+    def write(self, path: str):
+        """파일에 render() 결과를 원자적으로 저장"""
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+class MetricsExporter:
+    """지표 노출 - 로컬 HTTP(/metrics) 또는 주기적으로 다시 쓰는 파일
+
+    port가 None이면 HTTP 없음 (0이면 임의 포트), path가 None이면 파일 없음.
+    """
+
+    def __init__(self, metrics: Metrics, port: int = None, path: str = None,
+                 interval: float = 10.0, host: str = "127.0.0.1"):
+        self.metrics = metrics
+        self.port = port
+        self.path = path
+        self.interval = interval
+        self.host = host
+        self._server = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self.port is not None:
+            # http.server는 로드가 느려 HTTP를 쓸 때만
+            from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+            metrics = self.metrics
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path != '/metrics':
+                        self.send_error(404)
+                        return
+                    body = metrics.render().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type',
+                                     'text/plain; version=0.0.4')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((self.host, self.port),
+                                               Handler)
+            self.port = self._server.server_address[1]
+            threading.Thread(target=self._server.serve_forever,
+                             daemon=True).start()
+        if self.path:
+            threading.Thread(target=self._write_loop, daemon=True).start()
+
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.metrics.write(self.path)
+            except OSError as e:
+                print(f"지표 파일 저장 실패: {e}")
+
+    def stop(self):
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        if self.path:
+            try:
+                self.metrics.write(self.path)
+            except OSError:
+                pass
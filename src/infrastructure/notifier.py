@@ -0,0 +1,59 @@
+"""Slack 알림 메시지 형식"""
+from infrastructure.slack_outbox import PRIORITY_LOW, PRIORITY_NORMAL
+
+
+class Notifier:
+    """알림 메시지 형식 - send_message만 구현하면 됨
+
+    SlackBot, 인스턴스별 Slack(InstanceSlack), NullSlack이 같은 형식을 쓴다.
+    dashboard(DashboardPanel)가 있으면 강화/판매 알림과 상태 조회는 새
+    메시지 대신 고정된 대시보드 메시지에 반영한다.
+    """
+
+    dashboard = None
+
+    def send_message(self, text: str, priority: int = PRIORITY_NORMAL):
+        raise NotImplementedError
+
+    def notify_success(self, from_level: int, to_level: int,
+                      gold: int):
+        """강화 성공(목표 달성) 알림 - 밀려도 생략하지 않음"""
+        self.send_message(
+            f"✅ *강화 성공* [+{from_level}] → [+{to_level}]\n"
+            f"💰 골드: {gold:,}G",
+            PRIORITY_NORMAL
+        )
+
+    def notify_failure(self, from_level: int, new_weapon: str):
+        """강화 파괴 알림"""
+        if self.dashboard:
+            return
+        self.send_message(
+            f"❌ *강화 파괴* [+{from_level}] → [+0]\n"
+            f"⚔️ 새 무기: {new_weapon}",
+            PRIORITY_LOW
+        )
+
+    def notify_sell(self, gold_gained: int, total_gold: int):
+        """판매 알림"""
+        if self.dashboard:
+            return
+        self.send_message(
+            f"💰 *판매 완료* +{gold_gained:,}G\n"
+            f"💵 총 골드: {total_gold:,}G",
+            PRIORITY_LOW
+        )
+
+    def notify_status(self, state, extra: list = None):
+        """상태 조회 응답 (extra: 덧붙일 줄 목록)"""
+        if self.dashboard:
+            self.dashboard.show(state, extra)
+            return
+        lines = [
+            "📊 *현재 상태*",
+            f"⚔️ 무기: [+{state.weapon.level}] {state.weapon.name}",
+            f"💰 골드: {state.gold:,}G",
+            f"🔸 특수: {'예' if state.weapon.is_special else '아니오'}",
+            f"🤖 상태: {state.bot_state.label}",
+        ]
+        self.send_message('\n'.join(lines + (extra or [])))
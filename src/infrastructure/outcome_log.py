@@ -0,0 +1,201 @@
+"""강화 결과 기록 (SQLite, WAL)"""
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS weapons (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    result TEXT NOT NULL,
+    from_level INTEGER NOT NULL,
+    to_level INTEGER NOT NULL,
+    weapon_id INTEGER NOT NULL REFERENCES weapons(id),
+    is_special INTEGER NOT NULL,
+    gold_before INTEGER NOT NULL,
+    gold_after INTEGER NOT NULL,
+    latency REAL
+);
+CREATE INDEX IF NOT EXISTS outcomes_level_ts ON outcomes(from_level, ts);
+CREATE INDEX IF NOT EXISTS outcomes_ts ON outcomes(ts);
+"""
+
+COLUMNS = ('ts', 'result', 'from_level', 'to_level', 'weapon', 'is_special',
+           'gold_before', 'gold_after', 'latency')
+
+
+class OutcomeLog:
+    """강화 결과(성공/유지/파괴)를 추가만 하는 기록
+
+    record()는 큐에 넣고 바로 반환하며, 백그라운드 스레드가 batch_size개
+    또는 flush_interval초마다 한 트랜잭션으로 모아 쓴다. WAL 모드라 조회는
+    쓰기와 동시에 할 수 있다. 무기 이름은 별도 테이블로 정규화한다.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100,
+                 flush_interval: float = 1.0, retention_days: float = None):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self._queue = queue.Queue()
+        self._thread = None
+
+        with self._open() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(SCHEMA)
+        if retention_days:
+            self.prune(time.time() - retention_days * 86400)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    @contextmanager
+    def _open(self):
+        """조회용 연결 (끝나면 커밋 후 닫음)"""
+        db = self._connect()
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def start(self):
+        if self._thread:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def record(self, result: str, from_level: int, to_level: int,
+               weapon: str, is_special: bool, gold_before: int,
+               gold_after: int, latency: float = None, ts: float = None):
+        """결과 추가 (즉시 반환)"""
+        self._queue.put((
+            time.time() if ts is None else ts, result, from_level, to_level,
+            weapon, int(is_special), gold_before, gold_after, latency,
+        ))
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """큐에 쌓인 기록을 모두 쓸 때까지 대기"""
+        if not self._thread:
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout: float = 10.0):
+        """남은 기록을 쓰고 종료"""
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        db = self._connect()
+        weapons = dict(db.execute("SELECT name, id FROM weapons"))
+        try:
+            running = True
+            while running:
+                batch, waiters = [], []
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+                while True:
+                    if item is None:
+                        running = False
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+                    if not running or len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._write(db, weapons, batch)
+                for waiter in waiters:
+                    waiter.set()
+        finally:
+            db.close()
+
+    def _write(self, db: sqlite3.Connection, weapons: dict, batch: list):
+        try:
+            with db:
+                rows = []
+                for row in batch:
+                    name = row[4]
+                    weapon_id = weapons.get(name)
+                    if weapon_id is None:
+                        db.execute("INSERT OR IGNORE INTO weapons(name) "
+                                   "VALUES (?)", (name,))
+                        weapon_id = weapons[name] = db.execute(
+                            "SELECT id FROM weapons WHERE name = ?", (name,)
+                        ).fetchone()[0]
+                    rows.append(row[:4] + (weapon_id,) + row[5:])
+                db.executemany(
+                    "INSERT INTO outcomes(ts, result, from_level, to_level, "
+                    "weapon_id, is_special, gold_before, gold_after, latency) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error as e:
+            print(f"강화 결과 기록 실패: {e}")
+
+    @staticmethod
+    def _time_range(since: float, until: float, column: str = "ts"):
+        where, args = [], []
+        if since is not None:
+            where.append(f"{column} >= ?")
+            args.append(since)
+        if until is not None:
+            where.append(f"{column} < ?")
+            args.append(until)
+        return where, args
+
+    def query(self, level: int = None, since: float = None,
+              until: float = None, limit: int = None) -> list:
+        """결과 조회 (강화 전 레벨, 시간 범위) - 시간순 dict 목록"""
+        where, args = self._time_range(since, until, "o.ts")
+        if level is not None:
+            where.append("o.from_level = ?")
+            args.append(level)
+        sql = ("SELECT o.ts, o.result, o.from_level, o.to_level, w.name, "
+               "o.is_special, o.gold_before, o.gold_after, o.latency "
+               "FROM outcomes o JOIN weapons w ON w.id = o.weapon_id")
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY o.ts"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(limit)
+        with self._open() as db:
+            return [dict(zip(COLUMNS, row)) for row in db.execute(sql, args)]
+
+    def level_stats(self, since: float = None, until: float = None) -> dict:
+        """레벨별 결과 개수 {레벨: {'성공': n, '유지': n, '파괴': n}}"""
+        where, args = self._time_range(since, until)
+        sql = "SELECT from_level, result, COUNT(*) FROM outcomes"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " GROUP BY from_level, result"
+        stats = {}
+        with self._open() as db:
+            for level, result, count in db.execute(sql, args):
+                stats.setdefault(level, {})[result] = count
+        return stats
+
+    def prune(self, before: float) -> int:
+        """before 이전 기록 삭제, 삭제 개수 반환"""
+        with self._open() as db:
+            return db.execute("DELETE FROM outcomes WHERE ts < ?",
+                              (before,)).rowcount
@@ -1,14 +1,16 @@
 """채팅 파싱 서비스"""
 import re
 from domain.state import GameState, Weapon, ChatbotState
+from infrastructure.special_matcher import SpecialWeaponMatcher
 
 
 class ChatParser:
     # Regex patterns
     CHAT = re.compile(r'^\[.+?\] \[.+?\] ')
+    # CHAT과 같은 헤더 - match(text, pos)로 줄 중간 위치에서 확인할 때 사용
+    HEADER = re.compile(r'\[.+?\] \[.+?\] ')
     ENFORCE = re.compile(r'〖.*강화 (성공|파괴|유지).*〗')
     GOLD = re.compile(r'(?:남은|보유|현재 보유) 골드: ([0-9,]+)G')
-    SELL = re.compile(r'〖검 판매〗')
     LEVEL = re.compile(r'\+(\d+)\s*→\s*\+(\d+)')
     SWORD = re.compile(r'⚔️획득 검: \[\+\d+\] (.+)')
     SWORD_NEW = re.compile(r'⚔️새로운 검 획득: \[\+\d+\] (.+)')
@@ -16,23 +18,61 @@ class ChatParser:
     KEPT_WEAPON = re.compile(r'『\[\+(\d+)\] (.+?)』')
     # 파괴 후 지급 패턴: 『[+6] 영혼 감응의 검』 산산조각 나서, 『[+0] 낡은 검』 지급되었습니다
     DESTROY_GIVEN = re.compile(r'산산조각 나서, 『\[\+(\d+)\] (.+?)』 지급되었습니다')
+    # 강화 결과 → 챗봇 상태
+    RESULTS = {
+        '성공': ChatbotState.SUCCESS,
+        '파괴': ChatbotState.FAILED,
+        '유지': ChatbotState.REMAINED,
+    }
 
-    def __init__(self, special_weapons: set):
+    # parse가 참조하는 최근 채팅 수
+    RECENT_CHATS = 3
+
+    def __init__(self, special_weapons: set, tail: bool = False):
         self.special_weapons = special_weapons
+        self._special_matcher = SpecialWeaponMatcher(special_weapons)
+        # 끝에서부터 마지막 채팅만 분리 (앞쪽 기록 길이와 무관)
+        self.tail = tail
 
     def parse(self, text: str) -> GameState:
         """텍스트 → GameState"""
-        chats = self._split_chats(text)
+        if self.tail:
+            chats = self._tail_chats(text)
+        else:
+            chats = self._split_chats(text)
         last_chat = chats[-1]
         bot_chats = [c for c in chats[-3:] if '[플레이봇]' in c]
-        combined = '\n'.join(bot_chats)
+        gold, level, name, sell, enforce = self._scan('\n'.join(bot_chats))
 
         return GameState(
-            gold=self._extract_gold(combined),
-            weapon=self._extract_weapon(combined),
-            bot_state=self._extract_state(last_chat, combined)
+            gold=gold,
+            weapon=Weapon(
+                name=name,
+                level=level,
+                is_special=self._check_special(name)
+            ),
+            bot_state=self._scan_state(last_chat, sell, enforce)
         )
 
+    def _tail_chats(self, text: str, count: int = RECENT_CHATS) -> list:
+        """끝에서부터 채팅 헤더를 찾아 마지막 count개 채팅만 분리
+
+        _split_chats(text)[-count:]와 결과가 같지만, 비용은 이전 상태 없이도
+        앞쪽 기록 길이와 상관없이 마지막 채팅들의 길이에만 비례한다.
+        """
+        chats, end, pos = [], len(text), len(text)
+        while len(chats) < count:
+            newline = text.rfind('\n[', 0, pos)
+            start = newline + 1
+            if self.HEADER.match(text, start):
+                chats.append(text[start:end].strip())
+                end = max(start - 1, 0)
+            if newline < 0:
+                break
+            pos = newline
+        chats.reverse()
+        return chats
+
     def _split_chats(self, text: str) -> list:
         """채팅 메시지 분리"""
         if not text:
@@ -50,71 +90,55 @@ class ChatParser:
             chats.append(current.strip())
         return chats
 
-    def _extract_gold(self, text: str) -> int:
-        """골드 추출"""
+    def _scan(self, text: str) -> tuple:
+        """봇 채팅 → (골드, 레벨, 무기 이름, 판매 여부, 강화 결과)
+
+        항목마다 패턴을 따로 검색하고, 우선순위상 쓰이지 않을 검색은 건너뛴다
+        (판매면 강화 결과, 강화 성공이면 파괴/유지 무기 검색 생략). 패턴마다
+        고정 표식(〖, 골드:, ⚔️, 『)이 있어 re의 리터럴 검색을 쓰므로, 표식을
+        한 번 훑으며 파이썬에서 분기하는 단일 패스보다 빠르다
+        (benchmarks/bench_parser.py의 결과별 _scan 항목).
+        """
         m = self.GOLD.search(text)
-        return int(m.group(1).replace(',', '')) if m else 0
+        gold = int(m.group(1).replace(',', '')) if m else 0
 
-    def _extract_weapon(self, text: str) -> Weapon:
-        """무기 정보 추출"""
-        name = "낡은 검"
-        level = 0
+        # 챗봇 상태: 판매 > 강화 결과
+        sell = '〖검 판매〗' in text
+        enforce = None
+        if not sell:
+            if m := self.ENFORCE.search(text):
+                enforce = m.group(1)
 
-        # 1순위: 강화 성공 - "+0 → +1" 패턴 (가장 명확)
+        # 무기: 강화 성공(→) > 파괴 후 지급 > 레벨 유지 > 새로운 검 획득
+        name, level = "낡은 검", 0
         if m := self.LEVEL.search(text):
             level = int(m.group(2))
-            # 획득 검 이름 찾기
-            if sword_m := self.SWORD.search(text):
-                name = sword_m.group(1)
-            elif sword_new_m := self.SWORD_NEW.search(text):
-                name = sword_new_m.group(1)
-
-        # 2순위: 강화 파괴 - 지급된 무기 ("산산조각" 키워드 확인)
-        elif '산산조각' in text:
-            if destroy_m := self.DESTROY_GIVEN.search(text):
-                level = int(destroy_m.group(1))
-                name = destroy_m.group(2)
-
-        # 3순위: 강화 유지 - 『[+10] 무기』의 레벨이 유지
-        elif '레벨이 유지' in text:
-            if kept_m := self.KEPT_WEAPON.search(text):
-                level = int(kept_m.group(1))
-                name = kept_m.group(2)
-
-        # 4순위: 판매 - 새로운 검 획득
-        elif sword_new_m := self.SWORD_NEW.search(text):
-            name = sword_new_m.group(1)
-            level = 0
-
-        return Weapon(
-            name=name,
-            level=level,
-            is_special=self._check_special(name)
-        )
+            if m := self.SWORD.search(text) or self.SWORD_NEW.search(text):
+                name = m.group(1)
+            return gold, level, name, sell, enforce
 
-    def _check_special(self, weapon_name: str) -> bool:
-        """특수 무기 여부 확인 (부분 매칭)"""
-        # 콜론(:) 앞부분만 추출
-        base_name = weapon_name.split(':')[0].strip()
-
-        # 특수 무기 목록과 비교
-        for special in self.special_weapons:
-            if special in base_name or base_name in special:
-                return True
-        return False
-
-    def _extract_state(self, last_chat: str,  text: str) -> ChatbotState:
+        if '산산조각' in text:
+            pattern = self.DESTROY_GIVEN
+        elif '레벨이 유지' in text:
+            pattern = self.KEPT_WEAPON
+        else:
+            if m := self.SWORD_NEW.search(text):
+                name = m.group(1)
+            return gold, level, name, sell, enforce
+
+        if m := pattern.search(text):
+            level, name = int(m.group(1)), m.group(2)
+        return gold, level, name, sell, enforce
+
+    def _scan_state(self, last_chat: str, sell: bool,
+                    enforce: str) -> ChatbotState:
+        """스캔 결과 → 챗봇 상태"""
         if not last_chat.startswith('[플레이봇]'):
             return ChatbotState.PROCESSING
-        """챗봇 상태 추출"""
-        if self.SELL.search(text):
+        if sell:
             return ChatbotState.SELL
-        if m := self.ENFORCE.search(text):
-            result = m.group(1)
-            if result == '성공':
-                return ChatbotState.SUCCESS
-            elif result == '파괴':
-                return ChatbotState.FAILED
-            elif result == '유지':
-                return ChatbotState.REMAINED
-        return ChatbotState.IDLE
+        return self.RESULTS.get(enforce, ChatbotState.IDLE)
+
+    def _check_special(self, weapon_name: str) -> bool:
+        """특수 무기 여부 확인 (콜론 앞부분 기준 양방향 부분 매칭)"""
+        return self._special_matcher.match(weapon_name)
@@ -0,0 +1,264 @@
+"""채팅 스냅샷 녹화 (재현/회귀 확인용)
+
+스냅샷은 JSON 한 줄씩 저장한다 (.gz면 압축).
+- 키프레임: {"t", "chat", "action"} - 채팅 전체
+- 델타:     {"t", "s", "e", "a", "action"} - 채팅 = 이전[s:e] + a
+연속된 get_chat() 텍스트는 대부분 같으므로(끝에 몇 줄 추가, 창이 넘치면
+앞부분 삭제) 델타는 추가된 부분만 담는다. keyframe_interval개마다, 또는
+델타로 줄어드는 양이 적으면 키프레임을 쓴다. 키프레임 위치(스냅샷 번호,
+파일 오프셋)는 '<path>.idx'에 따로 기록해 N번째 스냅샷을 가까운
+키프레임부터 읽는다.
+데이터는 flush_every개 또는 flush_interval초마다 디스크로 내보내므로 강제
+종료돼도 그 이전 스냅샷은 남는다. 끝이 잘린 녹화(마지막 줄이 덜 쓰였거나
+.gz 스트림이 닫히지 않음)는 온전한 줄까지만 읽는다.
+"""
+import json
+import os
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+
+# 이전 채팅에서 새 채팅의 시작 위치를 찾을 때 쓰는 앞부분 길이
+ANCHOR = 64
+
+
+@dataclass
+class Snapshot:
+    """틱 하나 - 읽은 채팅과 그때 전략이 고른 행동
+
+    action: 보낸 명령('강화', '판매'), 'pause', 'stop' 또는 None
+    """
+    t: float
+    chat: str
+    action: str = None
+
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _lines(f):
+    """온전한 줄만 - 덜 쓰인 마지막 줄과 닫히지 않은 .gz 끝은 무시"""
+    try:
+        for line in f:
+            if not line.endswith(b'\n'):
+                return
+            yield line
+    except EOFError:
+        return
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """a와 b의 공통 앞부분 길이"""
+    if b.startswith(a):
+        return len(a)
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if b.startswith(a[:mid]):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def delta(prev: str, chat: str) -> tuple:
+    """chat == prev[s:e] + added 인 (s, e, added) - e - s가 최대가 되도록"""
+    start = prev.find(chat[:ANCHOR]) if chat else -1
+    if start < 0:
+        start = 0
+    end = start + _common_prefix(prev[start:] if start else prev, chat)
+    return start, end, chat[end - start:]
+
+
+def _read_index(path: str) -> list:
+    """[(스냅샷 번호, 오프셋)] - 인덱스 파일이 없으면 녹화 파일을 훑어 생성"""
+    index = []
+    if os.path.exists(path + '.idx'):
+        with open(path + '.idx', 'r', encoding='utf-8') as f:
+            for line in f:
+                number, offset = line.split()
+                index.append((int(number), int(offset)))
+        return index
+
+    with _open(path, 'rb') as f:
+        number, offset = 0, 0
+        for line in _lines(f):
+            if line.strip():
+                if b'"chat"' in line and 'chat' in json.loads(line):
+                    index.append((number, offset))
+                number += 1
+            offset += len(line)
+    return index
+
+
+def _repair(path: str):
+    """끝이 잘린 녹화를 온전한 줄까지로 다시 쓰고 인덱스는 새로 생성"""
+    root, ext = os.path.splitext(path)
+    tmp = f"{root}.tmp{ext}"  # .gz는 압축 유지
+    with _open(path, 'rb') as src, _open(tmp, 'wb') as dst:
+        dst.writelines(_lines(src))
+    os.replace(tmp, path)
+    if os.path.exists(path + '.idx'):
+        os.remove(path + '.idx')
+
+
+def _is_torn(path: str) -> bool:
+    """마지막 줄이 덜 쓰였거나 .gz 스트림이 닫히지 않았는지"""
+    try:
+        with _open(path, 'rb') as f:
+            last = b'\n'
+            for last in f:
+                pass
+    except EOFError:
+        return True
+    return not last.endswith(b'\n')
+
+
+class Recorder:
+    """처리한 틱마다 스냅샷 추가 - 이전 스냅샷 대비 델타로 저장
+
+    이미 있는 파일에는 이어서 쓴다 (첫 스냅샷은 키프레임). 강제 종료로 끝이
+    잘린 파일이면 온전한 줄까지로 정리한 뒤 이어 쓴다.
+    flush_every개 또는 flush_interval초마다 flush. 키프레임 인덱스 줄은
+    데이터를 flush한 뒤에 쓰므로 인덱스가 데이터 끝을 넘어가지 않는다.
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = 500,
+                 flush_every: int = 50, flush_interval: float = 5.0,
+                 clock=time.monotonic):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self.count = 0
+        self.chars_total = 0   # 스냅샷 채팅 길이 합
+        self.chars_stored = 0  # 그중 저장한 길이 (키프레임 전체 + 델타 추가분)
+
+        self._offset = 0  # 압축 전 기준 파일 오프셋
+        if os.path.exists(path):
+            if _is_torn(path):
+                _repair(path)
+            if not os.path.exists(path + '.idx'):
+                # 인덱스 없는 녹화 (키프레임만 있는 이전 형식) - 인덱스부터 생성
+                index = _read_index(path)
+                with open(path + '.idx', 'w', encoding='utf-8') as f:
+                    for number, offset in index:
+                        f.write(f"{number} {offset}\n")
+            with _open(path, 'rb') as f:
+                for line in _lines(f):
+                    self._offset += len(line)
+                    if line.strip():
+                        self.count += 1
+        self._file = _open(path, 'ab')
+        self._index = open(path + '.idx', 'a', encoding='utf-8')
+        self._prev = None
+        self._since_keyframe = 0
+        self._unflushed = 0
+        self._flushed_at = clock()
+
+    def record(self, chat: str, action: str = None, t: float = None):
+        data = {'t': time.time() if t is None else t}
+        keyframe = (self._prev is None
+                    or self._since_keyframe >= self.keyframe_interval)
+        if not keyframe:
+            start, end, added = delta(self._prev, chat)
+            # 재사용하는 부분이 절반도 안 되면 키프레임이 낫다
+            keyframe = end - start < len(chat) // 2
+        if keyframe:
+            data['chat'] = chat
+            self.chars_stored += len(chat)
+            self._since_keyframe = 0
+        else:
+            data.update(s=start, e=end, a=added)
+            self.chars_stored += len(added)
+            self._since_keyframe += 1
+        data['action'] = action
+
+        line = (json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8')
+        self._file.write(line)
+        if keyframe:
+            # 데이터를 먼저 내보내야 인덱스가 없는 위치를 가리키지 않음
+            self.flush()
+            self._index.write(f"{self.count} {self._offset}\n")
+            self._index.flush()
+        self._offset += len(line)
+        self._prev = chat
+        self.count += 1
+        self.chars_total += len(chat)
+
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every or \
+                self.clock() - self._flushed_at >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        self._index.flush()
+        self._unflushed = 0
+        self._flushed_at = self.clock()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            self._index.close()
+
+
+class RecordingReader:
+    """녹화 파일 읽기 - 순서대로 읽기(메모리 일정) / N번째 스냅샷"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._index = None
+
+    @property
+    def index(self) -> list:
+        if self._index is None:
+            self._index = _read_index(self.path)
+        return self._index
+
+    def __iter__(self):
+        with _open(self.path, 'rb') as f:
+            yield from self._decode(_lines(f))
+
+    @staticmethod
+    def _decode(lines):
+        chat = None
+        for line in lines:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if 'chat' in data:
+                chat = data['chat']
+            else:
+                chat = chat[data['s']:data['e']] + data['a']
+            yield Snapshot(data['t'], chat, data.get('action'))
+
+    def __len__(self) -> int:
+        with _open(self.path, 'rb') as f:
+            return sum(1 for line in _lines(f) if line.strip())
+
+    def __getitem__(self, number: int) -> Snapshot:
+        """가장 가까운 앞 키프레임으로 이동해 델타를 적용"""
+        if number < 0:
+            raise IndexError("음수 번호는 지원하지 않음")
+        position = bisect_right(self.index, (number, float('inf')))
+        if not position:
+            raise IndexError(number)
+
+        first, offset = self.index[position - 1]
+        with _open(self.path, 'rb') as f:
+            f.seek(offset)
+            for i, snapshot in enumerate(self._decode(_lines(f)), first):
+                if i == number:
+                    return snapshot
+        raise IndexError(number)
+
+
+def read_recording(path: str):
+    """녹화 파일 → Snapshot (순서대로, 메모리 일정)"""
+    return iter(RecordingReader(path))
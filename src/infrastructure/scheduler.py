@@ -0,0 +1,43 @@
+"""적응형 폴링 스케줄러"""
+import threading
+
+
+class PollScheduler:
+    """채팅 폴링 간격 조절
+
+    명령 전송 직후나 채팅이 바뀐 직후에는 min_interval로 자주 확인하고,
+    변화가 없으면 backoff 배씩 늘려 max_interval까지 줄인다.
+    wake()를 호출하면 (Slack 명령 등) 대기 중이던 루프가 즉시 깨어난다.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float,
+                 backoff: float = 2.0):
+        if min_interval > max_interval:
+            raise ValueError("min_interval must be <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self._wake = threading.Event()
+
+    def command_sent(self):
+        """명령 전송 - 응답을 빨리 확인하도록 최소 간격으로"""
+        self.interval = self.min_interval
+
+    def changed(self):
+        """채팅 변화 감지 - 이어지는 봇 채팅을 위해 최소 간격 유지"""
+        self.interval = self.min_interval
+
+    def quiet(self):
+        """변화 없음 - 간격을 점점 늘림"""
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    def wake(self):
+        """대기 중인 wait()를 즉시 깨움"""
+        self._wake.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """다음 폴링까지 대기 (wake()로 깨어나면 True)"""
+        woken = self._wake.wait(self.interval if timeout is None else timeout)
+        self._wake.clear()
+        return woken
@@ -5,19 +5,48 @@ from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 
+from infrastructure.commands import RecentIds
+from infrastructure.metrics import Metrics
+from infrastructure.notifier import Notifier
+from infrastructure.slack_dashboard import Dashboard
+from infrastructure.slack_outbox import SlackOutbox, PRIORITY_NORMAL
 
-class SlackBot:
-    """Slack Bot - 명령 수신 + 알림 전송"""
 
-    def __init__(self, bot_token: str, app_token: str, channel: str):
-        self.client = WebClient(token=bot_token)
+class SlackBot(Notifier):
+    """Slack Bot - 명령 수신 + 알림 전송
+
+    dashboard_interval(초)을 주면 대시보드 모드 - 상태는 고정 메시지 하나를
+    그 간격으로 수정하고, 목표 달성/오류 같은 알림만 새 메시지로 보낸다.
+    """
+
+    def __init__(self, bot_token: str, app_token: str, channel: str,
+                 base_url: str = WebClient.BASE_URL,
+                 metrics: Metrics = None, dashboard_interval: float = None):
+        self.client = WebClient(token=bot_token, base_url=base_url)
         self.socket_client = SocketModeClient(
             app_token=app_token,
             web_client=self.client
         )
         self.channel = channel
+        self.metrics = metrics or Metrics()
         self.command_handler = None
         self._running = False
+        # 재전송된 envelope/event 중복 실행 방지
+        self._recent_ids = RecentIds()
+
+        # 메시지는 백그라운드 큐로 전송 - 메인 루프는 네트워크를 기다리지 않음
+        self.outbox = SlackOutbox(self._post_message)
+        self.outbox.start()
+
+        # 대시보드 모드 - 인스턴스마다 board.panel(이름)
+        self.board = None
+        if dashboard_interval:
+            self.board = Dashboard(
+                self._post_dashboard, self._update_dashboard,
+                pin=self._pin, unpin=self._unpin,
+                interval=dashboard_interval
+            )
+            self.dashboard = self.board.panel()
 
     def set_command_handler(self, handler):
         """명령 핸들러 등록"""
@@ -29,6 +58,8 @@ class SlackBot:
             self._handle_message
         )
         self._running = True
+        if self.board:
+            self.board.start()
         threading.Thread(
             target=self.socket_client.connect,
             daemon=True
@@ -36,8 +67,11 @@ class SlackBot:
         print("Slack bot connected.")
 
     def stop(self):
-        """Slack 연결 종료"""
+        """Slack 연결 종료 (대기 중인 메시지 전송 후)"""
         self._running = False
+        if self.board:
+            self.board.stop()
+        self.outbox.stop()
         self.socket_client.close()
 
     def _handle_message(self, client: SocketModeClient,
@@ -47,6 +81,10 @@ class SlackBot:
             response = SocketModeResponse(envelope_id=req.envelope_id)
             client.send_socket_mode_response(response)
 
+            if self._recent_ids.seen(req.envelope_id,
+                                     req.payload.get("event_id")):
+                return
+
             event = req.payload.get("event", {})
 
             # 봇 자신의 메시지 무시 (bot_id 또는 bot_profile 확인)
@@ -71,52 +109,43 @@ class SlackBot:
 
             text = event.get("text", "").strip()
 
+            # 핸들러는 명령을 대기열에 넣기만 하고 바로 반환해야 한다
             if text.startswith("!"):
                 if self.command_handler:
-                    threading.Thread(
-                        target=self.command_handler,
-                        args=(text,),
-                        daemon=True
-                    ).start()
-
-    def send_message(self, text: str):
-        """Slack 메시지 전송"""
-        try:
+                    self.command_handler(text)
+
+    def send_message(self, text: str, priority: int = PRIORITY_NORMAL):
+        """Slack 메시지 전송 (큐에 넣고 즉시 반환)"""
+        self.outbox.put(text, priority)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """대기 중인 메시지를 모두 전송"""
+        return self.outbox.flush(timeout)
+
+    def _post_message(self, text: str):
+        with self.metrics.span('slack_post'):
             self.client.chat_postMessage(
                 channel=self.channel,
                 text=text
             )
-        except Exception as e:
-            print(f"Slack 전송 실패: {e}")
-
-    def notify_success(self, from_level: int, to_level: int,
-                      gold: int):
-        """강화 성공 알림"""
-        self.send_message(
-            f"✅ *강화 성공* [+{from_level}] → [+{to_level}]\n"
-            f"💰 골드: {gold:,}G"
-        )
+        self.metrics.inc('slack_messages_sent')
 
-    def notify_failure(self, from_level: int, new_weapon: str):
-        """강화 파괴 알림"""
-        self.send_message(
-            f"❌ *강화 파괴* [+{from_level}] → [+0]\n"
-            f"⚔️ 새 무기: {new_weapon}"
-        )
+    def _post_dashboard(self, text: str) -> str:
+        with self.metrics.span('slack_post'):
+            response = self.client.chat_postMessage(
+                channel=self.channel,
+                text=text
+            )
+        self.metrics.inc('slack_messages_sent')
+        return response['ts']
 
-    def notify_sell(self, gold_gained: int, total_gold: int):
-        """판매 알림"""
-        self.send_message(
-            f"💰 *판매 완료* +{gold_gained:,}G\n"
-            f"💵 총 골드: {total_gold:,}G"
-        )
+    def _update_dashboard(self, ts: str, text: str):
+        with self.metrics.span('slack_post'):
+            self.client.chat_update(channel=self.channel, ts=ts, text=text)
+        self.metrics.inc('slack_dashboard_updates')
 
-    def notify_status(self, state):
-        """상태 조회 응답"""
-        self.send_message(
-            f"📊 *현재 상태*\n"
-            f"⚔️ 무기: [+{state.weapon.level}] {state.weapon.name}\n"
-            f"💰 골드: {state.gold:,}G\n"
-            f"🔸 특수: {'예' if state.weapon.is_special else '아니오'}\n"
-            f"🤖 상태: {state.bot_state.value}"
-        )
+    def _pin(self, ts: str):
+        self.client.pins_add(channel=self.channel, timestamp=ts)
+
+    def _unpin(self, ts: str):
+        self.client.pins_remove(channel=self.channel, timestamp=ts)
@@ -0,0 +1,250 @@
+"""Slack 대시보드 - 세션마다 고정 메시지 하나를 제자리에서 갱신
+
+상태가 바뀔 때마다 새 메시지를 보내는 대신, 처음 한 번 메시지를 보내고
+고정(pin)한 뒤 interval초마다 바뀐 내용이 있을 때만 chat.update로 고친다.
+파밍 속도와 관계없이 API 호출은 시간당 3600 / interval회 이하로 일정하다.
+"""
+import threading
+import time
+from collections import Counter, deque
+
+from domain.state import ChatbotState, GameState
+from infrastructure.command_tracker import Reply
+from infrastructure.slack_outbox import retry_after
+
+# 강화 시도로 치는 결과
+ATTEMPT_STATES = (ChatbotState.SUCCESS, ChatbotState.REMAINED,
+                  ChatbotState.FAILED)
+HISTOGRAM_WIDTH = 20
+
+
+class DashboardPanel:
+    """인스턴스 하나의 상태 - 무기/골드, 도달 레벨 분포, 시도/분, 골드/시간
+
+    속도는 최근 window초 기준. observe는 봇 스레드, render는 대시보드
+    스레드에서 부르므로 둘 다 board.lock 안에서 실행한다.
+    """
+
+    def __init__(self, board: 'Dashboard', name: str, window: float):
+        self.board = board
+        self.name = name
+        self.window = window
+        self.state: GameState = None
+        self.extra = []
+        self.levels = Counter()  # 강화 성공으로 도달한 레벨 → 횟수
+        self.attempts = 0
+        self._attempt_times = deque()
+        self._gold = deque()     # (시각, 골드)
+
+    def observe(self, state: GameState, reply: Reply = None):
+        """파싱한 상태 반영 (다음 갱신 때 표시)
+
+        강화 시도는 CommandTracker가 짝지은 /강화 응답(reply)만 센다.
+        """
+        with self.board.lock:
+            now = self.board.clock()
+            if reply is not None and reply.cmd == "강화" and \
+                    state.bot_state in ATTEMPT_STATES:
+                self.attempts += 1
+                self._attempt_times.append(now)
+                if state.bot_state == ChatbotState.SUCCESS:
+                    self.levels[state.weapon.level] += 1
+            if not self._gold or self._gold[-1][1] != state.gold:
+                self._gold.append((now, state.gold))
+            self._expire(now)
+            self.state = state
+            self.board.changed()
+
+    def show(self, state: GameState, extra: list = None):
+        """!상태 - 덧붙일 줄을 바꾸고 바로 갱신"""
+        with self.board.lock:
+            self.extra = list(extra or [])
+            self.observe(state)
+            self.board.refresh()
+
+    def _expire(self, now: float):
+        start = now - self.window
+        while self._attempt_times and self._attempt_times[0] < start:
+            self._attempt_times.popleft()
+        # 구간 시작 골드를 알 수 있도록 구간 밖 표본 하나는 남김
+        while len(self._gold) > 1 and self._gold[1][0] <= start:
+            self._gold.popleft()
+
+    def rates(self) -> tuple:
+        """(시도/분, 골드/시간) - 관측 시간이 window보다 짧으면 그 시간 기준"""
+        with self.board.lock:
+            now = self.board.clock()
+            self._expire(now)
+            if not self._gold:
+                return 0.0, 0.0
+            elapsed = min(now - self._gold[0][0], self.window)
+            if elapsed <= 0:
+                return 0.0, 0.0
+            per_min = len(self._attempt_times) / elapsed * 60
+            per_hour = (self._gold[-1][1] - self._gold[0][1]) / elapsed * 3600
+            return per_min, per_hour
+
+    def render(self) -> str:
+        state = self.state
+        per_min, per_hour = self.rates()
+        title = f"*[{self.name}]*" if self.name else "📊 *현재 상태*"
+        lines = [
+            title,
+            f"⚔️ [+{state.weapon.level}] {state.weapon.name}"
+            f"{' 🔸' if state.weapon.is_special else ''} · "
+            f"🤖 {state.bot_state.label}",
+            f"💰 {state.gold:,}G · {per_hour:+,.0f}G/시간",
+            f"🔨 {per_min:,.1f}회/분 (누적 {self.attempts:,})",
+        ]
+        if self.levels:
+            top = max(self.levels.values())
+            bars = [
+                f"+{level:<2} {'█' * max(1, count * HISTOGRAM_WIDTH // top)}"
+                f" {count:,}"
+                for level, count in sorted(self.levels.items())
+            ]
+            lines.append("```" + '\n'.join(bars) + "```")
+        return '\n'.join(lines + self.extra)
+
+
+class Dashboard:
+    """고정 메시지 하나로 모든 패널 표시
+
+    post(text) → ts, update(ts, text), pin(ts), unpin(ts) 는 Slack API 호출.
+    start() 하면 백그라운드 스레드가 interval초마다 바뀐 내용을 반영한다.
+    스레드 없이 쓸 때는 pump()를 직접 호출.
+    """
+
+    def __init__(self, post, update, pin=None, unpin=None,
+                 interval: float = 15.0, window: float = 600.0,
+                 min_refresh: float = 1.0, clock=time.monotonic):
+        self._post = post
+        self._update = update
+        self._pin = pin
+        self._unpin = unpin
+        self.interval = interval
+        self.window = window
+        self.min_refresh = min_refresh  # !상태 갱신도 이 간격보다 자주는 안 함
+        self.clock = clock
+
+        self.panels = {}  # 이름 → DashboardPanel (추가 순서대로 표시)
+        self.ts = None
+        self.calls = 0
+        self._dirty = False
+        self._urgent = False
+        self._sent_at = None
+        self._hold_until = 0.0  # 429 - Retry-After 동안 보내지 않음
+        # 패널 갱신(봇 스레드)과 render(대시보드 스레드)가 함께 쓰는 잠금
+        self.lock = threading.RLock()
+        self._cond = threading.Condition(self.lock)
+        self._running = False
+        self._thread = None
+
+    def panel(self, name: str = '') -> DashboardPanel:
+        with self.lock:
+            if name not in self.panels:
+                self.panels[name] = DashboardPanel(self, name, self.window)
+            return self.panels[name]
+
+    def changed(self):
+        with self._cond:
+            self._dirty = True
+
+    def refresh(self):
+        """가능한 빨리 갱신 (min_refresh 간격은 지킴)"""
+        with self._cond:
+            self._dirty = self._urgent = True
+            self._cond.notify_all()
+
+    def render(self) -> str:
+        with self.lock:
+            return '\n\n'.join(panel.render()
+                               for panel in self.panels.values()
+                               if panel.state)
+
+    def due(self) -> float:
+        """다음 갱신까지 남은 시간 (0이면 지금, None이면 바뀐 내용 없음)"""
+        if not self._dirty:
+            return None
+        now = self.clock()
+        if self._sent_at is None:
+            wait = 0.0
+        else:
+            gap = self.min_refresh if self._urgent else self.interval
+            wait = self._sent_at + gap - now
+        return max(wait, self._hold_until - now, 0.0)
+
+    def pump(self) -> bool:
+        """갱신할 때가 됐으면 메시지 전송/수정 (보냈으면 True)"""
+        with self._cond:
+            if self.due() != 0.0:
+                return False
+            text = self.render()
+            self._dirty = self._urgent = False
+            self._sent_at = self.clock()
+        if not text:
+            return False
+        try:
+            self._send(text)
+            return True
+        except Exception as e:
+            with self._cond:
+                self._dirty = True
+                wait = retry_after(e)
+                if wait is not None:
+                    self._hold_until = self.clock() + wait
+                else:
+                    print(f"Slack 대시보드 갱신 실패: {e}")
+            return False
+
+    def _send(self, text: str):
+        self.calls += 1
+        if self.ts is None:
+            self.ts = self._post(text)
+            if self._pin:
+                try:
+                    self.calls += 1
+                    self._pin(self.ts)
+                except Exception as e:
+                    # 고정 권한(pins:write)이 없어도 갱신은 계속
+                    print(f"Slack 대시보드 고정 실패: {e}")
+        else:
+            self._update(self.ts, text)
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """마지막 상태를 반영하고 고정 해제"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+        with self._cond:
+            if self._dirty:
+                self._sent_at = None
+                self._hold_until = 0.0
+        self.pump()
+        if self.ts and self._unpin:
+            try:
+                self._unpin(self.ts)
+            except Exception as e:
+                print(f"Slack 대시보드 고정 해제 실패: {e}")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                wait = self.due()
+                if wait != 0.0:
+                    # 바뀐 내용이 없어도 interval마다 확인 (observe는 깨우지 않음)
+                    self._cond.wait(self.interval if wait is None else wait)
+                    continue
+            self.pump()
@@ -0,0 +1,146 @@
+"""Slack 비동기 전송 큐"""
+import threading
+import time
+from collections import deque
+
+PRIORITY_LOW = 0     # 알림 - 밀리면 생략 가능
+PRIORITY_NORMAL = 1  # 명령 응답, 상태, 오류
+
+
+def retry_after(error: Exception) -> float:
+    """429 응답이면 Retry-After(초), 아니면 None"""
+    response = getattr(error, 'response', None)
+    if response is None or getattr(response, 'status_code', None) != 429:
+        return None
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+class SlackOutbox:
+    """백그라운드 스레드에서 메시지를 모아 전송
+
+    - 짧은 시간(coalesce) 안에 쌓인 메시지는 한 메시지로 합쳐 보낸다.
+    - 429 응답은 Retry-After만큼 기다렸다가 다시 보낸다.
+    - 큐가 max_size를 넘으면 낮은 우선순위 메시지부터 버리고,
+      버린 개수를 다음 메시지에 요약해 붙인다.
+    """
+
+    def __init__(self, post, max_size: int = 100, coalesce: float = 0.5,
+                 max_chars: int = 3000, max_retries: int = 5):
+        self._post = post
+        self.max_size = max_size
+        self.coalesce = coalesce
+        self.max_chars = max_chars
+        self.max_retries = max_retries
+
+        self._queue = deque()  # (우선순위, 텍스트)
+        self._cond = threading.Condition()
+        self._dropped = 0
+        self._sending = False
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, text: str, priority: int = PRIORITY_NORMAL):
+        """메시지 추가 (즉시 반환)"""
+        with self._cond:
+            if len(self._queue) >= self.max_size:
+                if not self._drop_low_priority():
+                    if priority == PRIORITY_LOW:
+                        self._dropped += 1
+                        return
+                    self._queue.popleft()
+                    self._dropped += 1
+            self._queue.append((priority, text))
+            self._cond.notify_all()
+
+    def _drop_low_priority(self) -> bool:
+        for item in self._queue:
+            if item[0] == PRIORITY_LOW:
+                self._queue.remove(item)
+                self._dropped += 1
+                return True
+        return False
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """대기 중인 메시지를 모두 보낼 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._queue or self._sending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 10.0):
+        """남은 메시지를 보내고 종료"""
+        self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+            # 이어지는 메시지를 조금 기다렸다가 함께 보냄
+            time.sleep(self.coalesce)
+            with self._cond:
+                text = self._take_batch()
+                self._sending = True
+            try:
+                self._deliver(text)
+            finally:
+                with self._cond:
+                    self._sending = False
+                    self._cond.notify_all()
+
+    def _take_batch(self) -> str:
+        parts, size = [], 0
+        while self._queue:
+            text = self._queue[0][1]
+            if parts and size + len(text) > self.max_chars:
+                break
+            self._queue.popleft()
+            parts.append(text)
+            size += len(text) + 2
+        if self._dropped:
+            parts.append(f"… 알림 {self._dropped:,}개 생략")
+            self._dropped = 0
+        return '\n\n'.join(parts)
+
+    def _deliver(self, text: str):
+        for _ in range(self.max_retries):
+            try:
+                self._post(text)
+                return
+            except Exception as e:
+                wait = retry_after(e)
+                if wait is None:
+                    print(f"Slack 전송 실패: {e}")
+                    return
+                time.sleep(wait)
+        print("Slack 전송 실패: 재시도 횟수 초과")
@@ -0,0 +1,73 @@
+"""특수 무기 이름 매칭"""
+from collections import deque
+from functools import lru_cache
+
+
+class SpecialWeaponMatcher:
+    """특수 무기 부분 매칭 - 이름 길이에 비례하는 비용으로 판정
+
+    무기 이름의 콜론(:) 앞부분(base)과 특수 무기 목록을 양방향 부분 매칭한다.
+    - 특수 무기 이름 in base : Aho-Corasick 오토마톤으로 base를 한 번 훑는다
+    - base in 특수 무기 이름 : 특수 무기 이름의 모든 부분 문자열 집합 조회
+    같은 이름은 매 틱 반복되므로 결과를 LRU 캐시에 둔다.
+    """
+
+    def __init__(self, special_weapons, cache_size: int = 1024):
+        self.special_weapons = frozenset(special_weapons)
+        self._build_automaton(self.special_weapons)
+        self._substrings = {
+            name[i:j]
+            for name in self.special_weapons
+            for i in range(len(name) + 1)
+            for j in range(i, len(name) + 1)
+        }
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _build_automaton(self, patterns):
+        """Aho-Corasick 오토마톤 (goto / fail / 출력 여부)"""
+        self._goto = [{}]
+        self._output = [False]
+        for pattern in patterns:
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._output.append(False)
+                state = nxt
+            self._output[state] = True
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                if self._output[self._fail[nxt]]:
+                    self._output[nxt] = True
+
+    def _contains_special(self, text: str) -> bool:
+        """특수 무기 이름 중 하나라도 text에 포함되면 True"""
+        goto, fail, output = self._goto, self._fail, self._output
+        if output[0]:  # 빈 문자열이 목록에 있는 경우
+            return True
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                return True
+        return False
+
+    def _match(self, weapon_name: str) -> bool:
+        # 콜론(:) 앞부분만 추출
+        base_name = weapon_name.split(':')[0].strip()
+        return (base_name in self._substrings
+                or self._contains_special(base_name))
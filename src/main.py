@@ -1,44 +1,120 @@
-"""GameBot with Slack Integration"""
+"""GameBot with Slack Integration
+
+pyautogui/win32clipboard(GameAutomation), slack_sdk(SlackBot),
+sqlite3(OutcomeLog)는 실제로 쓸 때만 로드한다 - 도메인/파서 코드와
+--dry-run은 이 패키지 없이 동작.
+"""
+import argparse
+import os
+import sys
 import time
+
+from domain.history import StateHistory
+from domain.rate_estimator import RateEstimator
+from domain.rates import GameRates
 from domain.state import GameState, ChatbotState
 from domain.strategy.base import MacroMode
+from domain.strategy.registry import StrategyRegistry
 from domain.strategy.strategies import (
-    SpecialWeaponFarming, TargetEnforcementStrategy,
+    PolicyTableStrategy, SpecialWeaponFarming, TargetEnforcementStrategy,
 )
 from infrastructure.parser import ChatParser
-from infrastructure.automation import GameAutomation
-from infrastructure.slack import SlackBot
+from infrastructure.calibration import DelayProfile
+from infrastructure.change_detector import ChangeDetector
+from infrastructure.command_tracker import CommandTracker, Reply
+from infrastructure.commands import CommandQueue
+from infrastructure.input_arbiter import InputArbiter
+from infrastructure.metrics import Metrics, MetricsExporter
+from infrastructure.notifier import Notifier
+from infrastructure.scheduler import PollScheduler
 from config import Config
 
 
 class GameBot:
     """GameBot with Slack"""
 
+    # 설정 파일 변경 확인 간격 (초)
+    CONFIG_CHECK_INTERVAL = 2.0
+
     def __init__(self, strategy: MacroMode, parser: ChatParser,
-                 automation: GameAutomation, slack: SlackBot,
-                 config: Config, interval: float):
+                 automation: 'GameAutomation', slack: Notifier,
+                 config: Config, interval: float,
+                 scheduler: PollScheduler = None, metrics: Metrics = None,
+                 outcome_log: 'OutcomeLog' = None,
+                 rate_estimator: RateEstimator = None,
+                 strategies: StrategyRegistry = None,
+                 recorder: 'Recorder' = None,
+                 tracker: CommandTracker = None,
+                 history: StateHistory = None):
         self.strategy = strategy
         self.parser = parser
         self.automation = automation
         self.slack = slack
         self.config = config
         self.interval = interval
+        # 기본값: 고정 간격 폴링
+        self.scheduler = scheduler or PollScheduler(interval, interval)
 
         self.state: GameState = None
         self.prev_state: GameState = None
+        self.chat = ""  # 마지막으로 파싱한 채팅 (보낸 명령 응답의 기준점)
+        # 최근 상태 기록 (전략/지표용, 크기 고정)
+        self.history = history if history is not None else StateHistory()
         self.running = False
         self.paused = True  # 시작 시 idle 모드
 
-        # Slack 명령 핸들러 등록
-        self.slack.set_command_handler(self._handle_slack_command)
+        # 채팅 변화 감지 - 변화 없는 틱은 파싱/전략 생략
+        self.change_detector = ChangeDetector()
+        # 단계별 지연 시간/카운터 (여러 인스턴스면 공용 - 합계)
+        self.metrics = metrics or Metrics()
+        # 이 인스턴스의 틱 수 (!상태)
+        self.ticks_processed = 0
+        self.ticks_skipped = 0
+        # 강화 결과 기록/확률 추정 (응답 짝짓기는 self.tracker)
+        self.outcome_log = outcome_log
+        self.rate_estimator = rate_estimator or RateEstimator()
+        # 보낸 명령의 응답 대기/재전송
+        self.tracker = tracker or CommandTracker()
+        # 녹화 - 처리한 틱마다 (채팅, 이번 틱에 고른 행동)
+        self.recorder = recorder
+        self.last_action = None
+        # 전략 이름 → 생성 함수 (규칙 파일은 !전략 때 변경 여부 확인)
+        self.strategies = strategies or self._default_strategies()
+        # 설정 다시 로드 - 적용한 설정 버전/내용 (여러 인스턴스가 Config 공유)
+        self._config_version = getattr(config, 'version', 0)
+        self._config_data = getattr(config, 'data', config)
+        self._config_checked = time.monotonic()
+
+        # Slack 명령은 대기열에 넣고 메인 루프에서 틱 사이에 실행
+        self.commands = CommandQueue()
+        self.slack.set_command_handler(self._enqueue_command)
 
     def enforce(self):
         """강화"""
-        self.automation.send_command("강화")
+        self._send_command("강화")
 
     def sell(self):
         """판매"""
-        self.automation.send_command("판매")
+        self._send_command("판매")
+
+    def _send_command(self, cmd: str):
+        with self.metrics.span('send_command'):
+            self.automation.send_command(cmd)
+        self.metrics.inc('commands_sent')
+        self.last_action = cmd
+        self.tracker.sent(cmd, self.state, self.chat)
+        self.scheduler.command_sent()
+
+    def _resend_if_stalled(self):
+        """응답도 에코도 없이 대기 시간이 지난 명령 재전송 (입력 유실)"""
+        cmd = self.tracker.overdue()
+        if not cmd:
+            return
+        print(f"[WARN] 응답 없음 - /{cmd} 재전송")
+        with self.metrics.span('send_command'):
+            self.automation.send_command(cmd)
+        self.metrics.inc('commands_resent')
+        self.scheduler.command_sent()
 
     def _show_help(self):
         """도움말 표시"""
@@ -54,13 +130,26 @@ class GameBot:
             "*전략 변경*\n"
             "• `!전략 [이름]` - 파밍 전략 변경\n"
             "  예: `!전략 special`\n"
-            "  사용 가능: special, safe, aggressive\n\n"
+            "  `!전략` - 사용 가능한 전략 (규칙 파일 포함)\n\n"
             "*상태 조회*\n"
             "• `!상태` - 현재 게임 상태 조회\n"
+            "• `!지표` - 단계별 지연 시간/카운터 조회\n"
+            "• `!확률` - 레벨별 강화 확률 추정치 조회\n"
+            "• `!설정 리로드` - config.yaml 다시 로드\n"
             "• `!도움` - 이 도움말 표시\n"
+            "\n*여러 인스턴스*\n"
+            "• 명령 끝에 이름 - 해당 인스턴스에만 적용 (예: `!시작 bot2`)\n"
+            "• `!목록` - 인스턴스 목록\n"
         )
         self.slack.send_message(help_text)
 
+    def _enqueue_command(self, command: str):
+        """Slack 명령 수신 (Slack 스레드) - 대기열에 넣고 루프를 깨움"""
+        if self.commands.put(command):
+            self.scheduler.wake()
+        else:
+            self.slack.send_message("⚠️ 명령 대기열이 가득 찼습니다")
+
     def _handle_slack_command(self, command: str):
         """Slack 명령 처리"""
         try:
@@ -88,20 +177,39 @@ class GameBot:
                 target = int(parts[1])
                 if hasattr(self.strategy, 'config'):
                     self.strategy.config['target_level'] = target
+                self.change_detector.reset()
                 self.slack.send_message(f"🎯 목표 레벨 +{target}로 설정")
                 if self.paused:
                     self.paused = False
                     self.slack.send_message("▶️ 강화 재개")
 
-            elif cmd == "전략" and len(parts) > 1:
-                self._change_strategy(parts[1])
+            elif cmd == "설정" and parts[1:] == ["리로드"]:
+                self.reload_config()
+
+            elif cmd == "전략":
+                self._change_strategy(parts[1] if len(parts) > 1 else None)
 
             elif cmd == "상태":
                 if self.state:
-                    self.slack.notify_status(self.state)
+                    self.slack.notify_status(self.state, [
+                        f"🔁 틱: 처리 {self.ticks_processed:,} / "
+                        f"생략 {self.ticks_skipped:,}",
+                        f"📨 명령: 대기 {self.commands.depth} / "
+                        f"평균 지연 {self.commands.avg_latency * 1000:.0f}ms",
+                        self.tracker.summary(),
+                        f"📈 최근 1시간: "
+                        f"{self.history.gold_rate(3600):+,.0f}G/시간 "
+                        f"(기록 {len(self.history):,}개)",
+                    ])
                 else:
                     self.slack.send_message("⚠️ 아직 상태 정보 없음")
 
+            elif cmd == "지표":
+                self.slack.send_message(self.metrics.summary())
+
+            elif cmd == "확률":
+                self._show_rates()
+
             elif cmd == "종료":
                 self.slack.send_message("👋 봇 종료 중...")
                 self.stop()
@@ -117,6 +225,9 @@ class GameBot:
 
     def pause(self):
         """일시 정지"""
+        self.last_action = 'pause'
+        # 멈춰 있는 동안의 응답 대기는 재개 후 재전송하지 않음
+        self.tracker.cancel()
         if not self.paused:
             self.paused = True
             print("[INFO] Bot paused")
@@ -127,35 +238,190 @@ class GameBot:
         """재개"""
         if self.paused:
             self.paused = False
+            self.change_detector.reset()
             print("[INFO] Bot resumed")
         else:
             print("[INFO] Bot is already running")
 
     def stop(self):
         """매크로 종료"""
+        self.last_action = 'stop'
         if self.running:
             self.running = False
+            self.scheduler.wake()
             print("[INFO] Stop requested - shutting down...")
         else:
             print("[INFO] Bot is not running")
 
-    def _change_strategy(self, name: str):
-        """전략 변경"""
-        strategies = {
-            'special': SpecialWeaponFarming(
-                self.config['strategies']['special_farming']
-            ),
-            'target': TargetEnforcementStrategy(self.config['strategies']['target']),
-        }
+    def _default_strategies(self) -> StrategyRegistry:
+        """내장 전략 + 설정의 규칙 파일(strategies.rules_file)"""
+        config = self.config['strategies']
+        registry = StrategyRegistry(config.get('rules_file'))
+        registry.register('special', lambda: SpecialWeaponFarming(
+            self.config['strategies']['special_farming']
+        ))
+        registry.register('target', lambda: TargetEnforcementStrategy(
+            self.config['strategies']['target']
+        ))
+        registry.register('policy', self._policy_strategy)
+        return registry
+
+    def create_strategy(self, name: str) -> MacroMode:
+        """이름으로 전략 생성 (없는 이름이면 KeyError)
+
+        선택 의존성(NumPy)이 없어 만들 수 없으면 알리고 현재 전략 유지.
+        """
+        self.strategies.reload()
+        try:
+            return self.strategies.create(name)
+        except ImportError as e:
+            self._missing_dependency(name, e)
+            return self.strategy
+
+    def _missing_dependency(self, name: str, error: ImportError):
+        self.slack.send_message(
+            f"⚠️ `{name}` 전략에 필요한 패키지가 없음 (현재 전략 유지): "
+            f"{error}"
+        )
+
+    def _change_strategy(self, name: str = None):
+        """전략 변경 (규칙 파일이 바뀌었으면 먼저 다시 로드)"""
+        strategies = self.strategies
+        try:
+            if strategies.reload():
+                self.slack.send_message("🔄 규칙 파일 다시 로드")
+        except (OSError, ValueError) as e:
+            self.slack.send_message(f"⚠️ 규칙 파일 오류 (이전 규칙 유지): {e}")
 
         if name in strategies:
-            self.strategy = strategies[name]
+            try:
+                self.strategy = strategies.create(name)
+            except ImportError as e:
+                self._missing_dependency(name, e)
+                return
+            self.change_detector.reset()
             self.slack.send_message(f"⚡ 전략 변경 → {name}")
         else:
             self.slack.send_message(
-                f"⚠️ 알 수 없는 전략\n"
-                f"사용 가능: special, safe, aggressive"
+                f"{'⚠️ 알 수 없는 전략' if name else '📋 전략 목록'}\n"
+                f"사용 가능: {', '.join(strategies.names())}"
+            )
+
+    def _check_config(self):
+        """설정 파일이 바뀌었으면 다시 로드 (CONFIG_CHECK_INTERVAL초마다 확인)"""
+        if not isinstance(self.config, Config):
+            return
+        now = time.monotonic()
+        if now - self._config_checked < self.CONFIG_CHECK_INTERVAL:
+            return
+        self._config_checked = now
+        if self.config.changed():
+            self.reload_config()
+        elif self.config.version != self._config_version:
+            # 다른 인스턴스가 이미 다시 로드함
+            self._apply_config()
+
+    def reload_config(self):
+        """설정 파일 다시 로드 - 잘못된 설정이면 기존 설정 유지"""
+        try:
+            self.config.reload()
+        except (OSError, ValueError) as e:
+            self.slack.send_message(f"⚠️ 설정 오류 (기존 설정 유지): {e}")
+            return
+        self._apply_config()
+
+    def _apply_config(self):
+        """새 설정으로 파서/전략 설정/입력 지연/폴링 간격 교체
+
+        메인 루프에서 틱 사이에만 호출한다. 새 구성 요소를 모두 만든 뒤
+        한 번에 바꾸므로, 만드는 도중 실패하면 아무것도 바뀌지 않는다.
+        """
+        config = self.config
+        previous = self._config_data
+        try:
+            parser = ChatParser(set(config['special_weapons']),
+                                tail=self.parser.tail)
+            # 현재 전략이 쓰던 설정 항목을 새 설정의 같은 항목으로
+            strategy_config = self.strategy.config
+            for key, section in previous['strategies'].items():
+                if section is strategy_config:
+                    strategy_config = config['strategies'][key]
+            bot = config['bot']
+            interval = bot['interval']
+            min_interval = bot.get('min_interval', interval)
+            max_interval = bot.get('max_interval', interval)
+            backoff = bot.get('backoff', 2.0)
+            delays = dict(config['automation']['delays'])
+            rules_file = config['strategies'].get('rules_file')
+            tracker = CommandTracker(**(config.get('command_tracker') or {}))
+        except (KeyError, TypeError, ValueError) as e:
+            self.slack.send_message(f"⚠️ 설정 적용 실패 (기존 설정 유지): {e}")
+            return
+
+        self.parser = parser
+        self.strategy.config = strategy_config
+        self.interval = interval
+        self.scheduler.min_interval = min_interval
+        self.scheduler.max_interval = max_interval
+        self.scheduler.backoff = backoff
+        self.scheduler.interval = min_interval
+        # 보정 중인 DelayProfile은 학습값을 유지 (delays는 보정 시작값)
+        if hasattr(self.automation, 'delays'):
+            self.automation.delays = delays
+        self.strategies.rules_path = rules_file
+        for key in ('timeout', 'backoff', 'max_timeout', 'max_resends'):
+            setattr(self.tracker, key, getattr(tracker, key))
+        self.change_detector.reset()
+        self._config_version = getattr(config, 'version', 0)
+        self._config_data = config.data
+        self.slack.send_message("🔄 설정 다시 로드 완료")
+
+    def _policy_strategy(self) -> PolicyTableStrategy:
+        """결정표 전략 - 확률/비용이 바뀌었을 때만 다시 계산 (NumPy 필요)"""
+        from simulation.solver import load_or_solve
+
+        config = self.config['strategies']['policy']
+        rates = GameRates.from_dict(self.config.get('rates'))
+        table = load_or_solve(rates, config.get('cache_dir', 'policy_cache'))
+        return PolicyTableStrategy(config, table)
+
+    def _show_rates(self):
+        """레벨별 강화 확률 추정치 (관측된 레벨만)"""
+        estimator = self.rate_estimator
+        lines = ["🎲 *강화 확률 추정* (성공 95% 구간)"]
+        for level in estimator.levels():
+            success, keep, destroy = estimator.estimate(level)
+            low, high = estimator.interval(level)
+            lines.append(
+                f"• +{level}: 성공 {success:.0%} ({low:.0%}~{high:.0%}) / "
+                f"유지 {keep:.0%} / 파괴 {destroy:.0%} "
+                f"(n={estimator.samples(level):.0f})"
             )
+        if len(lines) == 1:
+            lines.append("아직 관측된 강화 결과 없음")
+        self.slack.send_message('\n'.join(lines))
+
+    def _record_outcome(self, reply: Reply):
+        """강화 명령의 응답(성공/유지/파괴)을 기록/추정"""
+        before, state = reply.before, reply.state
+        if reply.cmd != "강화" or before is None or \
+                state.bot_state not in (ChatbotState.SUCCESS,
+                                        ChatbotState.REMAINED,
+                                        ChatbotState.FAILED):
+            return
+        self.rate_estimator.observe(before, state)
+        if not self.outcome_log:
+            return
+        self.outcome_log.record(
+            result=state.bot_state.label,
+            from_level=before.weapon.level,
+            to_level=state.weapon.level,
+            weapon=before.weapon.name,
+            is_special=before.weapon.is_special,
+            gold_before=before.gold,
+            gold_after=state.gold,
+            latency=reply.latency
+        )
 
     def _notify_state_change(self):
         """상태 변화 알림 - 목표 강화 단계 달성 시에만"""
@@ -181,6 +447,56 @@ class GameBot:
                 curr.gold
             )
 
+    def tick(self) -> bool:
+        """채팅 한 번 확인 후 전략 실행 (채팅 변화가 없으면 생략, False)"""
+        metrics = self.metrics
+        # 1. 채팅 수집 & 파싱
+        with metrics.span('get_chat'):
+            text = self.automation.get_chat()
+        if not self.change_detector.changed(text):
+            metrics.inc('ticks_skipped')
+            self.ticks_skipped += 1
+            return False
+        metrics.inc('ticks_processed')
+        self.ticks_processed += 1
+        self.last_action = None
+
+        try:
+            with metrics.span('parse'):
+                state = self.parser.parse(text)
+        except Exception as e:
+            metrics.inc('parse_failures')
+            print(f"[WARN] 채팅 파싱 실패: {e}")
+            self._record_snapshot(text)
+            return False
+        self.prev_state = self.state
+        self.state = state
+        self.history.append(state)
+        self.chat = text
+        # 보낸 명령의 응답인지는 tracker만 판단 (지연/결과 기록/대시보드 공용)
+        reply = self.tracker.observe(state, text)
+        if reply:
+            metrics.observe('command_rtt', reply.latency)
+            self._record_outcome(reply)
+
+        # 2. 상태 변화 알림 (대시보드 모드면 고정 메시지에 반영)
+        if self.slack.dashboard:
+            self.slack.dashboard.observe(state, reply)
+        self._notify_state_change()
+
+        # 3. 전략 실행 (보낸 명령의 응답을 기다리는 중이면 생략)
+        if self.state.bot_state != ChatbotState.IDLE and \
+                not self.tracker.waiting:
+            with metrics.span('do_step'):
+                self.strategy.do_step(self)
+        self._record_snapshot(text)
+        return True
+
+    def _record_snapshot(self, text: str):
+        if self.recorder:
+            with self.metrics.span('record'):
+                self.recorder.record(text, self.last_action)
+
     def run(self):
         """메인 루프"""
         self.running = True
@@ -194,24 +510,29 @@ class GameBot:
 
         try:
             while self.running:
+                # 0. 설정 변경 반영, 쌓인 Slack 명령 실행
+                self._check_config()
+                if self.commands.depth:
+                    with self.metrics.span('slack_commands'):
+                        self.commands.drain(self._handle_slack_command)
+                if not self.running:
+                    break
+
                 if self.paused:
-                    time.sleep(0.5)
+                    self.scheduler.wait(self.scheduler.max_interval)
                     continue
 
-                # 1. 채팅 수집 & 파싱
-                text = self.automation.get_chat()
-                self.prev_state = self.state
-                self.state = self.parser.parse(text)
-
-                # 2. 상태 변화 알림
-                self._notify_state_change()
-
-                # 3. 전략 실행
-                if self.state.bot_state != ChatbotState.IDLE:
-                    self.strategy.do_step(self)
+                # 1. 채팅 확인 & 전략 실행
+                with self.metrics.span('tick'):
+                    changed = self.tick()
+                if changed:
+                    self.scheduler.changed()
+                else:
+                    self.scheduler.quiet()
+                self._resend_if_stalled()
 
-                # 4. 대기
-                time.sleep(self.interval)
+                # 2. 대기
+                self.scheduler.wait()
 
         except KeyboardInterrupt:
             pass
@@ -220,41 +541,214 @@ class GameBot:
             self.running = False
             self.slack.send_message("👋 GameBot 종료")
             self.slack.stop()
+            if self.recorder:
+                self.recorder.close()
             print("\nStopped.")
 
 
-def main():
-    # 설정 로드
-    config = Config()
-
-    # 전략 선택
-    strategy = SpecialWeaponFarming(
-        config['strategies']['special_farming']
+def instance_path(path: str, name: str = None) -> str:
+    """인스턴스마다 따로 쓰는 파일 경로 (예: profile.json → profile-bot1.json)"""
+    if not path or not name:
+        return path
+    root, ext = os.path.splitext(path)
+    if ext == '.gz':
+        root, inner = os.path.splitext(root)
+        ext = inner + ext
+    return f"{root}-{name}{ext}"
+
+
+def create_automation(config: Config, metrics: Metrics, instance: dict,
+                      arbiter: InputArbiter = None) -> 'GameAutomation':
+    """키보드/클립보드 입력 (instance: 인스턴스별 설정)"""
+    # pyautogui/win32clipboard는 Windows 전용이라 여기서 로드
+    from infrastructure.automation import GameAutomation
+
+    name = instance.get('name')
+    delays = config['automation']['delays']
+    calibration = config['automation'].get('calibration', {})
+    profile = None
+    if calibration.get('enabled'):
+        # 인스턴스마다 입력 지연 프로필 따로 학습
+        profile = DelayProfile(
+            delays,
+            path=instance_path(calibration.get('profile'), name),
+            min_delay=calibration.get('min_delay', 0.02)
+        )
+    return GameAutomation(
+        delays, profile, metrics,
+        arbiter=arbiter,
+        focus=instance.get('focus'),
+        name=name
     )
 
-    # 서비스 생성
-    parser = ChatParser(set(config['special_weapons']))
-    automation = GameAutomation(config['automation']['delays'])
-    slack = SlackBot(
-        bot_token=config['slack']['bot_token'],
-        app_token=config['slack']['app_token'],
-        channel=config['slack']['channel']
+
+def create_bot(config: Config, slack: Notifier, metrics: Metrics,
+               outcome_log: 'OutcomeLog', rate_estimator: RateEstimator,
+               instance: dict = None, arbiter: InputArbiter = None,
+               automation=None) -> GameBot:
+    """GameBot 생성 (instance: 여러 인스턴스 실행 시 인스턴스별 설정)"""
+    instance = instance or {}
+    parser = ChatParser(set(config['special_weapons']), tail=True)
+    recorder = None
+    if automation is None:
+        automation = create_automation(config, metrics, instance, arbiter)
+        # 채팅 녹화 (simulation/replay.py로 재현)
+        path = (config.get('recording') or {}).get('path')
+        if path:
+            from infrastructure.recording import Recorder
+            recorder = Recorder(instance_path(path, instance.get('name')))
+
+    # 폴링 스케줄러 (min/max 미설정 시 고정 간격)
+    bot_config = config['bot']
+    scheduler = PollScheduler(
+        min_interval=bot_config.get('min_interval', bot_config['interval']),
+        max_interval=bot_config.get('max_interval', bot_config['interval']),
+        backoff=bot_config.get('backoff', 2.0)
     )
 
-    # GameBot 실행
     bot = GameBot(
-        strategy=strategy,
+        strategy=SpecialWeaponFarming(
+            config['strategies']['special_farming']
+        ),
         parser=parser,
         automation=automation,
         slack=slack,
         config=config,
-        interval=config['bot']['interval']
+        interval=bot_config['interval'],
+        scheduler=scheduler,
+        metrics=metrics,
+        outcome_log=outcome_log,
+        rate_estimator=rate_estimator,
+        recorder=recorder,
+        tracker=CommandTracker(**(config.get('command_tracker') or {})),
+        history=StateHistory(config['bot'].get('history_size', 10_000))
+    )
+    if instance.get('strategy'):
+        bot.strategy = bot.create_strategy(instance['strategy'])
+    return bot
+
+
+def dry_run(config: Config, source: str, strategy: str = None) -> GameBot:
+    """채팅 텍스트(파일, '-'이면 표준 입력)를 한 번 파싱하고 보낼 명령만 출력"""
+    from infrastructure.console import ConsoleNotifier, TranscriptAutomation
+
+    if source == '-':
+        text = sys.stdin.read()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    bot = create_bot(config, ConsoleNotifier(stdin=False), Metrics(), None,
+                     RateEstimator(), automation=TranscriptAutomation(text))
+    if strategy:
+        bot.strategy = bot.create_strategy(strategy)
+    bot.running = True
+    bot.paused = False
+    if not bot.tick():
+        print("[DRY-RUN] 파싱할 채팅 없음")
+        return bot
+
+    state = bot.state
+    print(f"[DRY-RUN] [+{state.weapon.level}] {state.weapon.name}"
+          f"{' (특수)' if state.weapon.is_special else ''} / "
+          f"{state.gold:,}G / {state.bot_state.label}")
+    if not bot.automation.sent:
+        print("[DRY-RUN] 보낼 명령 없음")
+    return bot
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="GameBot with Slack")
+    parser.add_argument('--config', default="config.yaml")
+    parser.add_argument('--dry-run', nargs='?', const='-', metavar='FILE',
+                        help="채팅 텍스트 파일(생략하면 표준 입력)을 파싱하고 "
+                             "전략이 보낼 명령만 출력")
+    parser.add_argument('--no-slack', action='store_true',
+                        help="Slack 대신 콘솔 사용 (명령은 표준 입력으로)")
+    parser.add_argument('--strategy', help="시작 전략 이름")
+    args = parser.parse_args(argv)
+
+    # 설정 로드
+    # dry-run은 Slack 토큰(.env)이 필요 없음
+    config = Config(args.config, env=not args.dry_run)
+    if args.dry_run:
+        dry_run(config, args.dry_run, args.strategy)
+        return
+
+    # 공용 서비스 생성
+    metrics = Metrics()
+    if args.no_slack:
+        from infrastructure.console import ConsoleNotifier
+        slack = ConsoleNotifier()
+    else:
+        from infrastructure.slack import SlackBot
+        slack = SlackBot(
+            bot_token=config['slack']['bot_token'],
+            app_token=config['slack']['app_token'],
+            channel=config['slack']['channel'],
+            metrics=metrics,
+            dashboard_interval=config['slack'].get('dashboard_interval')
+        )
+
+    # 지표 노출 (HTTP /metrics, 파일)
+    metrics_config = config.get('metrics') or {}
+    exporter = MetricsExporter(
+        metrics,
+        port=metrics_config.get('port'),
+        path=metrics_config.get('file') or None,
+        interval=metrics_config.get('interval', 10)
+    )
+    exporter.start()
+
+    # 강화 결과 기록
+    log_config = config.get('outcome_log') or {}
+    outcome_log = None
+    if log_config.get('path'):
+        from infrastructure.outcome_log import OutcomeLog
+        outcome_log = OutcomeLog(
+            log_config['path'],
+            retention_days=log_config.get('retention_days')
+        )
+        outcome_log.start()
+
+    # 강화 확률 추정 (재시작 후에도 이어서)
+    estimator_config = config.get('rate_estimator') or {}
+    rate_estimator = RateEstimator(
+        prior=GameRates.from_dict(config.get('rates')),
+        half_life=estimator_config.get('half_life', 500),
+        prior_weight=estimator_config.get('prior_weight', 5),
+        path=estimator_config.get('path') or None
     )
 
     print("GameBot with Slack started.")
     print("Use Slack commands to control the bot.")
 
-    bot.run()
+    try:
+        instances = config.get('instances')
+        if instances:
+            # 여러 계정: Slack 연결 하나, 입력은 인스턴스끼리 번갈아 사용
+            from supervisor import Supervisor
+
+            supervisor = Supervisor(slack)
+            arbiter = InputArbiter()
+            for instance in instances:
+                supervisor.add(instance['name'], create_bot(
+                    config, supervisor.slack_for(instance['name']),
+                    metrics, outcome_log, rate_estimator,
+                    instance, arbiter
+                ))
+            supervisor.run()
+        else:
+            bot = create_bot(config, slack, metrics, outcome_log,
+                             rate_estimator)
+            if args.strategy:
+                bot.strategy = bot.create_strategy(args.strategy)
+            bot.run()
+    finally:
+        exporter.stop()
+        rate_estimator.save()
+        if outcome_log:
+            outcome_log.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""오프라인 게임 시뮬레이터"""
+import random
+from collections import deque
+
+from domain.rates import GameRates
+from simulation import transcript
+from simulation.transcript import BASIC_WEAPONS, NORMAL_WEAPONS
+
+
+class SimulatedGame:
+    """GameAutomation 대체 - 강화/판매 결과를 확률로 정해 CHAT.md 형식 채팅 생성
+
+    get_chat() / send_command()만 제공하므로 GameBot에 그대로 넣을 수 있다.
+    입력 지연이 없고, 게임 시간은 명령마다 seconds_per_command씩 흐른다.
+    채팅 창에는 최근 max_chats개 채팅만 남는다.
+    """
+
+    def __init__(self, special_weapons=(), rates: GameRates = None,
+                 gold: int = 100_000_000, seed: int = 0,
+                 max_chats: int = 50, seconds_per_command: float = 3.0,
+                 player: str = transcript.DEFAULT_PLAYER):
+        self.special_weapons = sorted(special_weapons)
+        self.rates = rates or GameRates()
+        self.rng = random.Random(seed)
+        self.player = player
+        self.seconds_per_command = seconds_per_command
+
+        self.gold = gold
+        self.level = 0
+        self.name = self.rng.choice(BASIC_WEAPONS)
+        self.is_special = False
+
+        # 통계
+        self.commands = 0
+        self.enforces = 0
+        self.sells = 0
+        self.successes = 0
+        self.kept = 0
+        self.destroyed = 0
+        self.gold_spent = 0
+        self.gold_earned = 0
+        self.elapsed = 0.0  # 게임 시간 (초)
+        self.bankrupt = False  # 골드 부족으로 강화 불가
+
+        self._chats = deque(maxlen=max_chats)
+        self._text = None
+        # 시작 화면: 현재 골드와 무기를 보여주는 판매 채팅
+        self._post(transcript.sold(0, gold, self.name, self._minute(),
+                                   player=player))
+
+    def _minute(self) -> int:
+        return 9 * 60 + int(self.elapsed // 60)
+
+    def _post(self, chat: str):
+        self._chats.append(chat)
+        self._text = None
+
+    def get_chat(self) -> str:
+        """채팅 텍스트"""
+        if self._text is None:
+            self._text = '\n'.join(self._chats)
+        return self._text
+
+    def send_command(self, cmd: str) -> None:
+        """명령 전송 - 에코와 결과 채팅을 즉시 추가"""
+        self.commands += 1
+        self.elapsed += self.seconds_per_command
+        minute = self._minute()
+        self._post(transcript.command(cmd, minute, self.player))
+
+        if cmd == "강화":
+            self._enforce(minute)
+        elif cmd == "판매":
+            self._sell(minute)
+
+    def _enforce(self, minute: int):
+        rates = self.rates
+        cost = rates.cost_at(self.level)
+        if self.gold < cost:
+            # 응답 형식이 정해져 있지 않아 에코만 남김
+            self.bankrupt = True
+            return
+
+        self.enforces += 1
+        self.gold -= cost
+        self.gold_spent += cost
+        roll = self.rng.random()
+        success = rates.success_at(self.level)
+
+        if roll < success:
+            self.successes += 1
+            if self.level == 0:
+                self._pick_weapon()
+            self._post(transcript.success(
+                self.level, self.level + 1, self.name, self.gold, cost,
+                minute, self.player,
+                line=self.rng.choice(transcript.SMITH_LINES)
+            ))
+            self.level += 1
+        elif roll < success + rates.destroy_at(self.level):
+            self.destroyed += 1
+            new_name = self.rng.choice(BASIC_WEAPONS)
+            self._post(transcript.destroyed(
+                self.level, self.name, new_name, self.gold, cost,
+                minute, self.player,
+                line=self.rng.choice(transcript.DESTROY_LINES)
+            ))
+            self.level, self.name, self.is_special = 0, new_name, False
+        else:
+            self.kept += 1
+            self._post(transcript.kept(
+                self.level, self.name, self.gold, cost, minute, self.player,
+                line=self.rng.choice(transcript.KEEP_LINES)
+            ))
+
+    def _pick_weapon(self):
+        """+0 → +1 성공 시 새 무기 이름 (일정 확률로 특수 무기)"""
+        if self.special_weapons and \
+                self.rng.random() < self.rates.special_rate:
+            self.name = self.rng.choice(self.special_weapons)
+            self.is_special = True
+        else:
+            self.name = self.rng.choice(NORMAL_WEAPONS)
+            self.is_special = False
+
+    def _sell(self, minute: int):
+        self.sells += 1
+        price = self.rates.price_at(self.level, self.is_special)
+        self.gold += price
+        self.gold_earned += price
+        self.bankrupt = False
+        self.level = 0
+        self.name = self.rng.choice(BASIC_WEAPONS)
+        self.is_special = False
+        self._post(transcript.sold(
+            price, self.gold, self.name, minute, self.player,
+            line=self.rng.choice(transcript.APPRAISER_LINES)
+        ))
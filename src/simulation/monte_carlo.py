@@ -0,0 +1,220 @@
+"""전략 설정 몬테카를로 평가 (NumPy 벡터화)
+
+여러 세션을 배열(레벨, 골드, 특수 여부)로 묶어 한 스텝씩 동시에 진행한다.
+결정 규칙은 domain.strategy.strategies의 전략 클래스와 같다.
+NumPy는 선택 의존성이다 (pip install '.[sim]').
+"""
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "simulation.monte_carlo requires numpy (pip install '.[sim]')"
+    ) from e
+
+from domain.rates import GameRates
+from domain.policy_table import SELL as TABLE_SELL
+from domain.strategy.strategies import (
+    PolicyTableStrategy, SpecialWeaponFarming, TargetEnforcementStrategy,
+)
+
+# 정책 결과
+ENFORCE = 0
+SELL = 1
+STOP = 2   # 골드 부족으로 종료 (gamebot.stop)
+DONE = 3   # 목표 달성 후 중단 (gamebot.pause)
+
+
+def _lookup(table: np.ndarray, level: np.ndarray) -> np.ndarray:
+    """레벨별 값 (목록 길이를 넘는 레벨은 마지막 값)"""
+    return table[np.minimum(level, len(table) - 1)]
+
+
+class SpecialFarmingPolicy:
+    """SpecialWeaponFarming.do_step과 같은 규칙"""
+
+    def __init__(self, config: dict):
+        self.safe_money = np.asarray(config['safe_money'])
+        self.target_level = config['target_level']
+
+    def __call__(self, level, gold, special) -> np.ndarray:
+        sell = ((gold < _lookup(self.safe_money, level))
+                | ((level == 1) & ~special)
+                | (level >= self.target_level))
+        return np.where(sell, SELL, ENFORCE)
+
+
+class TargetPolicy:
+    """TargetEnforcementStrategy.do_step과 같은 규칙"""
+
+    def __init__(self, config: dict):
+        self.required = np.asarray(config['required_money_per_level'])
+        self.target_level = config['target_level']
+
+    def __call__(self, level, gold, special) -> np.ndarray:
+        actions = np.full(level.shape, ENFORCE)
+        actions[level >= self.target_level] = DONE
+        actions[gold < _lookup(self.required, level)] = STOP
+        return actions
+
+
+class TablePolicy:
+    """PolicyTableStrategy.do_step과 같은 규칙"""
+
+    def __init__(self, table):
+        self.sell = np.array([[[a == TABLE_SELL for a in actions]
+                               for actions in row] for row in table.rows])
+
+    def __call__(self, level, gold, special) -> np.ndarray:
+        _, levels, buckets = self.sell.shape
+        bucket = np.frexp(np.maximum(gold, 0))[1]  # == gold.bit_length()
+        sell = self.sell[special.astype(np.int64),
+                         np.minimum(level, levels - 1),
+                         np.minimum(bucket, buckets - 1)]
+        return np.where(sell, SELL, ENFORCE)
+
+
+def policy_for(strategy):
+    """MacroMode 인스턴스 → 벡터화 정책"""
+    if isinstance(strategy, SpecialWeaponFarming):
+        return SpecialFarmingPolicy(strategy.config)
+    if isinstance(strategy, TargetEnforcementStrategy):
+        return TargetPolicy(strategy.config)
+    if isinstance(strategy, PolicyTableStrategy):
+        return TablePolicy(strategy.table)
+    raise ValueError(f"no vectorized policy for {type(strategy).__name__}")
+
+
+@dataclass
+class MonteCarloResult:
+    """세션별 결과 배열 (길이 = 세션 수)"""
+    final_gold: np.ndarray
+    hours: np.ndarray            # 세션별 진행 시간 (중단 시점까지)
+    bankrupt: np.ndarray         # 골드 부족으로 종료/강화 불가
+    time_to_target: np.ndarray   # 목표 레벨 첫 도달 시간 (미도달 nan)
+    initial_gold: int
+
+    @property
+    def sessions(self) -> int:
+        return len(self.final_gold)
+
+    @property
+    def gold_per_hour(self) -> np.ndarray:
+        profit = self.final_gold - self.initial_gold
+        return profit / np.maximum(self.hours, 1e-9)
+
+    @property
+    def bankruptcy_probability(self) -> float:
+        return float(self.bankrupt.mean())
+
+    @property
+    def target_probability(self) -> float:
+        return float((~np.isnan(self.time_to_target)).mean())
+
+    def time_to_target_percentiles(self, q=(10, 50, 90)) -> dict:
+        reached = self.time_to_target[~np.isnan(self.time_to_target)]
+        if not len(reached):
+            return {p: float('nan') for p in q}
+        return dict(zip(q, np.percentile(reached, q).tolist()))
+
+    def report(self) -> str:
+        gph = self.gold_per_hour
+        lines = [
+            f"세션 {self.sessions:,}개",
+            f"시간당 골드: 평균 {gph.mean():,.0f}G "
+            f"(p10 {np.percentile(gph, 10):,.0f} / "
+            f"p50 {np.percentile(gph, 50):,.0f} / "
+            f"p90 {np.percentile(gph, 90):,.0f})",
+            f"파산 확률: {self.bankruptcy_probability:.2%}",
+            f"목표 도달 확률: {self.target_probability:.2%}",
+        ]
+        pct = self.time_to_target_percentiles()
+        lines.append("목표 도달 시간(h): " + " / ".join(
+            f"p{p} {v:.2f}" for p, v in pct.items()))
+        return '\n'.join(lines)
+
+
+def evaluate(policy, rates: GameRates = None, sessions: int = 100_000,
+             steps: int = 1_000, gold: int = 1_000_000, seed: int = 0,
+             seconds_per_command: float = 3.0) -> MonteCarloResult:
+    """sessions개 세션을 steps 명령까지 동시에 진행
+
+    SimulatedGame과 같은 규칙: 골드가 강화 비용보다 적으면 파산으로 보고
+    그 세션을 멈춘다. 정책이 STOP/DONE을 돌려준 세션도 멈춘다.
+    """
+    rates = rates or GameRates()
+    rng = np.random.default_rng(seed)
+    success = np.asarray(rates.success)
+    destroy = np.asarray(rates.destroy)
+    cost = np.asarray(rates.cost).astype(np.int64)
+    price = np.asarray(rates.price).astype(np.int64)
+    step_hours = seconds_per_command / 3600
+
+    level = np.zeros(sessions, dtype=np.int64)
+    money = np.full(sessions, gold, dtype=np.int64)
+    special = np.zeros(sessions, dtype=bool)
+    active = np.ones(sessions, dtype=bool)
+    bankrupt = np.zeros(sessions, dtype=bool)
+    used = np.zeros(sessions, dtype=np.int64)
+    time_to_target = np.full(sessions, np.nan)
+    target_level = getattr(policy, 'target_level', None)
+
+    for _ in range(steps):
+        idx = np.flatnonzero(active)
+        if not len(idx):
+            break
+        lv, g, sp = level[idx], money[idx], special[idx]
+        actions = policy(lv, g, sp)
+
+        stop = actions == STOP
+        bankrupt[idx[stop]] = True
+        active[idx[stop | (actions == DONE)]] = False
+
+        # 판매
+        sell = actions == SELL
+        sold = idx[sell]
+        gain = _lookup(price, lv[sell])
+        gain = np.where(sp[sell], (gain * rates.special_multiplier)
+                        .astype(np.int64), gain)
+        money[sold] += gain
+        level[sold] = 0
+        special[sold] = False
+
+        # 강화 (비용 부족 시 파산)
+        enforce = actions == ENFORCE
+        e_idx, lv_e = idx[enforce], lv[enforce]
+        c = _lookup(cost, lv_e)
+        broke = g[enforce] < c
+        bankrupt[e_idx[broke]] = True
+        active[e_idx[broke]] = False
+
+        e_idx, lv_e, c = e_idx[~broke], lv_e[~broke], c[~broke]
+        money[e_idx] -= c
+        roll = rng.random(len(e_idx))
+        s = _lookup(success, lv_e)
+        won = roll < s
+        lost = ~won & (roll < s + _lookup(destroy, lv_e))
+
+        first = e_idx[won & (lv_e == 0)]
+        special[first] = rng.random(len(first)) < rates.special_rate
+        level[e_idx[won]] += 1
+        level[e_idx[lost]] = 0
+        special[e_idx[lost]] = False
+
+        used[sold] += 1
+        used[e_idx] += 1
+
+        if target_level is not None:
+            hit = e_idx[won]
+            hit = hit[(level[hit] >= target_level)
+                      & np.isnan(time_to_target[hit])]
+            time_to_target[hit] = used[hit] * step_hours
+
+    return MonteCarloResult(
+        final_gold=money,
+        hours=used * step_hours,
+        bankrupt=bankrupt,
+        time_to_target=time_to_target,
+        initial_gold=gold,
+    )
@@ -0,0 +1,148 @@
+"""녹화된 채팅 재현 - 파서/전략 변경이 결정을 바꾸는지 확인
+
+    PYTHONPATH=src python -m simulation.replay recording.jsonl --strategy special
+
+녹화(infrastructure.recording)의 스냅샷을 대기 없이 GameBot에 차례로
+넣고, 틱마다 고른 행동을 녹화 당시의 행동과 비교한다.
+"""
+import argparse
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from domain.state import GameState
+from domain.strategy.base import MacroMode
+from infrastructure.parser import ChatParser
+from infrastructure.recording import read_recording
+from infrastructure.scheduler import PollScheduler
+from main import GameBot
+from simulation.runner import NullSlack
+
+
+class ReplayAutomation:
+    """GameAutomation 대체 - 현재 스냅샷을 돌려주고, 명령은 기록만"""
+
+    def __init__(self):
+        self.chat = ""
+        self.sent = []
+
+    def get_chat(self) -> str:
+        return self.chat
+
+    def send_command(self, cmd: str) -> None:
+        self.sent.append(cmd)
+
+
+@dataclass
+class Divergence:
+    """녹화와 다른 결정"""
+    index: int
+    t: float
+    recorded: str
+    replayed: str
+    state: GameState
+
+
+class ReplayResult:
+    def __init__(self):
+        self.snapshots = 0
+        self.divergences = []
+        self.recorded = Counter()  # 행동 → 횟수
+        self.replayed = Counter()
+        self.elapsed = 0.0
+
+    @property
+    def matched(self) -> int:
+        return self.snapshots - len(self.divergences)
+
+    def add(self, index: int, t: float, recorded: str, replayed: str,
+            state: GameState):
+        self.snapshots += 1
+        self.recorded[recorded] += 1
+        self.replayed[replayed] += 1
+        if recorded != replayed:
+            self.divergences.append(
+                Divergence(index, t, recorded, replayed, state))
+
+    def report(self, limit: int = 20) -> str:
+        rate = self.snapshots / self.elapsed if self.elapsed else 0.0
+        lines = [
+            f"스냅샷 {self.snapshots:,}개 / {self.elapsed:.2f}s "
+            f"({rate:,.0f}/s)",
+            f"일치 {self.matched:,} / 다름 {len(self.divergences):,}",
+            f"행동 (녹화): {_counts(self.recorded)}",
+            f"행동 (재현): {_counts(self.replayed)}",
+        ]
+        for d in self.divergences[:limit]:
+            when = time.strftime('%m-%d %H:%M:%S', time.localtime(d.t))
+            state = (f"[+{d.state.weapon.level}] {d.state.weapon.name} "
+                     f"{d.state.gold:,}G {d.state.bot_state.label}"
+                     if d.state else "파싱 실패")
+            lines.append(f"#{d.index} {when} {d.recorded} → {d.replayed} "
+                         f"({state})")
+        if len(self.divergences) > limit:
+            lines.append(f"… {len(self.divergences) - limit:,}개 더")
+        return '\n'.join(lines)
+
+
+def _counts(counter: Counter) -> str:
+    return ', '.join(f"{action or '없음'} {count:,}"
+                     for action, count in counter.most_common())
+
+
+def replay(snapshots, strategy, config, parser: ChatParser = None,
+           **options) -> ReplayResult:
+    """스냅샷(Snapshot)들을 GameBot으로 재현
+
+    strategy: MacroMode 또는 전략 이름 (내장/규칙 파일),
+    options는 GameBot 인자.
+    """
+    special_weapons = set(config['special_weapons'])
+    automation = ReplayAutomation()
+    bot = GameBot(
+        strategy=strategy if isinstance(strategy, MacroMode) else None,
+        parser=parser or ChatParser(special_weapons, tail=True),
+        automation=automation,
+        slack=NullSlack(),
+        config=config,
+        interval=0,
+        scheduler=PollScheduler(0, 0),
+        **options
+    )
+    if not isinstance(strategy, MacroMode):
+        bot.strategy = bot.create_strategy(strategy)
+
+    result = ReplayResult()
+    started = time.perf_counter()
+    for index, snapshot in enumerate(snapshots):
+        automation.chat = snapshot.chat
+        # 녹화된 스냅샷은 모두 처리된 틱 - 중단/종료 상태와 무관하게 재현
+        bot.running = True
+        bot.paused = False
+        bot.change_detector.reset()
+        parsed = bot.tick()
+        result.add(index, snapshot.t, snapshot.action, bot.last_action,
+                   bot.state if parsed else None)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def main(argv: list = None):
+    from config import Config
+
+    parser = argparse.ArgumentParser(description="녹화된 채팅 재현")
+    parser.add_argument('recording')
+    parser.add_argument('--strategy', default='special')
+    parser.add_argument('--config', default="config.yaml")
+    parser.add_argument('--limit', type=int, default=20,
+                        help="출력할 차이 개수")
+    args = parser.parse_args(argv)
+
+    config = Config(args.config, env=False)
+    result = replay(read_recording(args.recording), args.strategy, config)
+    print(result.report(args.limit))
+    return 1 if result.divergences else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""GameBot 오프라인 실행 (SimulatedGame + Slack 없음)"""
+from collections import deque
+
+from infrastructure.notifier import Notifier
+from infrastructure.parser import ChatParser
+from infrastructure.scheduler import PollScheduler
+from infrastructure.slack_outbox import PRIORITY_NORMAL
+from main import GameBot
+from simulation.game import SimulatedGame
+
+
+class NullSlack(Notifier):
+    """SlackBot 대체 - 전송하지 않고 최근 메시지만 보관"""
+
+    def __init__(self, max_messages: int = 100):
+        self.messages = deque(maxlen=max_messages)
+        self.command_handler = None
+
+    def set_command_handler(self, handler):
+        self.command_handler = handler
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        return True
+
+    def send_message(self, text: str, priority: int = PRIORITY_NORMAL):
+        self.messages.append(text)
+
+
+def simulate(strategy, config, game: SimulatedGame = None,
+             commands: int = 10_000, **options) -> GameBot:
+    """대기 없이 GameBot을 틱 단위로 실행 (options는 GameBot 인자)
+
+    commands개 명령을 보냈거나, 봇이 중단/종료했거나, 골드가 부족하거나,
+    전략이 더 이상 명령을 보내지 않으면 멈춘다.
+    """
+    special_weapons = set(config['special_weapons'])
+    game = game or SimulatedGame(special_weapons)
+    bot = GameBot(
+        strategy=strategy,
+        parser=ChatParser(special_weapons, tail=True),
+        automation=game,
+        slack=NullSlack(),
+        config=config,
+        interval=0,
+        scheduler=PollScheduler(0, 0),
+        **options
+    )
+    bot.running = True
+    bot.paused = False
+
+    limit = game.commands + commands
+    while bot.running and not bot.paused and not game.bankrupt \
+            and game.commands < limit:
+        if not bot.tick():
+            break
+    return bot
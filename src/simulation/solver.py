@@ -0,0 +1,180 @@
+"""최적 강화/판매 정책 계산 → PolicyTable
+
+1. 판매 시점: 무기 하나의 수명(+0에서 판매/파괴까지)을 갱신 주기로 보고
+   명령당 골드 ρ를 최대화한다. ρ를 고정하면 레벨이 오르거나 주기가 끝나는
+   전이만 있으므로 위에서부터 역방향으로 정확히 계산되고, ρ는 시작 상태
+   가치가 0이 되는 값을 이분 탐색으로 찾는다.
+2. 골드 구간: 같은 ρ로 골드 격자 위에서 다시 계산한다. 강화 비용보다
+   골드가 적으면 판매만 할 수 있으므로, 골드가 모자라는 상태에서는 더 낮은
+   레벨에서 파는 쪽이 나을 수 있다. 각 구간 하한 골드의 결정을 표에 쓴다.
+
+NumPy가 필요하다 (결정표를 읽는 PolicyTableStrategy는 필요 없음).
+"""
+import hashlib
+import json
+import math
+import os
+from dataclasses import asdict
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "simulation.solver requires numpy (pip install '.[sim]')"
+    ) from e
+
+from domain.policy_table import ENFORCE, SELL, PolicyTable
+from domain.rates import GameRates
+
+# 계산 방식이 바뀌면 올려서 캐시 무효화
+VERSION = 1
+
+
+def rates_key(rates: GameRates, **params) -> str:
+    """확률/비용/계산 인자 해시 (캐시 키)"""
+    data = json.dumps({'version': VERSION, 'rates': asdict(rates),
+                       'params': params}, sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+def _level_tables(rates: GameRates):
+    """레벨별 배열 - 마지막 레벨은 판매만 가능"""
+    levels = max(len(rates.success), len(rates.destroy),
+                 len(rates.cost), len(rates.price)) + 1
+    at = range(levels)
+    success = np.array([rates.success_at(l) for l in at])
+    destroy = np.array([rates.destroy_at(l) for l in at])
+    cost = np.array([rates.cost_at(l) for l in at], dtype=np.int64)
+    price = np.array([[rates.price_at(l, False), rates.price_at(l, True)]
+                      for l in at], dtype=float)
+    return success, 1.0 - success - destroy, cost, price
+
+
+def _values(rho: float, rates: GameRates, tables):
+    """명령당 ρ를 비용으로 뺀 주기 가치와 강화 여부 [레벨, 특수]"""
+    success, keep, cost, price = tables
+    levels = len(cost)
+    value = np.zeros((levels, 2))
+    enforce = np.zeros((levels, 2), dtype=bool)
+    value[-1] = price[-1] - rho
+    for l in range(levels - 2, -1, -1):
+        if l == 0:
+            q = rates.special_rate
+            nxt = q * value[1, 1] + (1 - q) * value[1, 0]
+            nxt = np.array([nxt, nxt])
+        else:
+            nxt = value[l + 1]
+        sell = price[l] - rho
+        if keep[l] < 1:
+            enf = (-cost[l] - rho + success[l] * nxt) / (1 - keep[l])
+        else:
+            enf = np.full(2, -np.inf)
+        enforce[l] = enf > sell
+        value[l] = np.maximum(enf, sell)
+    return value, enforce
+
+
+def solve_policy(rates: GameRates, iterations: int = 200):
+    """명령당 골드를 최대화하는 (ρ, 강화 여부 [레벨, 특수])"""
+    tables = _level_tables(rates)
+    _, _, cost, price = tables
+    lo, hi = -float(cost.max()), float(price.max())
+    for _ in range(iterations):
+        rho = (lo + hi) / 2
+        if _values(rho, rates, tables)[0][0, 0] > 0:
+            lo = rho
+        else:
+            hi = rho
+    return lo, _values(lo, rates, tables)[1]
+
+
+def gold_values(rho: float, rates: GameRates, unit: int, cells: int,
+                tol: float = 1e-9):
+    """[레벨, 특수, 골드 칸] 가치와 강화 여부 - 골드가 비용보다 적으면 강화 불가
+
+    골드 칸 m은 m * unit G, 비용은 칸 단위로 올림한다 (보수적).
+    골드가 충분해 제한 없는 가치에 수렴한 뒤의 칸은 그 값으로 채운다.
+    """
+    tables = _level_tables(rates)
+    success, keep, cost, price = tables
+    free_value, free_enforce = _values(rho, rates, tables)
+    levels = len(cost)
+    value = np.empty((levels, 2, cells))
+    enforce = np.zeros((levels, 2, cells), dtype=bool)
+    converged = np.zeros((levels, 2), dtype=np.int64)  # 수렴 시작 칸
+    value[-1] = (price[-1] - rho)[:, None]
+
+    for l in range(levels - 2, -1, -1):
+        c = max(1, math.ceil(cost[l] / unit))
+        for s in ((0,) if l == 0 else (0, 1)):
+            if l == 0:
+                q = rates.special_rate
+                nxt = q * value[1, 1] + (1 - q) * value[1, 0]
+                nxt_converged = converged[1].max()
+            else:
+                nxt = value[l + 1, s]
+                nxt_converged = converged[l + 1, s]
+            sell = price[l, s] - rho
+            free = free_value[l, s]
+            v, e = value[l, s], enforce[l, s]
+            v[:c] = sell
+            base = -cost[l] - rho
+            for start in range(c, cells, c):
+                end = min(start + c, cells)
+                # 강화: 비용을 내고 성공(다음 레벨) / 유지(같은 레벨) / 파괴(0)
+                enf = (base + success[l] * nxt[start - c:end - c]
+                       + keep[l] * v[start - c:end - c])
+                e[start:end] = enf > sell
+                v[start:end] = np.maximum(enf, sell)
+                if start - c >= nxt_converged and \
+                        np.abs(v[start:end] - free).max() <= \
+                        tol * max(1.0, abs(free)):
+                    v[end:] = free
+                    e[end:] = free_enforce[l, s]
+                    converged[l, s] = end
+                    break
+            else:
+                converged[l, s] = cells
+        if l == 0:
+            value[0, 1], enforce[0, 1] = value[0, 0], enforce[0, 0]
+            converged[0, 1] = converged[0, 0]
+    return value, enforce
+
+
+def solve(rates: GameRates, max_gold: int = 2 ** 30,
+          cells: int = 2 ** 20) -> PolicyTable:
+    """확률/비용 → 결정표"""
+    rho, _ = solve_policy(rates)
+    _, _, cost, _ = _level_tables(rates)
+    unit = max(math.gcd(*cost.tolist()), math.ceil(max_gold / cells))
+    _, enforce = gold_values(rho, rates, unit, cells)
+
+    # 구간 하한의 결정 사용
+    buckets = max_gold.bit_length() + 1
+    edges = np.array([0] + [2 ** (b - 1) for b in range(1, buckets)])
+    m = np.minimum(edges // unit, cells - 1)
+    rows = ([], [])
+    for l in range(len(cost)):
+        for s in (0, 1):
+            rows[s].append(''.join(ENFORCE if e else SELL
+                                   for e in enforce[l, s][m]))
+
+    key = rates_key(rates, max_gold=max_gold, cells=cells)
+    return PolicyTable(rows[0], rows[1], key, meta={
+        'gold_per_command': rho,
+        'unit': unit,
+    })
+
+
+def load_or_solve(rates: GameRates, cache_dir: str,
+                  max_gold: int = 2 ** 30,
+                  cells: int = 2 ** 20) -> PolicyTable:
+    """캐시된 결정표 로드 (확률/비용이 바뀌었으면 다시 계산해 저장)"""
+    key = rates_key(rates, max_gold=max_gold, cells=cells)
+    path = os.path.join(cache_dir, f"policy-{key}.json")
+    if os.path.exists(path):
+        return PolicyTable.load(path)
+    table = solve(rates, max_gold, cells)
+    os.makedirs(cache_dir, exist_ok=True)
+    table.save(path)
+    return table
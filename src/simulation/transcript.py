@@ -0,0 +1,205 @@
+"""CHAT.md 형식의 플레이봇 채팅 생성"""
+import random
+
+BOT_NAME = "플레이봇"
+DEFAULT_PLAYER = "사용자"
+
+SMITH_LINES = [
+    "이게 고작 이 정도라니, 시시하군.",
+    "제법이군. 망치질할 맛이 나는데?",
+    "흠, 운이 좋았어.",
+]
+DESTROY_LINES = [
+    "결국 자신의 힘을 감당하지 못했군. 내 실수 따위는 없어.",
+    "역시 저 불안정한 영혼이 문제였어.",
+]
+KEEP_LINES = [
+    "버텨냈군. 다음엔 장담 못 하네.",
+    "녹아내리지 않다니... 질긴 녀석이군.",
+]
+APPRAISER_LINES = [
+    "모래가 씹히는군. 관리가 엉망이야.",
+    "나쁘지 않은 물건이야.",
+]
+CHATTER = [
+    "오늘 운 좋다",
+    "ㅋㅋㅋㅋ",
+    "또 터졌네",
+    "다들 몇 강이에요?",
+    "10강 가즈아",
+]
+NORMAL_WEAPONS = [
+    "대지의 울림 검",
+    "영혼 감응의 검",
+    "창세의 혼돈의 막대",
+    "녹슨 철검",
+    "바람을 가르는 단검",
+]
+BASIC_WEAPONS = ["낡은 검", "낡은 망치", "낡은 몽둥이"]
+
+
+def clock(minute: int) -> str:
+    """하루 중 분 → '오후 12:32' 형식"""
+    minute %= 24 * 60
+    hour, minute = divmod(minute, 60)
+    period = "오전" if hour < 12 else "오후"
+    hour = hour % 12 or 12
+    return f"{period} {hour}:{minute:02d}"
+
+
+def header(name: str, minute: int) -> str:
+    return f"[{name}] [{clock(minute)}] "
+
+
+def command(cmd: str, minute: int, player: str = DEFAULT_PLAYER) -> str:
+    """플레이어 명령 채팅 (예: /강화)"""
+    return f"{header(player, minute)}/{cmd}"
+
+
+def chatter(text: str, minute: int, player: str = DEFAULT_PLAYER) -> str:
+    return f"{header(player, minute)}{text}"
+
+
+def success(from_level: int, to_level: int, name: str, gold: int,
+            cost: int, minute: int, player: str = DEFAULT_PLAYER,
+            line: str = SMITH_LINES[0]) -> str:
+    """강화 성공 - +10 이상이면 속보 채팅 추가"""
+    h = header(BOT_NAME, minute)
+    chats = [
+        f"{h}@{player} 〖✨강화 성공✨ +{from_level} → +{to_level}〗\n"
+        f"\n"
+        f"💬 대장장이: \"{line}\"\n"
+        f"\n"
+        f"💸사용 골드: -{cost:,}G\n"
+        f"💰남은 골드: {gold:,}G\n"
+        f"⚔️획득 검: [+{to_level}] {name}",
+        f"{h}[+{to_level}] {name}\n"
+        f"전설처럼 전해지는 무기.",
+    ]
+    if to_level > 10:
+        chats.append(
+            f"{h}🚨[속보]🚨 @{player}님이 전설의 『[+{to_level}] {name}』 "
+            f"강화에 성공하셨습니다."
+        )
+    return '\n'.join(chats)
+
+
+def kept(level: int, name: str, gold: int, cost: int, minute: int,
+         player: str = DEFAULT_PLAYER, line: str = KEEP_LINES[0]) -> str:
+    """강화 유지"""
+    h = header(BOT_NAME, minute)
+    return (
+        f"{h}@{player} 〖💦강화 유지💦〗\n"
+        f"\n"
+        f"💬 대장장이: \"{line}\"\n"
+        f"\n"
+        f"『[+{level}] {name}』의 레벨이 유지되었습니다.\n"
+        f"\n"
+        f"💸사용 골드: -{cost:,}G\n"
+        f"💰남은 골드: {gold:,}G\n"
+        f"{h}💬 대장장이: \"계속 강화하겠나?\""
+    )
+
+
+def destroyed(level: int, name: str, new_name: str, gold: int, cost: int,
+              minute: int, player: str = DEFAULT_PLAYER,
+              line: str = DESTROY_LINES[0]) -> str:
+    """강화 파괴 - +10 이상이면 묵념 채팅 추가"""
+    h = header(BOT_NAME, minute)
+    chats = [
+        f"{h}@{player} 〖💥강화 파괴💥〗\n"
+        f"\n"
+        f"💬 대장장이: \"{line}\"\n"
+        f"\n"
+        f"💸사용 골드: -{cost:,}G\n"
+        f"💰남은 골드: {gold:,}G",
+        f"{h}『[+{level}] {name}』 산산조각 나서, "
+        f"『[+0] {new_name}』 지급되었습니다.",
+    ]
+    if level >= 10:
+        chats.append(
+            f"{h}모두 @{player}의 위대한 도전을 기리며 "
+            f"잠시 묵념하는 시간을 갖겠습니다..."
+        )
+    return '\n'.join(chats)
+
+
+def sold(price: int, gold: int, new_name: str, minute: int,
+         player: str = DEFAULT_PLAYER,
+         line: str = APPRAISER_LINES[0]) -> str:
+    """판매"""
+    h = header(BOT_NAME, minute)
+    return (
+        f"{h}@{player} 〖검 판매〗\n"
+        f"\n"
+        f"💬 감정사: \"{line} {price:,}G.\"\n"
+        f"\n"
+        f"💶획득 골드: +{price:,}G\n"
+        f"💰현재 보유 골드: {gold:,}G\n"
+        f"⚔️새로운 검 획득: [+0] {new_name}\n"
+        f"{h}💬 감정사: \"뭐 검이 필요하면 이거나 가져가시게나.\" "
+    )
+
+
+class TranscriptGenerator:
+    """무작위 강화/판매 세션 채팅 생성 (벤치마크용)
+
+    강화 성공(+10 전후), 유지, 파괴 후 지급, 판매, 플레이어 잡담을 섞는다.
+    """
+
+    def __init__(self, special_weapons=(), seed: int = 0,
+                 chatter_rate: float = 0.1):
+        self.rng = random.Random(seed)
+        self.special_weapons = sorted(special_weapons)
+        self.chatter_rate = chatter_rate
+
+    def events(self):
+        """(채팅 텍스트) 무한 생성"""
+        rng = self.rng
+        minute, gold = 9 * 60, 100_000_000
+        level, name = 0, rng.choice(BASIC_WEAPONS)
+        while True:
+            minute += 1
+            if rng.random() < self.chatter_rate:
+                yield chatter(rng.choice(CHATTER), minute)
+                continue
+
+            if level >= 15 or (level > 0 and rng.random() < 0.1):
+                price = 10 * 2 ** level
+                gold += price
+                level, name = 0, rng.choice(BASIC_WEAPONS)
+                yield command("판매", minute)
+                yield sold(price, gold, name, minute,
+                           line=rng.choice(APPRAISER_LINES))
+                continue
+
+            cost = 10 * (level + 1) ** 2
+            gold -= cost
+            yield command("강화", minute)
+            roll = rng.random()
+            if roll < 0.6:
+                if level == 0 and self.special_weapons and rng.random() < 0.2:
+                    name = rng.choice(self.special_weapons)
+                elif level == 0:
+                    name = rng.choice(NORMAL_WEAPONS)
+                yield success(level, level + 1, name, gold, cost, minute,
+                              line=rng.choice(SMITH_LINES))
+                level += 1
+            elif roll < 0.85:
+                yield kept(level, name, gold, cost, minute,
+                           line=rng.choice(KEEP_LINES))
+            else:
+                new_name = rng.choice(BASIC_WEAPONS)
+                yield destroyed(level, name, new_name, gold, cost, minute,
+                                line=rng.choice(DESTROY_LINES))
+                level, name = 0, new_name
+
+    def generate(self, lines: int) -> str:
+        """최소 lines 줄 이상의 채팅 텍스트"""
+        chats, count = [], 0
+        for chat in self.events():
+            chats.append(chat)
+            count += chat.count('\n') + 1
+            if count >= lines:
+                break
+        return '\n'.join(chats)
@@ -0,0 +1,124 @@
+"""여러 GameBot 인스턴스 실행 (계정마다 하나)"""
+import threading
+
+from infrastructure.notifier import Notifier
+from infrastructure.slack_outbox import PRIORITY_NORMAL
+
+
+class InstanceSlack(Notifier):
+    """인스턴스별 Slack - 공용 연결로 보내고 메시지 앞에 [이름]을 붙임"""
+
+    def __init__(self, slack, name: str):
+        self.slack = slack
+        self.name = name
+        self.command_handler = None
+        # 대시보드 모드면 공용 고정 메시지에 인스턴스별 패널
+        board = getattr(slack, 'board', None)
+        if board:
+            self.dashboard = board.panel(name)
+
+    def set_command_handler(self, handler):
+        self.command_handler = handler
+
+    def start(self):
+        pass  # 연결은 Supervisor가 관리
+
+    def stop(self):
+        pass
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        return self.slack.flush(timeout)
+
+    def send_message(self, text: str, priority: int = PRIORITY_NORMAL):
+        self.slack.send_message(f"[{self.name}] {text}", priority)
+
+
+class Supervisor:
+    """한 Slack 연결로 여러 GameBot 실행
+
+    - 마지막 단어가 인스턴스 이름인 명령은 그 인스턴스에만 보낸다.
+      (예: `!시작 bot2`, `!강화 10 bot1`)
+    - 이름이 없으면 모든 인스턴스에 보내고, 공용 정보 명령(도움/지표/확률)은
+      첫 인스턴스만 응답한다.
+    - 키보드/클립보드는 InputArbiter로 한 인스턴스씩 쓰므로, 한 인스턴스가
+      응답을 기다리는 동안 다른 인스턴스가 명령을 보낸다.
+    """
+
+    SHARED_COMMANDS = {"도움", "help", "지표", "확률"}
+
+    def __init__(self, slack):
+        self.slack = slack
+        self.bots = {}     # 이름 → GameBot
+        self._slacks = {}  # 이름 → InstanceSlack
+
+    def slack_for(self, name: str) -> InstanceSlack:
+        """인스턴스가 쓸 Slack (GameBot 생성 전에 호출)"""
+        if name not in self._slacks:
+            self._slacks[name] = InstanceSlack(self.slack, name)
+        return self._slacks[name]
+
+    def add(self, name: str, bot):
+        if name in self.bots:
+            raise ValueError(f"인스턴스 이름 중복: {name}")
+        self.bots[name] = bot
+
+    def route(self, command: str):
+        """Slack 명령을 대상 인스턴스(들)의 대기열로 전달"""
+        parts = command.strip().split()
+        if not parts:
+            return
+        if parts[0] == "!목록":
+            self._show_instances()
+            return
+
+        if len(parts) > 1 and parts[-1] in self.bots:
+            names = [parts[-1]]
+            command = ' '.join(parts[:-1])
+        elif parts[0][1:] in self.SHARED_COMMANDS:
+            names = list(self.bots)[:1]
+        else:
+            names = list(self.bots)
+
+        for name in names:
+            handler = self._slacks[name].command_handler
+            if handler:
+                handler(command)
+
+    def _show_instances(self):
+        lines = ["🗂️ *인스턴스 목록*"]
+        for name, bot in self.bots.items():
+            status = "중단" if bot.paused else "실행 중"
+            lines.append(f"• {name}: {status} ({bot.strategy.__class__.__name__})")
+        self.slack.send_message('\n'.join(lines))
+
+    def stop(self):
+        for bot in self.bots.values():
+            bot.stop()
+
+    def run(self):
+        """모든 인스턴스를 각자 스레드에서 실행, 모두 종료될 때까지 대기"""
+        self.slack.set_command_handler(self.route)
+        self.slack.start()
+        self.slack.send_message(
+            f"🗂️ 인스턴스 {len(self.bots)}개: {', '.join(self.bots)}\n"
+            "`!시작 이름`처럼 끝에 이름을 붙이면 해당 인스턴스에만 적용됩니다."
+        )
+
+        threads = [
+            threading.Thread(target=bot.run, name=f"bot-{name}", daemon=True)
+            for name, bot in self.bots.items()
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            # join(timeout)으로 기다려야 메인 스레드가 Ctrl+C를 받는다
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in threads:
+                thread.join(10)
+        finally:
+            self.slack.stop()
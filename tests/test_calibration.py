@@ -0,0 +1,60 @@
+import pytest
+from infrastructure.calibration import DelayProfile
+
+
+def test_calibration_settles_lost_step_and_persists(tmp_path):
+    path = tmp_path / "profile.json"
+    profile = DelayProfile({'before': 0.3}, path=str(path))
+
+    profile.landed(0.2)  # 첫 단계(before) 축소
+    assert profile.get('before') == pytest.approx(0.24)
+
+    profile.lost()  # 축소한 값에서 유실 → 되돌리고 확정
+    assert profile.get('before') == pytest.approx(0.3)
+    assert 'before' in profile.settled
+
+    # 나머지 단계가 최소값에 닿을 때까지 성공
+    while not profile.calibrated:
+        profile.landed(0.2)
+    assert profile.get('before') == pytest.approx(0.3)
+    assert profile.get('after') == pytest.approx(0.02)
+    assert path.exists()
+
+    loaded = DelayProfile({'before': 0.3}, path=str(path))
+    assert loaded.calibrated
+    assert loaded.delays == profile.delays
+
+
+def test_loss_after_calibration_grows_delays():
+    profile = DelayProfile({}, streak=2)
+    profile.calibrated = True
+    before = dict(profile.delays)
+
+    profile.lost()
+    assert all(profile.delays[s] > before[s] for s in before)
+
+    profile.landed(0.1)
+    profile.landed(0.1)
+    assert all(profile.delays[s] >= profile.floors[s] for s in before)
+
+
+def test_adjustments_and_progress_survive_restart(tmp_path):
+    path = str(tmp_path / "profile.json")
+    profile = DelayProfile({}, path=path, streak=2)
+    profile.landed(0.2)
+    profile.landed(0.2)  # 보정 중 - 두 단계 축소
+    resumed = DelayProfile({}, path=path, streak=2)
+    assert not resumed.calibrated
+    assert resumed.delays == profile.delays
+    assert resumed._last_change == profile._last_change
+    assert resumed._turn == profile._turn
+
+    while not resumed.calibrated:
+        resumed.landed(0.2)
+    resumed.lost()  # 보정 후 유실 → 늘림 (저장됨)
+    grown = dict(resumed.delays)
+    restarted = DelayProfile({}, path=path, streak=2)
+    assert restarted.calibrated
+    assert restarted.delays == grown
+    assert restarted.floors == resumed.floors
+    assert restarted.echo_latency == pytest.approx(0.2)
@@ -0,0 +1,35 @@
+"""채팅 스냅샷 변화 감지 테스트"""
+from infrastructure.change_detector import ChangeDetector
+
+CHAT = '\n'.join(f"[플레이봇] [오후 3:{i:02d}] 〖✨강화 성공✨ +{i} → +{i + 1}〗"
+                 for i in range(20))
+
+
+def test_first_snapshot_and_append_are_changes():
+    detector = ChangeDetector()
+    assert detector.changed(CHAT)
+    assert not detector.changed(CHAT)
+    assert not detector.changed(str(CHAT))
+
+    appended = CHAT + "\n[나] [오후 3:21] /강화"
+    assert detector.changed(appended)
+    assert not detector.changed(appended)
+
+
+def test_same_length_edit_in_tail_is_a_change():
+    detector = ChangeDetector()
+    detector.changed(CHAT)
+    # 길이는 같고 마지막 줄 끝 글자만 바뀐 스냅샷
+    edited = CHAT[:-2] + "99"
+    assert len(edited) == len(CHAT)
+    assert detector.changed(edited)
+    assert not detector.changed(edited)
+
+
+def test_reset_forces_next_snapshot_to_count_as_change():
+    detector = ChangeDetector()
+    detector.changed(CHAT)
+    assert not detector.changed(CHAT)
+    detector.reset()
+    assert detector.changed(CHAT)
+    assert not detector.changed(CHAT)
@@ -0,0 +1,188 @@
+"""명령 응답 추적/재전송 테스트"""
+from domain.state import ChatbotState, GameState, Weapon
+from domain.strategy.strategies import SpecialWeaponFarming
+from infrastructure.command_tracker import CommandTracker
+from infrastructure.parser import ChatParser
+from main import GameBot
+from simulation import transcript
+from simulation.game import SimulatedGame
+from simulation.runner import NullSlack
+
+SPECIAL = ["짝짝이 해진 슬리퍼"]
+CONFIG = {
+    'special_weapons': SPECIAL,
+    'strategies': {
+        'special_farming': {'target_level': 5, 'safe_money': [0] * 20},
+    },
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def state(gold: int, bot_state=ChatbotState.SUCCESS) -> GameState:
+    return GameState(gold, Weapon("검", 1, False), bot_state)
+
+
+def test_matches_reply_and_records_latency():
+    clock = Clock()
+    tracker = CommandTracker(clock=clock)
+    before = state(1_000)
+    chat = transcript.kept(1, "검", 1_000, 10, 600)
+    tracker.sent("강화", before, chat)
+
+    clock.now = 1.5
+    assert tracker.observe(before, chat) is None  # 아직 이전 결과 채팅
+    chat += '\n' + transcript.command("강화", 601)
+    assert tracker.observe(state(1_000, ChatbotState.PROCESSING), chat) is None
+    assert tracker.echoed
+    # 응답 직후 다른 사람이 채팅해 마지막 채팅이 봇이 아니어도 응답
+    chat += '\n' + transcript.kept(1, "검", 990, 10, 601) + '\n' + \
+        transcript.chatter("ㅋㅋ", 601, player="구경꾼")
+    reply = tracker.observe(state(990, ChatbotState.PROCESSING), chat)
+    assert (reply.cmd, reply.before, reply.latency) == ("강화", before, 1.5)
+    assert not tracker.waiting
+    assert tracker.observe(state(980), chat) is None
+    assert tracker.rtt.count == 1
+
+
+def test_does_not_resend_command_whose_echo_landed():
+    """에코가 있으면 응답이 없어도 다시 보내지 않음 (/강화 중복 방지)"""
+    clock = Clock()
+    tracker = CommandTracker(timeout=120, clock=clock)
+    chat = transcript.kept(1, "검", 1_000, 10, 600)
+    tracker.sent("강화", state(1_000), chat)
+    chat += '\n' + transcript.command("강화", 601) + '\n' + \
+        transcript.chatter("ㅋㅋ", 601, player="구경꾼")
+    assert tracker.observe(state(1_000, ChatbotState.PROCESSING), chat) is None
+
+    clock.now = 119
+    assert tracker.overdue() is None and tracker.waiting
+    clock.now = 121
+    assert tracker.overdue() is None
+    assert not tracker.waiting
+    assert (tracker.resends, tracker.unanswered) == (0, 1)
+
+
+def test_resends_with_backoff_then_gives_up():
+    clock = Clock()
+    tracker = CommandTracker(timeout=10, backoff=2, max_timeout=30,
+                             max_resends=3, clock=clock)
+    tracker.sent("판매", state(1_000))
+
+    resent = []
+    for now in range(0, 200):
+        clock.now = now
+        if tracker.overdue():
+            resent.append(now)
+    # 10초 후, 다시 20초 후, 이후 30초(max_timeout)마다
+    assert resent == [10, 30, 60]
+    assert tracker.resends == 3
+    assert tracker.gave_up == 1
+    assert not tracker.waiting
+
+
+class LossyGame(SimulatedGame):
+    """처음 명령 하나는 입력이 유실된 것처럼 무시"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dropped = 0
+
+    def send_command(self, cmd: str) -> None:
+        if not self.dropped:
+            self.dropped += 1
+            return
+        super().send_command(cmd)
+
+
+def test_gamebot_waits_for_reply_and_resends_stalled_command():
+    clock = Clock()
+    game = LossyGame(SPECIAL, seed=1)
+    bot = GameBot(
+        strategy=SpecialWeaponFarming(CONFIG['strategies']['special_farming']),
+        parser=ChatParser(set(SPECIAL), tail=True),
+        automation=game,
+        slack=NullSlack(),
+        config=CONFIG,
+        interval=0,
+        tracker=CommandTracker(timeout=5, clock=clock),
+    )
+    bot.running, bot.paused = True, False
+
+    assert bot.tick()             # 첫 /강화 - 유실
+    assert bot.tracker.waiting
+    assert not bot.tick()         # 채팅 변화 없음
+    bot._resend_if_stalled()
+    assert game.commands == 0
+
+    clock.now = 6
+    bot._resend_if_stalled()      # 재전송 → 응답
+    assert game.commands == 1
+    assert bot.metrics.count('commands_resent') == 1
+
+    clock.now = 7.5
+    assert bot.tick()             # 응답 확인 후 다음 명령
+    assert bot.tracker.rtt.count == 1
+    assert bot.tracker.rtt.max == 1.5
+    assert game.commands == 2
+
+    bot._handle_slack_command("!상태")
+    assert "⏱️ 응답: p50" in bot.slack.messages[-1]
+    assert "재전송 1" in bot.slack.messages[-1]
+
+
+def test_strategy_waits_while_echo_is_last_chat():
+    clock = Clock()
+    chat = '\n'.join([
+        transcript.sold(0, 1_000, "낡은 검", 600),
+        transcript.command("강화", 601),
+    ])
+
+    class Echo:
+        sent = []
+
+        def get_chat(self):
+            return chat
+
+        def send_command(self, cmd):
+            self.sent.append(cmd)
+
+    bot = GameBot(
+        strategy=SpecialWeaponFarming(CONFIG['strategies']['special_farming']),
+        parser=ChatParser(set(SPECIAL), tail=True),
+        automation=Echo(),
+        slack=NullSlack(),
+        config=CONFIG,
+        interval=0,
+        tracker=CommandTracker(clock=clock),
+    )
+    bot.tracker.sent("강화", None, transcript.sold(0, 1_000, "낡은 검", 600))
+    bot.running, bot.paused = True, False
+    assert bot.tick()
+    assert bot.state.bot_state == ChatbotState.PROCESSING
+    assert Echo.sent == []
+
+
+def test_outcome_log_uses_tracker_replies():
+    """결과 기록/지연은 tracker가 짝지은 /강화 응답과 하나씩 대응"""
+    from simulation.runner import simulate
+
+    class Log:
+        rows = []
+
+        def record(self, **row):
+            self.rows.append(row)
+
+    game = SimulatedGame(SPECIAL, seed=2)
+    bot = simulate(SpecialWeaponFarming(CONFIG['strategies']['special_farming']),
+                   CONFIG, game, commands=300, outcome_log=Log())
+    assert bot.tracker.rtt.count >= game.commands - 1  # 마지막 명령은 응답 전에 멈출 수 있음
+    assert game.enforces - 1 <= len(Log.rows) <= game.enforces
+    assert all(row['latency'] is not None for row in Log.rows)
+    assert all(row['gold_after'] != row['gold_before'] for row in Log.rows)
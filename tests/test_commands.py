@@ -0,0 +1,27 @@
+from infrastructure.commands import CommandQueue, RecentIds
+
+
+def test_recent_ids_drops_redelivery_and_forgets_oldest():
+    ids = RecentIds(max_size=2)
+
+    assert ids.seen("env-1", "Ev1") is False
+    assert ids.seen("env-2", "Ev1") is True   # 같은 이벤트 재전송
+    assert ids.seen("env-3", None) is False
+
+    # 크기 제한으로 가장 오래된 ID는 잊음
+    assert ids.seen("env-1") is False
+
+
+def test_command_queue_runs_in_order_and_tracks_stats():
+    queue = CommandQueue(max_size=2)
+    assert queue.put("!시작")
+    assert queue.put("!상태")
+    assert queue.put("!중단") is False
+
+    handled = []
+    assert queue.drain(handled.append) == 2
+
+    assert handled == ["!시작", "!상태"]
+    assert queue.depth == 0
+    assert queue.processed == 2
+    assert queue.dropped == 1
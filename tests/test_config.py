@@ -0,0 +1,106 @@
+"""설정 다시 로드 테스트"""
+import os
+import shutil
+
+import pytest
+import yaml
+
+from config import Config, validate
+from domain.strategy.strategies import SpecialWeaponFarming
+from infrastructure.parser import ChatParser
+from main import GameBot
+from simulation.game import SimulatedGame
+from simulation.runner import NullSlack
+
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    shutil.copy(CONFIG_FILE, path)
+    return path
+
+
+def edit(path, change, mtime):
+    with open(path, encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    change(data)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(data, f, allow_unicode=True)
+    os.utime(path, (mtime, mtime))
+
+
+def make_bot(config):
+    special_weapons = set(config['special_weapons'])
+    return GameBot(
+        strategy=SpecialWeaponFarming(
+            config['strategies']['special_farming']
+        ),
+        parser=ChatParser(special_weapons, tail=True),
+        automation=SimulatedGame(special_weapons),
+        slack=NullSlack(),
+        config=config,
+        interval=0.5,
+    )
+
+
+@pytest.mark.parametrize('change', [
+    lambda d: d.update(special_weapons="슬리퍼"),
+    lambda d: d['bot'].update(min_interval=5, max_interval=1),
+    lambda d: d['strategies']['special_farming'].update(safe_money=[]),
+    lambda d: d['automation']['delays'].update(paste=-1),
+    lambda d: d.pop('strategies'),
+])
+def test_validate_rejects_invalid_config(config_path, change):
+    data = Config(str(config_path)).data
+    change(data)
+    with pytest.raises(ValueError):
+        validate(data)
+
+
+def test_reload_swaps_components_between_ticks(config_path):
+    config = Config(str(config_path))
+    bot = make_bot(config)
+    old_parser = bot.parser
+
+    def change(data):
+        data['special_weapons'] = ["새 특수 무기"]
+        data['strategies']['special_farming']['target_level'] = 7
+        data['bot'].update(min_interval=0.3, max_interval=3.0)
+    edit(config_path, change, 1)
+
+    bot._config_checked = float('-inf')
+    bot._check_config()
+
+    assert config.version == 1
+    assert bot.parser is not old_parser
+    assert bot.parser.special_weapons == {"새 특수 무기"}
+    assert bot.strategy.config['target_level'] == 7
+    assert bot.scheduler.max_interval == 3.0
+    assert bot.slack.messages[-1] == "🔄 설정 다시 로드 완료"
+
+    # 같은 Config를 쓰는 다른 인스턴스도 다음 확인 때 반영
+    other = make_bot(config)
+    other._config_version = 0
+    other._config_checked = float('-inf')
+    other._check_config()
+    assert other.scheduler.min_interval == 0.3
+
+
+def test_invalid_reload_keeps_previous_config(config_path):
+    config = Config(str(config_path))
+    bot = make_bot(config)
+    parser, strategy_config = bot.parser, bot.strategy.config
+
+    edit(config_path, lambda d: d['bot'].update(interval="빠르게"), 1)
+    bot._handle_slack_command("!설정 리로드")
+
+    assert config.version == 0
+    assert config['bot']['interval'] == 0.5
+    assert bot.parser is parser
+    assert bot.strategy.config is strategy_config
+    assert bot.slack.messages[-1].startswith("⚠️ 설정 오류")
+
+    # 잘못된 파일은 다시 수정될 때까지 재시도하지 않음
+    assert not config.changed()
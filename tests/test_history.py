@@ -0,0 +1,81 @@
+"""상태 모델/최근 상태 기록 테스트"""
+import dataclasses
+
+import pytest
+
+from domain.history import StateHistory
+from domain.state import ChatbotState, GameState, Weapon
+from domain.strategy.strategies import SpecialWeaponFarming
+from infrastructure.parser import ChatParser
+from simulation.game import SimulatedGame
+from simulation.runner import simulate
+
+SPECIAL = ["짝짝이 해진 슬리퍼"]
+CONFIG = {
+    'special_weapons': SPECIAL,
+    'strategies': {
+        'special_farming': {'target_level': 5, 'safe_money': [0] * 20},
+    },
+}
+
+
+def state(level: int, gold: int, bot_state=ChatbotState.SUCCESS):
+    return GameState(gold, Weapon("검", level, False), bot_state)
+
+
+def test_state_objects_are_compact_and_immutable():
+    a = state(3, 1_000)
+    assert not hasattr(a, '__dict__')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.gold = 0
+    assert a == state(3, 1_000)
+
+    parser = ChatParser(set(SPECIAL), tail=True)
+    game = SimulatedGame(SPECIAL, seed=1)
+    first = parser.parse(game.get_chat()).weapon.name
+    assert parser.parse(game.get_chat()).weapon.name is first
+
+    assert ChatbotState.FAILED.label == "파괴"
+    assert ChatbotState(int(ChatbotState.SELL)) is ChatbotState.SELL
+    assert all(ChatbotState)  # 0(상태 없음) 코드는 쓰지 않음
+
+
+def test_ring_buffer_keeps_last_n_in_fixed_memory():
+    history = StateHistory(capacity=4)
+    sizes = [len(history.golds), len(history.times)]
+    for i in range(10):
+        history.append(state(i, 1_000 + i, ChatbotState.REMAINED), t=i)
+
+    assert len(history) == 4
+    assert [len(history.golds), len(history.times)] == sizes
+    assert history[-1] == (9, 1_009, ChatbotState.REMAINED, 9.0)
+    assert history[0] == (6, 1_006, ChatbotState.REMAINED, 6.0)
+    assert history.level() == 9 and history.gold(-2) == 1_008
+    assert history.state(0) is ChatbotState.REMAINED
+    assert [entry[0] for entry in history] == [6, 7, 8, 9]
+    assert [entry[0] for entry in history.recent(2)] == [8, 9]
+    with pytest.raises(IndexError):
+        history[4]
+    with pytest.raises(IndexError):
+        history[-5]
+
+
+def test_gold_rate_uses_only_recent_window():
+    history = StateHistory()
+    history.append(state(0, 0), t=0)
+    for minute in range(1, 121):
+        # 처음 한 시간은 분당 +100G, 이후 분당 +10G
+        gold = history.gold() + (100 if minute <= 60 else 10)
+        history.append(state(0, gold), t=minute * 60)
+    assert history.gold_rate(3600) == pytest.approx(600)
+    assert history.gold_rate(7200) == pytest.approx(3300)
+
+
+def test_gamebot_records_every_parsed_tick():
+    history = StateHistory(capacity=50)
+    bot = simulate(SpecialWeaponFarming(CONFIG['strategies']['special_farming']),
+                   CONFIG, SimulatedGame(SPECIAL, seed=4), commands=200,
+                   history=history)
+    assert len(history) == 50
+    assert history[-1][:3] == (bot.state.weapon.level, bot.state.gold,
+                               bot.state.bot_state)
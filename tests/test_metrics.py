@@ -0,0 +1,49 @@
+"""지표 테스트"""
+import urllib.request
+
+from infrastructure.metrics import Histogram, Metrics, MetricsExporter
+
+
+def test_histogram_quantiles():
+    h = Histogram(buckets=(1, 2, 4, 8))
+    for value in [0.5] * 50 + [3] * 45 + [6] * 4 + [100]:
+        h.observe(value)
+
+    assert h.count == 100
+    assert 0 < h.quantile(0.5) <= 1
+    assert 2 < h.quantile(0.95) <= 4
+    assert 4 < h.quantile(0.99) <= 8
+    assert h.quantile(1.0) == 100
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_render_prometheus_text():
+    metrics = Metrics(buckets=(0.1, 1))
+    metrics.observe('parse', 0.05)
+    metrics.observe('parse', 0.5)
+    metrics.inc('commands_sent', 3)
+    with metrics.span('tick'):
+        pass
+
+    text = metrics.render()
+    assert 'playbot_stage_seconds_bucket{stage="parse",le="0.1"} 1' in text
+    assert 'playbot_stage_seconds_bucket{stage="parse",le="+Inf"} 2' in text
+    assert 'playbot_stage_seconds_count{stage="parse"} 2' in text
+    assert 'playbot_stage_seconds_count{stage="tick"} 1' in text
+    assert 'playbot_commands_sent_total 3' in text
+    assert '`parse` 2회' in metrics.summary()
+
+
+def test_exporter_http_and_file(tmp_path):
+    metrics = Metrics()
+    metrics.inc('ticks_skipped')
+    path = tmp_path / "metrics.prom"
+    exporter = MetricsExporter(metrics, port=0, path=str(path), interval=60)
+    exporter.start()
+    try:
+        url = f"http://127.0.0.1:{exporter.port}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert b'playbot_ticks_skipped_total 1' in response.read()
+    finally:
+        exporter.stop()
+    assert 'playbot_ticks_skipped_total 1' in path.read_text(encoding='utf-8')
@@ -0,0 +1,95 @@
+"""몬테카를로 평가 테스트"""
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from domain.policy_table import PolicyTable
+from domain.rates import GameRates
+from domain.state import ChatbotState, GameState, Weapon
+from domain.strategy.strategies import (
+    PolicyTableStrategy, SpecialWeaponFarming, TargetEnforcementStrategy,
+)
+from simulation.monte_carlo import (
+    DONE, ENFORCE, SELL, STOP, evaluate, policy_for,
+)
+
+SPECIAL_CONFIG = {
+    'target_level': 6,
+    'safe_money': [0, 0, 20, 60, 200, 700, 2000, 7000, 20000, 50000],
+}
+TARGET_CONFIG = {
+    'target_level': 7,
+    'required_money_per_level': [0, 10, 20, 50, 100, 200, 500, 1000, 2000],
+}
+
+
+class RecordingBot:
+    """전략이 고른 행동 기록"""
+
+    def __init__(self, state):
+        self.state = state
+        self.action = None
+
+    def enforce(self):
+        self.action = ENFORCE
+
+    def sell(self):
+        self.action = SELL
+
+    def stop(self):
+        self.action = STOP
+
+    def pause(self):
+        self.action = DONE
+
+
+@pytest.mark.parametrize("strategy", [
+    SpecialWeaponFarming(SPECIAL_CONFIG),
+    TargetEnforcementStrategy(TARGET_CONFIG),
+    PolicyTableStrategy({}, PolicyTable(
+        ["SSEE", "SEEE", "SSSE", "SSSS"], ["SEEE", "SEEE", "SSEE", "SESE"])),
+])
+def test_policy_matches_strategy(strategy):
+    grid = list(itertools.product(range(9), [0, 15, 100, 5000, 10**6],
+                                  [False, True]))
+    expected = []
+    for level, gold, special in grid:
+        bot = RecordingBot(GameState(
+            gold, Weapon("검", level, special), ChatbotState.SUCCESS))
+        strategy.do_step(bot)
+        expected.append(bot.action)
+
+    level, gold, special = (np.array(v) for v in zip(*grid))
+    actions = policy_for(strategy)(level, gold, special)
+    assert actions.tolist() == expected
+
+
+def test_deterministic_rates():
+    # 항상 성공하는 확률로 결과 계산 가능
+    rates = GameRates(success=[1.0], destroy=[0.0], cost=[10],
+                      price=[0, 0, 0, 0, 0, 0, 1000], special_rate=0.0)
+    config = {'target_level': 6, 'safe_money': [0] * 10}
+    result = evaluate(policy_for(SpecialWeaponFarming(config)),
+                      rates, sessions=10, steps=70, gold=1000)
+    # +1 일반 무기는 바로 판매 (가격 0) → 2명령마다 -10G
+    assert (result.final_gold == 1000 - 35 * 10).all()
+    assert result.bankruptcy_probability == 0.0
+    assert np.allclose(result.time_to_target, np.nan, equal_nan=True)
+
+    rates.special_rate = 1.0
+    result = evaluate(policy_for(SpecialWeaponFarming(config)),
+                      rates, sessions=10, steps=70, gold=1000)
+    # 특수 무기 (판매가 3배): 강화 6번 + 판매 1번 반복
+    assert (result.final_gold == 1000 + 10 * (3000 - 60)).all()
+    assert np.allclose(result.time_to_target, 6 * 3.0 / 3600)
+
+
+def test_bankruptcy():
+    rates = GameRates(success=[0.0], destroy=[0.0], cost=[10])
+    result = evaluate(policy_for(TargetEnforcementStrategy(TARGET_CONFIG)),
+                      rates, sessions=100, steps=50, gold=95)
+    assert result.bankruptcy_probability == 1.0
+    assert (result.final_gold == 5).all()
+    assert np.allclose(result.hours, 9 * 3.0 / 3600)
@@ -0,0 +1,24 @@
+"""강화 결과 기록 테스트"""
+from infrastructure.outcome_log import OutcomeLog
+
+
+def test_record_query_and_stats(tmp_path):
+    log = OutcomeLog(str(tmp_path / "outcomes.db"), batch_size=2)
+    log.start()
+    log.record("성공", 3, 4, "녹슨 철검", False, 1000, 900, 0.5, ts=100)
+    log.record("유지", 4, 4, "녹슨 철검", False, 900, 700, ts=200)
+    log.record("파괴", 4, 0, "금이 간 단소", True, 700, 500, ts=300)
+    assert log.flush(5)
+
+    rows = log.query(level=4)
+    assert [r['result'] for r in rows] == ["유지", "파괴"]
+    assert rows[1]['weapon'] == "금이 간 단소" and rows[1]['is_special'] == 1
+    assert [r['ts'] for r in log.query(since=150, until=300)] == [200]
+    assert log.level_stats() == {3: {"성공": 1}, 4: {"유지": 1, "파괴": 1}}
+
+    assert log.prune(before=250) == 2
+    log.stop()
+
+    # 다시 열어도 기록 유지
+    reopened = OutcomeLog(str(tmp_path / "outcomes.db"))
+    assert [r['result'] for r in reopened.query()] == ["파괴"]
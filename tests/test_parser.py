@@ -1,6 +1,8 @@
+import re
+
 import pytest
 from infrastructure.parser import ChatParser
-from domain.state import ChatbotState
+from domain.state import ChatbotState, GameState, Weapon
 
 # 특수 무기 목록
 SPECIAL_WEAPONS = {
@@ -24,7 +26,7 @@ SPECIAL_WEAPONS = {
 def parser():
     return ChatParser(SPECIAL_WEAPONS)
 
-@pytest.mark.parametrize("name, text, expected_state, expected_level, expected_gold, expected_weapon_name, expected_is_special", [
+PARSE_CASES = [
     (
         "강화 성공 (+10 미만)",
         """[플레이봇] [오후 12:32] @사용자 〖✨강화 성공✨ +0 → +1〗
@@ -100,7 +102,10 @@ def parser():
 [플레이봇] [오후 12:32] 💬 감정사: "뭐 검이 필요하면 이거나 가져가시게나." """,
         ChatbotState.SELL, 0, 132594456, "낡은 검", False
     ),
-])
+]
+
+
+@pytest.mark.parametrize("name, text, expected_state, expected_level, expected_gold, expected_weapon_name, expected_is_special", PARSE_CASES)
 def test_parse_cases(parser, name, text, expected_state, expected_level, expected_gold, expected_weapon_name, expected_is_special):
     result = parser.parse(text)
     
@@ -109,3 +114,113 @@ def test_parse_cases(parser, name, text, expected_state, expected_level, expecte
     assert result.gold == expected_gold
     assert result.weapon.name == expected_weapon_name
     assert result.weapon.is_special == expected_is_special
+
+
+def test_tail_parse_matches_full_parse():
+    """끝에서부터 파싱해도 채팅이 한 줄씩 추가될 때 전체 파싱과 결과가 같다"""
+    transcript = '\n'.join(case[1] for case in PARSE_CASES)
+    lines = transcript.split('\n')
+    tail = ChatParser(SPECIAL_WEAPONS, tail=True)
+    full = ChatParser(SPECIAL_WEAPONS)
+
+    for i in range(1, len(lines) + 1):
+        snapshot = '\n'.join(lines[:i])
+        assert tail.parse(snapshot) == full.parse(snapshot)
+
+
+def test_tail_chats_match_split_chats(parser):
+    """끝에서부터 분리한 채팅은 전체 분리의 마지막 3개와 같아야 한다"""
+    transcript = "입장 메시지\n[테스트\n" + '\n'.join(
+        case[1] for case in PARSE_CASES)
+    tail = ChatParser(SPECIAL_WEAPONS, tail=True)
+
+    for i in range(1, len(transcript) + 1, 7):
+        snapshot = transcript[:i]
+        assert parser._tail_chats(snapshot) == \
+            parser._split_chats(snapshot)[-3:]
+        if parser._split_chats(snapshot):
+            assert tail.parse(snapshot) == parser.parse(snapshot)
+
+
+class LegacyExtractor:
+    """항목별 _extract_* 구현 (우선순위 검색 생략 없음) - 결과 비교 기준"""
+
+    ENFORCE = re.compile(r'〖.*강화 (성공|파괴|유지).*〗')
+    GOLD = re.compile(r'(?:남은|보유|현재 보유) 골드: ([0-9,]+)G')
+    SELL = re.compile(r'〖검 판매〗')
+    LEVEL = re.compile(r'\+(\d+)\s*→\s*\+(\d+)')
+    SWORD = re.compile(r'⚔️획득 검: \[\+\d+\] (.+)')
+    SWORD_NEW = re.compile(r'⚔️새로운 검 획득: \[\+\d+\] (.+)')
+    KEPT_WEAPON = re.compile(r'『\[\+(\d+)\] (.+?)』')
+    DESTROY_GIVEN = re.compile(
+        r'산산조각 나서, 『\[\+(\d+)\] (.+?)』 지급되었습니다')
+
+    def gold(self, text):
+        m = self.GOLD.search(text)
+        return int(m.group(1).replace(',', '')) if m else 0
+
+    def weapon(self, text):
+        name, level = "낡은 검", 0
+        if m := self.LEVEL.search(text):
+            level = int(m.group(2))
+            if sword_m := self.SWORD.search(text):
+                name = sword_m.group(1)
+            elif sword_new_m := self.SWORD_NEW.search(text):
+                name = sword_new_m.group(1)
+        elif '산산조각' in text:
+            if destroy_m := self.DESTROY_GIVEN.search(text):
+                level, name = int(destroy_m.group(1)), destroy_m.group(2)
+        elif '레벨이 유지' in text:
+            if kept_m := self.KEPT_WEAPON.search(text):
+                level, name = int(kept_m.group(1)), kept_m.group(2)
+        elif sword_new_m := self.SWORD_NEW.search(text):
+            name = sword_new_m.group(1)
+        return level, name
+
+    def state(self, last_chat, text):
+        if not last_chat.startswith('[플레이봇]'):
+            return ChatbotState.PROCESSING
+        if self.SELL.search(text):
+            return ChatbotState.SELL
+        if m := self.ENFORCE.search(text):
+            return ChatParser.RESULTS[m.group(1)]
+        return ChatbotState.IDLE
+
+
+def _legacy_parse(parser, text):
+    """패턴별 개별 검색 경로로 파싱"""
+    legacy = LegacyExtractor()
+    chats = parser._split_chats(text)
+    combined = '\n'.join(c for c in chats[-3:] if '[플레이봇]' in c)
+    level, name = legacy.weapon(combined)
+    return GameState(
+        gold=legacy.gold(combined),
+        weapon=Weapon(name, level, parser._check_special(name)),
+        bot_state=legacy.state(chats[-1], combined)
+    )
+
+
+@pytest.mark.parametrize("text", [
+    *(case[1] for case in PARSE_CASES),
+    "[플레이봇] [오후 1:00] 『[+3] 산산조각 검』의 레벨이 유지되었습니다.",
+    "[플레이봇] [오후 1:00] 〖검 판매〗 〖✨강화 성공✨ +2 → +3〗\n💰남은 골드: 1,000G",
+    "[플레이봇] [오후 1:00] 레벨이 유지\n『[+4] 무딘 검』 산산조각 났군",
+    "[사용자] [오후 1:00] /강화",
+    "[플레이봇] [오후 1:00] 『[+3] 산산조각 검』 산산조각 나서, "
+    "『[+0] 낡은 검』 지급되었습니다.\n💰보유 골드: 5G 💰남은 골드: 7G",
+    "[플레이봇] [오후 1:00] 〖강화 유지 그리고 강화 파괴〗 +1 → +2\n"
+    "⚔️새로운 검 획득: [+0] 낡은 몽둥이\n⚔️획득 검: [+2] 녹슨 철검",
+    "[플레이봇] [오후 1:00] ⚔️새로운 검 획득: [+0] 낡은 망치",
+])
+def test_scan_matches_extract(parser, text):
+    """_scan(검색 생략)은 항목별 추출 결과와 같아야 한다"""
+    assert parser.parse(text) == _legacy_parse(parser, text)
+
+
+def test_scan_matches_legacy_on_generated_transcripts(parser):
+    from simulation.transcript import TranscriptGenerator
+
+    events = TranscriptGenerator(SPECIAL_WEAPONS, seed=5).events()
+    for _ in range(500):
+        text = next(events)
+        assert parser.parse(text) == _legacy_parse(parser, text)
@@ -0,0 +1,102 @@
+"""강화 확률 추정 테스트"""
+import os
+import random
+import threading
+
+import pytest
+
+from domain.rate_estimator import RateEstimator
+from domain.rates import GameRates
+from domain.state import ChatbotState, GameState, Weapon
+
+PRIOR = GameRates(success=[0.5], destroy=[0.1])
+
+
+def state(level: int, bot_state: ChatbotState, gold: int = 1000):
+    return GameState(gold, Weapon("검", level, False), bot_state)
+
+
+def feed(estimator, level, success, destroy, count, rng):
+    for _ in range(count):
+        roll = rng.random()
+        if roll < success:
+            index = 0
+        elif roll < success + destroy:
+            index = 2
+        else:
+            index = 1
+        estimator.add(level, index)
+
+
+def test_converges_and_interval_covers_true_rate():
+    estimator = RateEstimator(PRIOR, half_life=10_000)
+    feed(estimator, 3, 0.7, 0.05, 5000, random.Random(0))
+
+    success, keep, destroy = estimator.estimate(3)
+    assert success == pytest.approx(0.7, abs=0.03)
+    assert destroy == pytest.approx(0.05, abs=0.02)
+    assert success + keep + destroy == pytest.approx(1.0)
+    low, high = estimator.interval(3)
+    assert low < 0.7 < high and high - low < 0.05
+
+    # 관측 없는 레벨은 prior, 구간은 (0, 1)
+    assert estimator.estimate(9) == pytest.approx((0.5, 0.4, 0.1))
+    assert estimator.interval(9) == (0.0, 1.0)
+
+
+def test_decay_follows_rate_change():
+    estimator = RateEstimator(PRIOR, half_life=100)
+    rng = random.Random(1)
+    feed(estimator, 5, 0.9, 0.0, 1000, rng)
+    feed(estimator, 5, 0.3, 0.0, 1000, rng)
+    assert estimator.success(5) == pytest.approx(0.3, abs=0.1)
+    # 유효 관측 수는 반감기에 따라 제한
+    assert estimator.samples(5) < 200
+
+
+def test_observe_transitions_and_snapshot(tmp_path):
+    path = str(tmp_path / "rates.json")
+    estimator = RateEstimator(PRIOR, half_life=100, path=path)
+    estimator.observe(state(2, ChatbotState.SUCCESS),
+                      state(3, ChatbotState.SUCCESS))
+    estimator.observe(state(3, ChatbotState.SUCCESS),
+                      state(0, ChatbotState.FAILED))
+    estimator.observe(state(0, ChatbotState.FAILED),
+                      state(0, ChatbotState.SELL))  # 강화 결과 아님
+    assert not os.path.exists(path)  # 틱마다 저장하지 않음
+    estimator.save()
+
+    restored = RateEstimator(PRIOR, path=path)
+    assert restored.counts == {2: [1.0, 0.0, 0.0], 3: [0.0, 0.0, 1.0]}
+    assert restored.decay == estimator.decay  # 감쇠도 이어서
+    rates = restored.to_rates()
+    assert rates.success_at(2) == pytest.approx(restored.success(2))
+    assert rates.destroy_at(3) == pytest.approx(restored.destroy(3))
+
+
+def test_shared_between_threads(tmp_path):
+    path = tmp_path / "rates.json"
+    estimator = RateEstimator(PRIOR, path=str(path))
+    errors = []
+
+    def work(seed):
+        try:
+            rng = random.Random(seed)
+            for i in range(300):
+                estimator.add(rng.randrange(20), rng.randrange(3))
+                estimator.levels()
+                if i % 50 == 0:
+                    estimator.save()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    estimator.save()
+    assert RateEstimator(PRIOR, path=str(path)).levels() == \
+        estimator.levels()
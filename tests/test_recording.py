@@ -0,0 +1,116 @@
+"""녹화 파일(델타 저장) 테스트"""
+import json
+import random
+
+import pytest
+
+from infrastructure.recording import (
+    Recorder, RecordingReader, delta, read_recording,
+)
+from simulation.game import SimulatedGame
+from simulation.transcript import TranscriptGenerator
+
+SPECIAL = ["짝짝이 해진 슬리퍼"]
+
+
+def game_chats(count: int) -> list:
+    """채팅창이 넘쳐 앞부분이 잘려 나가는 스냅샷"""
+    game = SimulatedGame(SPECIAL, seed=2, max_chats=20)
+    chats = []
+    for i in range(count):
+        game.send_command("판매" if i % 9 == 8 else "강화")
+        chats.append(game.get_chat())
+    return chats
+
+
+def growing_chats(count: int) -> list:
+    """끝에 채팅이 추가되기만 하는 스냅샷"""
+    events = TranscriptGenerator(SPECIAL, seed=1).events()
+    text, chats = next(events), []
+    for _ in range(count):
+        text += '\n' + next(events)
+        chats.append(text)
+    return chats
+
+
+@pytest.mark.parametrize('chats', [game_chats(600), growing_chats(600)])
+@pytest.mark.parametrize('name', ["rec.jsonl", "rec.jsonl.gz"])
+def test_round_trip_and_random_access(tmp_path, chats, name):
+    path = str(tmp_path / name)
+    recorder = Recorder(path, keyframe_interval=100)
+    for i, chat in enumerate(chats):
+        recorder.record(chat, "강화" if i % 2 else None, t=float(i))
+    recorder.close()
+
+    assert recorder.chars_stored < recorder.chars_total * 0.2
+    assert [s.chat for s in read_recording(path)] == chats
+
+    reader = RecordingReader(path)
+    assert len(reader) == len(chats)
+    assert len(reader.index) >= len(chats) // 101
+    for number in random.Random(0).sample(range(len(chats)), 30):
+        snapshot = reader[number]
+        assert snapshot.chat == chats[number]
+        assert snapshot.t == float(number)
+        assert snapshot.action == ("강화" if number % 2 else None)
+    with pytest.raises(IndexError):
+        reader[len(chats)]
+
+
+def test_delta_handles_scroll_append_and_edit():
+    prev = "a\nb\nc\nd"
+    for chat in ["a\nb\nc\nd\ne", "c\nd\ne\nf", "x\ny", "", prev]:
+        start, end, added = delta(prev, chat)
+        assert prev[start:end] + added == chat
+
+
+def test_appends_to_existing_and_old_format_recordings(tmp_path):
+    path = tmp_path / "rec.jsonl"
+    # 키프레임만 있고 인덱스 파일이 없는 녹화
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(3):
+            f.write(json.dumps({'t': i, 'chat': f"채팅 {i}",
+                                'action': None}, ensure_ascii=False) + '\n')
+
+    recorder = Recorder(str(path))
+    assert recorder.count == 3
+    recorder.record("채팅 2\n채팅 3", t=3)
+    recorder.record("채팅 2\n채팅 3\n채팅 4", t=4)
+    recorder.close()
+
+    reader = RecordingReader(str(path))
+    assert [s.chat for s in reader][-1] == "채팅 2\n채팅 3\n채팅 4"
+    assert reader[1].chat == "채팅 1"
+    assert reader[4].chat == "채팅 2\n채팅 3\n채팅 4"
+    assert [number for number, _ in reader.index] == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize('name', ["rec.jsonl", "rec.jsonl.gz"])
+def test_unclosed_recording_is_readable_up_to_last_flush(tmp_path, name):
+    """강제 종료(close 없음) 후에도 flush된 스냅샷까지 읽고 이어서 녹화"""
+    path = str(tmp_path / name)
+    chats = game_chats(95)
+    recorder = Recorder(path, keyframe_interval=20, flush_every=10,
+                        flush_interval=float('inf'))
+    for i, chat in enumerate(chats):
+        recorder.record(chat, t=float(i))
+    # 닫지 않은 .gz는 스트림 끝이 없고, 일반 파일은 마지막 줄이 덜 쓰인 상태
+    if not name.endswith('.gz'):
+        with open(path, 'ab') as f:
+            f.write(b'{"t": 95.0, "s": 0')
+
+    reader = RecordingReader(path)
+    saved = [s.chat for s in reader]
+    assert len(saved) >= 90
+    assert saved == chats[:len(saved)]
+    # 인덱스는 flush된 데이터 안쪽만 가리킴
+    for number, _ in reader.index:
+        assert reader[number].chat == chats[number]
+
+    resumed = Recorder(path)
+    assert resumed.count == len(saved)
+    resumed.record("새 채팅", t=100.0)
+    resumed.close()
+    reader = RecordingReader(path)
+    assert [s.chat for s in reader] == saved + ["새 채팅"]
+    assert reader[len(saved)].chat == "새 채팅"
@@ -0,0 +1,68 @@
+"""녹화/재현 테스트"""
+from domain.strategy.strategies import SpecialWeaponFarming
+from infrastructure.recording import Recorder, Snapshot, read_recording
+from main import instance_path
+from simulation.game import SimulatedGame
+from simulation.replay import replay
+from simulation.runner import simulate
+
+SPECIAL = ["짝짝이 해진 슬리퍼", "금이 간 단소"]
+CONFIG = {
+    'special_weapons': SPECIAL,
+    'strategies': {
+        'special_farming': {'target_level': 5, 'safe_money': [0] * 20},
+    },
+}
+
+
+def record(path, commands=300):
+    recorder = Recorder(str(path))
+    strategy = SpecialWeaponFarming(dict(CONFIG['strategies']['special_farming']))
+    simulate(strategy, CONFIG, SimulatedGame(SPECIAL, seed=4),
+             commands=commands, recorder=recorder)
+    recorder.close()
+    return recorder.count
+
+
+def test_replay_of_same_strategy_matches_recording(tmp_path):
+    path = tmp_path / "recording.jsonl.gz"
+    count = record(path)
+
+    snapshots = list(read_recording(str(path)))
+    assert len(snapshots) == count > 0
+    assert {s.action for s in snapshots} >= {"강화", "판매"}
+
+    result = replay(iter(snapshots),
+                    SpecialWeaponFarming(CONFIG['strategies']['special_farming']),
+                    CONFIG)
+    assert result.snapshots == count
+    assert result.divergences == []
+
+
+def test_replay_reports_changed_decisions(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    record(path)
+
+    strategy = SpecialWeaponFarming({'target_level': 3, 'safe_money': [0] * 20})
+    result = replay(read_recording(str(path)), strategy, CONFIG)
+
+    assert result.divergences
+    first = result.divergences[0]
+    assert (first.recorded, first.replayed) == ("강화", "판매")
+    assert first.state.weapon.level >= 3
+    assert f"#{first.index} " in result.report()
+
+
+def test_parse_failure_is_replayed_as_no_action():
+    snapshots = [Snapshot(0.0, "잡담만 있음", None)]
+    result = replay(snapshots,
+                    SpecialWeaponFarming(CONFIG['strategies']['special_farming']),
+                    CONFIG)
+    assert result.snapshots == 1
+    assert result.divergences == []
+
+
+def test_instance_path():
+    assert instance_path("rec.jsonl.gz", "bot1") == "rec-bot1.jsonl.gz"
+    assert instance_path("profile.json", "bot1") == "profile-bot1.json"
+    assert instance_path("profile.json") == "profile.json"
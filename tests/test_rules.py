@@ -0,0 +1,148 @@
+"""규칙 기반 전략 테스트"""
+import os
+import random
+
+import pytest
+import yaml
+
+from domain.state import ChatbotState, GameState, Weapon
+from domain.strategy.registry import StrategyRegistry
+from domain.strategy.rules import RuleStrategy, compile_rules
+from domain.strategy.strategies import SpecialWeaponFarming
+
+RULES_FILE = os.path.join(os.path.dirname(__file__), '..', 'strategies.yaml')
+
+
+class FakeBot:
+    def __init__(self, state):
+        self.state = state
+        self.actions = []
+
+    def enforce(self):
+        self.actions.append('enforce')
+
+    def sell(self):
+        self.actions.append('sell')
+
+    def pause(self):
+        self.actions.append('pause')
+
+    def stop(self):
+        self.actions.append('stop')
+
+
+def step(strategy, state) -> list:
+    bot = FakeBot(state)
+    strategy.do_step(bot)
+    return bot.actions
+
+
+def test_special_rules_match_builtin_strategy():
+    with open(RULES_FILE, encoding='utf-8') as f:
+        rule_set = yaml.safe_load(f)['special_rules']
+    rules = RuleStrategy(rule_set)
+    builtin = SpecialWeaponFarming(rule_set)
+
+    rng = random.Random(0)
+    for _ in range(5000):
+        level = rng.randrange(20)
+        safe = rule_set['safe_money'][level]
+        gold = rng.choice([safe - 1, safe, safe + 1, rng.randrange(10**9)])
+        state = GameState(gold, Weapon("검", level, rng.random() < 0.3),
+                          rng.choice(list(ChatbotState)))
+        assert step(rules, state) == step(builtin, state)
+
+
+def test_first_matching_rule_wins_and_default_waits():
+    strategy = RuleStrategy({
+        'target_level': 5,
+        'rules': [
+            {'state': '수행중', 'action': 'wait'},
+            {'min_gold': 100, 'gold_below': 200, 'action': 'sell'},
+            {'min_level': 'target_level', 'action': 'pause'},
+            {'level': [0, 3], 'action': 'enforce'},
+        ],
+    })
+
+    def state(level, gold, bot_state=ChatbotState.SUCCESS):
+        return GameState(gold, Weapon("검", level, False), bot_state)
+
+    assert step(strategy, state(2, 50)) == ['enforce']
+    assert step(strategy, state(2, 150)) == ['sell']
+    assert step(strategy, state(2, 200)) == ['enforce']
+    assert step(strategy, state(4, 50)) == []
+    assert step(strategy, state(40, 50)) == ['pause']
+    assert step(strategy, state(2, 50, ChatbotState.PROCESSING)) == []
+
+    # !강화 N 으로 목표가 바뀌면 다시 컴파일
+    strategy.config['target_level'] = 4
+    assert step(strategy, state(4, 50)) == ['pause']
+
+
+@pytest.mark.parametrize('rules', [
+    [{'action': 'jump'}],
+    [{'levle': 3, 'action': 'sell'}],
+    [{'gold_below': 'missing', 'action': 'sell'}],
+    [{'state': '점심', 'action': 'sell'}],
+    [],
+])
+def test_invalid_rules_are_rejected(rules):
+    with pytest.raises(ValueError):
+        compile_rules({'rules': rules})
+
+
+def test_registry_reloads_changed_file_and_keeps_rules_on_error(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text("a:\n  rules:\n    - action: sell\n", encoding='utf-8')
+    registry = StrategyRegistry(str(path))
+    registry.register('builtin', lambda: SpecialWeaponFarming({}))
+
+    assert registry.reload()
+    assert not registry.reload()
+    assert registry.names() == ['builtin', 'a']
+
+    path.write_text("b:\n  rules:\n    - action: jump\n", encoding='utf-8')
+    os.utime(path, (1, 1))
+    with pytest.raises(ValueError):
+        registry.reload()
+    assert 'a' in registry and 'b' not in registry
+
+    path.write_text("b:\n  rules:\n    - action: enforce\n", encoding='utf-8')
+    os.utime(path, (2, 2))
+    assert registry.reload()
+    assert 'a' not in registry
+    state = GameState(10, Weapon("검", 0, False), ChatbotState.IDLE)
+    assert step(registry.create('b'), state) == ['enforce']
+    with pytest.raises(KeyError):
+        registry.create('a')
+
+
+def test_policy_strategy_without_numpy_keeps_current_strategy(monkeypatch):
+    """NumPy가 없으면 !전략 policy는 Slack으로 알리고 현재 전략 유지"""
+    import sys
+
+    from infrastructure.parser import ChatParser
+    from main import GameBot
+    from simulation.game import SimulatedGame
+    from simulation.runner import NullSlack
+
+    special = ["짝짝이 해진 슬리퍼"]
+    config = {
+        'special_weapons': special,
+        'strategies': {
+            'special_farming': {'target_level': 5, 'safe_money': [0] * 20},
+            'policy': {},
+        },
+    }
+    strategy = SpecialWeaponFarming(config['strategies']['special_farming'])
+    bot = GameBot(strategy=strategy, parser=ChatParser(set(special)),
+                  automation=SimulatedGame(special), slack=NullSlack(),
+                  config=config, interval=0)
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    monkeypatch.delitem(sys.modules, 'simulation.solver', raising=False)
+
+    bot._handle_slack_command("!전략 policy")
+    assert bot.strategy is strategy
+    assert "필요한 패키지가 없음" in bot.slack.messages[-1]
+    assert "[sim]" in bot.slack.messages[-1]
+    assert bot.create_strategy('policy') is strategy
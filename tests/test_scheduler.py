@@ -0,0 +1,25 @@
+import threading
+import time
+
+import pytest
+from infrastructure.scheduler import PollScheduler
+
+
+def test_backoff_and_reset():
+    scheduler = PollScheduler(0.1, 1.0, backoff=2.0)
+
+    for expected in (0.2, 0.4, 0.8, 1.0, 1.0):
+        scheduler.quiet()
+        assert scheduler.interval == pytest.approx(expected)
+
+    scheduler.command_sent()
+    assert scheduler.interval == 0.1
+
+
+def test_wake_interrupts_wait():
+    scheduler = PollScheduler(10.0, 10.0)
+    threading.Timer(0.05, scheduler.wake).start()
+
+    started = time.monotonic()
+    assert scheduler.wait() is True
+    assert time.monotonic() - started < 5.0
@@ -0,0 +1,128 @@
+"""오프라인 시뮬레이터 테스트"""
+import pytest
+
+from domain.rates import GameRates
+from domain.strategy.base import MacroMode
+from domain.strategy.strategies import (
+    SpecialWeaponFarming, TargetEnforcementStrategy,
+)
+from infrastructure.outcome_log import OutcomeLog
+from infrastructure.parser import ChatParser
+from simulation.game import SimulatedGame
+from simulation.runner import simulate
+
+class IdleStrategy(MacroMode):
+    def do_step(self, gamebot):
+        pass
+
+
+SPECIAL = ["짝짝이 해진 슬리퍼", "금이 간 단소"]
+CONFIG = {
+    'special_weapons': SPECIAL,
+    'strategies': {
+        'special_farming': {
+            'target_level': 5,
+            'safe_money': [0] * 20,
+        },
+        'target': {
+            'target_level': 6,
+            'required_money_per_level': [0] * 20,
+        },
+    },
+}
+
+
+def test_chat_matches_game_state():
+    game = SimulatedGame(SPECIAL, seed=3)
+    parser = ChatParser(set(SPECIAL))
+    for i in range(300):
+        game.send_command("판매" if i % 7 == 6 else "강화")
+        state = parser.parse(game.get_chat())
+        assert state.gold == game.gold
+        assert state.weapon.level == game.level
+        assert state.weapon.name == game.name
+        assert state.weapon.is_special == game.is_special
+    assert game.successes and game.kept and game.destroyed and game.sells
+
+
+def test_rates_validation():
+    with pytest.raises(ValueError):
+        GameRates(success=[0.8], destroy=[0.3])
+    rates = GameRates.from_dict({'success': [1.0], 'destroy': [0.0],
+                                 'unknown': 1})
+    assert rates.keep_at(5) == 0.0
+
+
+def test_bankrupt_stops_enforcing():
+    game = SimulatedGame(gold=15)
+    game.send_command("강화")
+    game.send_command("강화")
+    assert game.bankrupt
+    assert game.gold == 5
+
+
+def test_simulate_special_farming():
+    strategy = SpecialWeaponFarming(CONFIG['strategies']['special_farming'])
+    bot = simulate(strategy, CONFIG, commands=2000)
+    game = bot.automation
+    assert game.commands == 2000
+    assert game.sells > 0
+    assert bot.state.weapon.level <= 5
+
+
+def test_simulate_target_pauses_at_target():
+    strategy = TargetEnforcementStrategy(CONFIG['strategies']['target'])
+    game = SimulatedGame(SPECIAL, seed=1)
+    bot = simulate(strategy, CONFIG, game, commands=10_000)
+    assert bot.paused
+    assert game.level == 6
+
+
+def test_simulate_records_metrics():
+    strategy = SpecialWeaponFarming(CONFIG['strategies']['special_farming'])
+    bot = simulate(strategy, CONFIG, commands=100)
+    metrics = bot.metrics
+    assert metrics.count('commands_sent') == 100
+    assert bot.ticks_processed == 100
+    for stage in ('get_chat', 'parse', 'do_step', 'send_command'):
+        assert metrics.histograms[stage].count >= 100
+
+    # 파싱 실패는 세고 건너뜀
+    bot.automation.get_chat = lambda: "깨진 채팅"
+    bot.parser.parse = lambda text: 1 / 0
+    assert bot.tick() is False
+    assert metrics.count('parse_failures') == 1
+
+
+def test_simulate_logs_every_enforce_outcome(tmp_path):
+    log = OutcomeLog(str(tmp_path / "outcomes.db"))
+    log.start()
+    strategy = SpecialWeaponFarming(CONFIG['strategies']['special_farming'])
+    bot = simulate(strategy, CONFIG, commands=500, outcome_log=log)
+    # 마지막 명령의 결과는 다음 틱에 기록 (더 이상 명령은 보내지 않음)
+    bot.strategy = IdleStrategy({})
+    bot.tick()
+    log.stop()
+
+    game = bot.automation
+    rows = log.query()
+    results = [r['result'] for r in rows]
+    assert len(rows) == game.enforces
+    assert results.count("성공") == game.successes
+    assert results.count("유지") == game.kept
+    assert results.count("파괴") == game.destroyed
+    for row in rows:
+        assert row['gold_after'] < row['gold_before']
+
+
+def test_simulate_updates_rate_estimator():
+    rates = GameRates(success=[0.6], destroy=[0.1], cost=[1])
+    game = SimulatedGame(SPECIAL, rates, seed=2)
+    strategy = TargetEnforcementStrategy({
+        'target_level': 99, 'required_money_per_level': [0] * 100})
+    bot = simulate(strategy, CONFIG, game, commands=3000)
+
+    estimator = bot.rate_estimator
+    level = max(estimator.counts, key=estimator.samples)
+    assert estimator.success(level) == pytest.approx(0.6, abs=0.05)
+    assert estimator.destroy(level) == pytest.approx(0.1, abs=0.05)
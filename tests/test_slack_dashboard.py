@@ -0,0 +1,246 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import pytest
+
+from domain.state import ChatbotState, GameState, Weapon
+from infrastructure.command_tracker import CommandTracker, Reply
+from infrastructure.parser import ChatParser
+from infrastructure.slack_dashboard import Dashboard
+from simulation.game import SimulatedGame
+from simulation.runner import NullSlack
+
+SPECIAL = ["짝짝이 해진 슬리퍼"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeApi:
+    def __init__(self):
+        self.calls = []
+
+    def post(self, text):
+        self.calls.append(('post', text))
+        return "1.0"
+
+    def update(self, ts, text):
+        self.calls.append(('update', text))
+
+    def pin(self, ts):
+        self.calls.append(('pin', ts))
+
+    def unpin(self, ts):
+        self.calls.append(('unpin', ts))
+
+
+def make_board(clock, **options):
+    api = FakeApi()
+    board = Dashboard(api.post, api.update, api.pin, api.unpin,
+                      clock=clock, **options)
+    return board, api
+
+
+def farm(panel, clock, seconds: float, per_second: int, game):
+    """per_second번/초 강화하며 틱마다 상태 반영, 매 틱 pump"""
+    parser = ChatParser(set(SPECIAL), tail=True)
+    tracker = CommandTracker(clock=clock)
+    state = None
+    for i in range(int(seconds * per_second)):
+        clock.now += 1 / per_second
+        cmd = "판매" if i % 7 == 6 else "강화"
+        tracker.sent(cmd, state, game.get_chat())
+        game.send_command(cmd)
+        chat = game.get_chat()
+        state = parser.parse(chat)
+        panel.observe(state, tracker.observe(state, chat))
+        panel.board.pump()
+
+
+@pytest.mark.parametrize('per_second', [1, 20])
+def test_api_calls_per_hour_do_not_depend_on_farming_rate(per_second):
+    clock = Clock()
+    board, api = make_board(clock, interval=15)
+    farm(board.panel(), clock, 3600, per_second, SimulatedGame(SPECIAL, seed=3))
+
+    kinds = [kind for kind, _ in api.calls]
+    assert kinds[:2] == ['post', 'pin']
+    assert kinds.count('post') == 1
+    assert 3600 / 15 - 2 <= kinds.count('update') <= 3600 / 15
+    assert board.panel().attempts > 0.8 * 3600 * per_second * 6 / 7
+
+
+def test_renders_weapon_gold_histogram_and_rates():
+    clock = Clock()
+    board, api = make_board(clock, interval=10, window=60)
+    panel = board.panel()
+    weapon = Weapon("낡은 검", 0, False)
+    before = GameState(10_000, weapon, ChatbotState.SELL)
+    panel.observe(before)
+    for i in range(1, 31):
+        clock.now = i
+        weapon = Weapon("낡은 검", i % 3 + 1, False)
+        state = GameState(10_000 - i * 10, weapon, ChatbotState.SUCCESS)
+        panel.observe(state, Reply("강화", before, state, 0.5))
+        before = state
+    # 짝지은 /강화 응답이 아닌 상태는 시도로 세지 않음
+    panel.observe(state)
+    panel.observe(state, Reply("판매", before, state, 0.5))
+
+    text = board.render()
+    assert "[+1] 낡은 검" in text
+    assert "💰 9,700G · -36,000G/시간" in text
+    assert "🔨 60.0회/분 (누적 30)" in text
+    assert "+1  " + "█" * 20 + " 10" in text
+    assert "+3  " in text
+
+    # 목표 달성 같은 알림이 아니라 !상태 응답은 새 메시지 없이 바로 갱신
+    assert board.pump()
+    clock.now += 2
+    panel.show(panel.state, ["⏱️ 응답: 기록 없음"])
+    assert board.pump()
+    assert [kind for kind, _ in api.calls] == ['post', 'pin', 'update']
+    assert api.calls[-1][1].endswith("⏱️ 응답: 기록 없음")
+
+
+def test_rate_limit_postpones_update_and_stop_flushes():
+    class RateLimited(Exception):
+        def __init__(self):
+            super().__init__("ratelimited")
+            self.response = SimpleNamespace(
+                status_code=429, headers={'Retry-After': '30'})
+
+    clock = Clock()
+    board, api = make_board(clock, interval=5)
+    state = GameState(1_000, Weapon("검", 1, False), ChatbotState.SUCCESS)
+    board.panel().observe(state)
+    assert board.pump()
+
+    def limited(ts, text):
+        raise RateLimited()
+    board._update = limited
+    clock.now = 6
+    board.panel().observe(GameState(900, state.weapon, ChatbotState.REMAINED))
+    assert not board.pump()
+    clock.now = 20
+    assert board.due() == 16
+
+    board._update = api.update
+    board.stop()
+    assert [kind for kind, _ in api.calls] == ['post', 'pin', 'update', 'unpin']
+
+
+def test_notifier_folds_routine_notifications_into_dashboard():
+    clock = Clock()
+    board, api = make_board(clock)
+    slack = NullSlack()
+    slack.dashboard = board.panel()
+    state = GameState(1_000, Weapon("검", 3, False), ChatbotState.SUCCESS)
+
+    slack.notify_sell(100, 1_100)
+    slack.notify_failure(5, "낡은 검")
+    slack.notify_status(state, ["🔁 틱: 처리 1"])
+    slack.notify_success(2, 3, 1_000)  # 목표 달성 알림은 그대로 전송
+
+    assert len(slack.messages) == 1
+    assert slack.messages[0].startswith("✅ *강화 성공*")
+    assert board.pump()
+    assert "🔁 틱: 처리 1" in api.calls[0][1]
+
+
+def test_supervisor_instances_share_one_dashboard():
+    from supervisor import Supervisor
+
+    clock = Clock()
+    board, api = make_board(clock)
+    slack = NullSlack()
+    slack.board = board
+    supervisor = Supervisor(slack)
+    for name in ("bot1", "bot2"):
+        supervisor.slack_for(name).dashboard.observe(
+            GameState(1_000, Weapon(f"{name} 검", 1, False),
+                      ChatbotState.SUCCESS))
+    assert board.pump()
+    text = api.calls[0][1]
+    assert text.index("*[bot1]*") < text.index("*[bot2]*")
+
+
+def test_panel_updates_wait_for_render_lock():
+    """observe(봇 스레드)는 render(대시보드 스레드)가 끝날 때까지 대기"""
+    board, api = make_board(Clock())
+    panel = board.panel()
+    state = GameState(1_000, Weapon("검", 1, False), ChatbotState.SUCCESS)
+    panel.observe(state)
+
+    after = GameState(990, Weapon("검", 2, False), ChatbotState.SUCCESS)
+    updates = [
+        threading.Thread(target=panel.observe, args=(
+            after, Reply("강화", state, after, 0.5))),
+        threading.Thread(target=panel.show, args=(state, ["추가"])),
+    ]
+    with board.lock:
+        before = board.render()
+        for thread in updates:
+            thread.start()
+            thread.join(0.2)
+            assert thread.is_alive()
+        assert board.render() == before
+    for thread in updates:
+        thread.join(5)
+    assert panel.levels[2] == 1
+    assert board.render().endswith("추가")
+
+
+class FakeSlackHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        if 'json' in self.headers.get('Content-Type', ''):
+            payload = json.loads(body)
+        else:
+            payload = {k: v[0] for k, v in parse_qs(body).items()}
+        self.requests.append((self.path, payload))
+        data = json.dumps({"ok": True, "ts": "123.456"}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_slack_bot_dashboard_against_fake_server():
+    pytest.importorskip("slack_sdk")
+    from infrastructure.slack import SlackBot
+
+    server = HTTPServer(('127.0.0.1', 0), FakeSlackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        slack = SlackBot("xoxb-test", "xapp-test", "C123",
+                         base_url=f"http://127.0.0.1:{server.server_port}/",
+                         dashboard_interval=60)
+        state = GameState(1_000, Weapon("검", 1, False), ChatbotState.SUCCESS)
+        slack.dashboard.observe(state)
+        assert slack.board.pump()
+        slack.dashboard.observe(GameState(990, state.weapon,
+                                          ChatbotState.REMAINED))
+        slack.board.stop()
+        slack.outbox.stop()
+    finally:
+        server.shutdown()
+
+    paths = [path for path, _ in FakeSlackHandler.requests]
+    assert paths == ["/chat.postMessage", "/pins.add", "/chat.update",
+                     "/pins.remove"]
+    assert FakeSlackHandler.requests[2][1]['ts'] == "123.456"
+    assert "990G" in FakeSlackHandler.requests[2][1]['text']
@@ -0,0 +1,138 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import pytest
+from infrastructure.slack_outbox import (
+    SlackOutbox, PRIORITY_LOW, PRIORITY_NORMAL,
+)
+
+
+class RateLimited(Exception):
+    def __init__(self, seconds):
+        super().__init__("ratelimited")
+        self.response = SimpleNamespace(
+            status_code=429, headers={'Retry-After': str(seconds)}
+        )
+
+
+def test_burst_is_coalesced_into_one_message():
+    sent = []
+    outbox = SlackOutbox(sent.append, coalesce=0.05)
+    outbox.start()
+
+    for i in range(3):
+        outbox.put(f"msg {i}")
+    assert outbox.flush(5)
+    outbox.stop()
+
+    assert sent == ["msg 0\n\nmsg 1\n\nmsg 2"]
+
+
+def test_retry_after_is_honoured():
+    calls = []
+
+    def post(text):
+        calls.append(text)
+        if len(calls) == 1:
+            raise RateLimited(0)
+
+    outbox = SlackOutbox(post, coalesce=0)
+    outbox.start()
+    outbox.put("hello")
+    assert outbox.flush(5)
+    outbox.stop()
+
+    assert calls == ["hello", "hello"]
+
+
+def test_low_priority_dropped_and_summarised_when_backed_up():
+    sent = []
+    outbox = SlackOutbox(sent.append, max_size=2, coalesce=0)
+    outbox.put("low", PRIORITY_LOW)
+    outbox.put("a", PRIORITY_NORMAL)
+    outbox.put("b", PRIORITY_NORMAL)
+    outbox.put("low again", PRIORITY_LOW)
+
+    outbox.start()
+    assert outbox.flush(5)
+    outbox.stop()
+
+    assert sent == ["a\n\nb\n\n… 알림 2개 생략"]
+
+
+def test_target_reached_alert_survives_backlog():
+    """목표 달성 알림은 LOW가 아니므로 큐가 밀려도 먼저 버려지지 않음"""
+    from infrastructure.notifier import Notifier
+
+    sent = []
+    outbox = SlackOutbox(sent.append, max_size=2, coalesce=0)
+
+    class OutboxNotifier(Notifier):
+        def send_message(self, text, priority=PRIORITY_NORMAL):
+            outbox.put(text, priority)
+
+    notifier = OutboxNotifier()
+    notifier.notify_sell(100, 1_100)
+    notifier.notify_success(4, 5, 1_000)
+    notifier.notify_failure(3, "낡은 검")
+    notifier.notify_sell(200, 1_300)
+
+    outbox.start()
+    assert outbox.flush(5)
+    outbox.stop()
+
+    assert len(sent) == 1
+    assert "✅ *강화 성공* [+4] → [+5]" in sent[0]
+    assert "판매 완료* +200G" in sent[0]
+    assert sent[0].endswith("… 알림 2개 생략")
+
+
+class FakeSlackHandler(BaseHTTPRequestHandler):
+    """chat.postMessage - 첫 요청은 429, 이후 성공"""
+    requests = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        if 'json' in self.headers.get('Content-Type', ''):
+            payload = json.loads(body)
+        else:
+            payload = {k: v[0] for k, v in parse_qs(body).items()}
+        self.requests.append((self.path, payload))
+
+        if len(self.requests) == 1:
+            status, data = 429, {"ok": False, "error": "ratelimited"}
+        else:
+            status, data = 200, {"ok": True, "ts": "1.0"}
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def test_slack_bot_against_fake_server():
+    pytest.importorskip("slack_sdk")
+    from infrastructure.slack import SlackBot
+
+    server = HTTPServer(('127.0.0.1', 0), FakeSlackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        slack = SlackBot("xoxb-test", "xapp-test", "C123",
+                         base_url=f"http://127.0.0.1:{server.server_port}/")
+        slack.outbox.coalesce = 0
+        slack.send_message("🤖 테스트")
+        assert slack.flush(5)
+        slack.outbox.stop()
+    finally:
+        server.shutdown()
+
+    paths = [path for path, _ in FakeSlackHandler.requests]
+    assert paths == ["/chat.postMessage", "/chat.postMessage"]
+    assert FakeSlackHandler.requests[-1][1]['text'] == "🤖 테스트"
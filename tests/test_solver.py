@@ -0,0 +1,74 @@
+"""결정표 계산/전략 테스트"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from domain.policy_table import ENFORCE, SELL, PolicyTable
+from domain.rates import GameRates
+from domain.state import ChatbotState, GameState, Weapon
+from domain.strategy.strategies import PolicyTableStrategy
+from simulation import solver
+
+# 항상 성공, +3에서만 비싸게 팔림 → +3까지 강화 후 판매
+RATES = GameRates(success=[1.0], destroy=[0.0], cost=[10],
+                  price=[0, 0, 0, 100, 0], special_rate=0.0)
+
+
+def test_solve_policy():
+    rho, enforce = solver.solve_policy(RATES)
+    # 강화 3번(-30G) + 판매 1번(+100G) = 4명령
+    assert rho == pytest.approx(70 / 4)
+    assert enforce[:, 0].tolist()[:5] == [True, True, True, False, False]
+
+
+def test_table_sells_when_gold_runs_short():
+    table = solver.solve(RATES, max_gold=2 ** 12, cells=2 ** 12)
+    assert table.decide(3, 10_000, False) == SELL
+    assert table.decide(2, 10_000, False) == ENFORCE
+    assert table.decide(0, 64, False) == ENFORCE
+    # 16G로는 +1까지만 갈 수 있고 +1은 0G → 바로 판매가 낫다
+    assert table.decide(0, 16, False) == SELL
+    assert table.decide(2, 0, False) == SELL
+
+
+def test_load_or_solve_caches_by_rates(tmp_path, monkeypatch):
+    table = solver.load_or_solve(RATES, str(tmp_path), 2 ** 12, 2 ** 12)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def fail(*args):
+        raise AssertionError("should load from cache")
+
+    monkeypatch.setattr(solver, 'solve', fail)
+    cached = solver.load_or_solve(RATES, str(tmp_path), 2 ** 12, 2 ** 12)
+    assert cached.rows == table.rows and cached.key == table.key
+
+    changed = GameRates(success=[0.5], destroy=[0.0], cost=[10])
+    assert solver.rates_key(changed) != solver.rates_key(RATES)
+
+
+class RecordingBot:
+    def __init__(self, state):
+        self.state = state
+        self.action = None
+
+    def enforce(self):
+        self.action = ENFORCE
+
+    def sell(self):
+        self.action = SELL
+
+
+def test_policy_table_strategy(tmp_path):
+    table = PolicyTable(["SE", "SS"], ["SE", "EE"])
+    path = str(tmp_path / "table.json")
+    table.save(path)
+    strategy = PolicyTableStrategy({}, PolicyTable.load(path))
+
+    for level, gold, special, expected in [
+        (0, 0, False, SELL), (0, 1, False, ENFORCE),
+        (1, 10**9, False, SELL), (5, 0, True, ENFORCE),
+    ]:
+        bot = RecordingBot(GameState(
+            gold, Weapon("검", level, special), ChatbotState.SUCCESS))
+        strategy.do_step(bot)
+        assert bot.action == expected
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+from infrastructure.special_matcher import SpecialWeaponMatcher
+from test_parser import SPECIAL_WEAPONS
+
+
+def brute_force(special_weapons, weapon_name):
+    """기존 ChatParser._check_special 구현"""
+    base_name = weapon_name.split(':')[0].strip()
+    for special in special_weapons:
+        if special in base_name or base_name in special:
+            return True
+    return False
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("신들의 치아를 닦은 칫솔: 천상의 위생", True),
+    ("오염을 무기로 바꾸는 역설의 칫솔", True),
+    ("금이 간 단소", True),
+    ("반짝이는 금이 간 단소의 잔해", True),   # 특수 무기 이름 in 이름
+    ("외로운 젓가락", True),                   # 이름 in 특수 무기 이름
+    ("낡은 검", False),
+    ("대지의 울림 검", False),
+    (": 부제만 있는 이름", True),              # 빈 이름은 모든 목록에 포함
+])
+def test_matcher_cases(name, expected):
+    matcher = SpecialWeaponMatcher(SPECIAL_WEAPONS)
+    assert matcher.match(name) is expected
+    assert brute_force(SPECIAL_WEAPONS, name) is expected
+
+
+def test_matcher_matches_brute_force_on_random_names():
+    rng = random.Random(0)
+    alphabet = ''.join(sorted(set(''.join(SPECIAL_WEAPONS))))
+    matcher = SpecialWeaponMatcher(SPECIAL_WEAPONS)
+    names = [''.join(rng.choices(alphabet, k=rng.randint(1, 12)))
+             for _ in range(2000)]
+    names += [special[i:j] for special in SPECIAL_WEAPONS
+              for i, j in [(0, 3), (2, 8), (1, -1)]]
+
+    for name in names:
+        assert matcher.match(name) == brute_force(SPECIAL_WEAPONS, name), name
+
+
+def test_empty_catalog_matches_nothing():
+    assert SpecialWeaponMatcher(set()).match("낡은 검") is False
@@ -0,0 +1,116 @@
+"""시작 시간/지연 로드 테스트 (측정: benchmarks/bench_startup.py)"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+from config import Config
+from main import dry_run
+from simulation import transcript
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CONFIG_FILE = os.path.join(ROOT, 'config.yaml')
+
+HEAVY = ['pyautogui', 'win32clipboard', 'slack_sdk', 'dotenv', 'sqlite3',
+         'numpy', 'http.server', 'yaml']
+# benchmarks/bench_startup.py 의 BUDGET_MS와 같은 상한
+BUDGET_MS = 100
+
+
+def run(args: list, stdin: str = None) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, 'src'))
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env,
+                          input=stdin, capture_output=True, text=True,
+                          encoding='utf-8', timeout=30)
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """저장소 config.yaml 사본 - 설정 캐시가 tmp_path에만 생기도록"""
+    config = tmp_path / "config.yaml"
+    shutil.copy(CONFIG_FILE, config)
+    return config
+
+
+def test_import_main_does_not_load_heavy_dependencies():
+    result = run(['-c', "import sys, main; "
+                        f"print([m for m in {HEAVY!r} if m in sys.modules])"])
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_dry_run_prints_decision(tmp_path, config_file, capsys):
+    path = tmp_path / "chat.txt"
+    path.write_text(transcript.sold(100, 5_000, "낡은 검", 600),
+                    encoding='utf-8')
+
+    bot = dry_run(Config(str(config_file), env=False), str(path))
+
+    assert bot.automation.sent == ["강화"]
+    out = capsys.readouterr().out
+    assert "[DRY-RUN] /강화" in out
+    assert "[DRY-RUN] [+0] 낡은 검 / 5,000G / 판매" in out
+
+
+def test_dry_run_reads_stdin_without_slack_or_input_packages(config_file):
+    chat = transcript.success(5, 6, "금이 간 단소", 9_000, 100, 600)
+    result = run(['src/main.py', '--config', str(config_file), '--dry-run',
+                  '--strategy', 'target'], chat)
+
+    assert result.returncode == 0, result.stderr
+    assert "[+6] 금이 간 단소 (특수) / 9,000G / 성공" in result.stdout
+
+
+def test_dry_run_reads_cached_config_without_yaml(tmp_path, config_file):
+    config = config_file
+    chat = tmp_path / "chat.txt"
+    chat.write_text(transcript.sold(100, 5_000, "낡은 검", 600),
+                    encoding='utf-8')
+    code = ("import sys, main; "
+            f"sys.argv = ['main.py', '--config', {str(config)!r}, "
+            f"'--dry-run', {str(chat)!r}]; main.main(); "
+            "print('yaml' in sys.modules)")
+
+    first = run(['-c', code])      # YAML 파싱 → 캐시 저장
+    assert first.returncode == 0, first.stderr
+    assert first.stdout.split()[-1] == "True"
+    second = run(['-c', code])     # 파일이 그대로면 캐시만 읽음
+    assert second.returncode == 0, second.stderr
+    assert second.stdout.split()[-1] == "False"
+    assert "[DRY-RUN] /강화" in second.stdout
+
+    # 설정을 고치면 다시 파싱
+    config.write_text(config.read_text(encoding='utf-8') + "\n# 수정\n",
+                      encoding='utf-8')
+    assert run(['-c', code]).stdout.split()[-1] == "True"
+
+
+@pytest.mark.integration
+def test_dry_run_startup_within_budget(tmp_path, config_file):
+    """파이썬 시작 시간을 뺀 dry-run 시간 (중앙값) < BUDGET_MS
+
+    실제 시간을 재므로 느린/바쁜 CI에서는 흔들린다 - 단위 테스트에서는 빼고
+    (-m "not integration") benchmarks/bench_startup.py 와 함께 따로 돌린다.
+    """
+    chat = tmp_path / "chat.txt"
+    chat.write_text(transcript.TranscriptGenerator(seed=0).generate(2_000),
+                    encoding='utf-8')
+
+    def median_ms(args: list) -> float:
+        times = []
+        for _ in range(5):
+            started = time.perf_counter()
+            assert run(args).returncode == 0
+            times.append(time.perf_counter() - started)
+        return statistics.median(times) * 1000
+
+    args = ['src/main.py', '--config', str(config_file), '--dry-run',
+            str(chat)]
+    run(args)  # 설정 캐시 생성
+    overhead = median_ms(args) - \
+        median_ms(['-c', 'pass'])
+    assert overhead < BUDGET_MS
@@ -0,0 +1,131 @@
+"""여러 인스턴스 실행 테스트"""
+import threading
+import time
+
+from domain.strategy.strategies import SpecialWeaponFarming
+from infrastructure.input_arbiter import InputArbiter
+from infrastructure.metrics import Metrics
+from infrastructure.parser import ChatParser
+from infrastructure.scheduler import PollScheduler
+from main import GameBot
+from simulation.game import SimulatedGame
+from simulation.runner import NullSlack
+from supervisor import Supervisor
+
+SPECIAL = ["짝짝이 해진 슬리퍼"]
+CONFIG = {
+    'special_weapons': SPECIAL,
+    'strategies': {
+        'special_farming': {'target_level': 5, 'safe_money': [0] * 20},
+    },
+}
+
+
+def make_supervisor(names):
+    slack = NullSlack()
+    supervisor = Supervisor(slack)
+    for i, name in enumerate(names):
+        supervisor.add(name, GameBot(
+            strategy=SpecialWeaponFarming(
+                CONFIG['strategies']['special_farming']
+            ),
+            parser=ChatParser(set(SPECIAL), tail=True),
+            automation=SimulatedGame(SPECIAL, seed=i),
+            slack=supervisor.slack_for(name),
+            config=CONFIG,
+            interval=0.001,
+            scheduler=PollScheduler(0.001, 0.01),
+        ))
+    return supervisor, slack
+
+
+def test_arbiter_is_exclusive_and_fifo():
+    arbiter = InputArbiter()
+    order, inside = [], []
+
+    arbiter.acquire("main")
+    threads = []
+    for i in range(5):
+        def work(i=i):
+            with arbiter:
+                inside.append(i)
+                assert len(inside) == 1
+                order.append(i)
+                inside.pop()
+        threads.append(threading.Thread(target=work))
+        threads[-1].start()
+        # 번호표를 순서대로 받을 때까지 대기
+        while arbiter._next != i + 2:
+            time.sleep(0.001)
+    assert arbiter.owner == "main"
+    arbiter.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_routes_named_commands_and_broadcasts_the_rest():
+    supervisor, slack = make_supervisor(["bot1", "bot2"])
+    bot1, bot2 = supervisor.bots["bot1"], supervisor.bots["bot2"]
+
+    supervisor.route("!강화 10 bot2")
+    supervisor.route("!중단")
+    supervisor.route("!도움")
+    assert bot1.commands.depth == 2
+    assert bot2.commands.depth == 2
+
+    handled = []
+    bot2.commands.drain(handled.append)
+    assert handled == ["!강화 10", "!중단"]
+
+    bot1.slack.send_message("안녕")
+    assert slack.messages[-1] == "[bot1] 안녕"
+
+
+def test_run_controls_each_instance():
+    supervisor, slack = make_supervisor(["bot1", "bot2"])
+    games = {name: bot.automation for name, bot in supervisor.bots.items()}
+    thread = threading.Thread(target=supervisor.run)
+    thread.start()
+
+    supervisor.route("!시작 bot1")
+    deadline = time.monotonic() + 5
+    while games["bot1"].commands < 20 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    supervisor.route("!종료")
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert games["bot1"].commands >= 20
+    assert games["bot2"].commands == 0
+    assert "[bot2] 👋 GameBot 종료" in slack.messages
+
+
+def test_status_reports_ticks_per_instance():
+    slack = NullSlack()
+    supervisor = Supervisor(slack)
+    metrics = Metrics()
+    for i, name in enumerate(["bot1", "bot2"]):
+        supervisor.add(name, GameBot(
+            strategy=SpecialWeaponFarming(
+                CONFIG['strategies']['special_farming']
+            ),
+            parser=ChatParser(set(SPECIAL), tail=True),
+            automation=SimulatedGame(SPECIAL, seed=i),
+            slack=supervisor.slack_for(name),
+            config=CONFIG,
+            interval=0,
+            metrics=metrics,
+        ))
+    bot1, bot2 = supervisor.bots.values()
+    bot1.running = bot2.running = True
+    bot1.paused = bot2.paused = False
+    for _ in range(5):
+        bot1.tick()
+    bot2.tick()
+
+    assert metrics.count('ticks_processed') == 6
+    assert (bot1.ticks_processed, bot2.ticks_processed) == (5, 1)
+    bot2._handle_slack_command("!상태")
+    assert "🔁 틱: 처리 1 / 생략 0" in slack.messages[-1]
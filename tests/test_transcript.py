@@ -0,0 +1,37 @@
+"""합성 채팅 생성기 테스트"""
+from domain.state import ChatbotState
+from infrastructure.parser import ChatParser
+from simulation import transcript
+from simulation.transcript import TranscriptGenerator
+
+SPECIAL = {"용사의 전설검"}
+
+
+def test_templates_parse():
+    parser = ChatParser(SPECIAL)
+    cases = [
+        (transcript.success(3, 4, "녹슨 철검", 1000, 10, 0),
+         ChatbotState.SUCCESS, 4, "녹슨 철검"),
+        (transcript.success(10, 11, "녹슨 철검", 1000, 10, 0),
+         ChatbotState.SUCCESS, 11, "녹슨 철검"),
+        (transcript.kept(5, "녹슨 철검", 1000, 10, 0),
+         ChatbotState.REMAINED, 5, "녹슨 철검"),
+        (transcript.destroyed(12, "녹슨 철검", "낡은 검", 1000, 10, 0),
+         ChatbotState.FAILED, 0, "낡은 검"),
+        (transcript.sold(500, 1000, "낡은 망치", 0),
+         ChatbotState.SELL, 0, "낡은 망치"),
+    ]
+    for text, state, level, name in cases:
+        game = parser.parse(transcript.command("강화", 0) + "\n" + text)
+        assert game.bot_state == state
+        assert game.gold == 1000
+        assert game.weapon.level == level
+        assert game.weapon.name == name
+
+
+def test_generator_deterministic():
+    a = TranscriptGenerator(SPECIAL, seed=1).generate(500)
+    b = TranscriptGenerator(SPECIAL, seed=1).generate(500)
+    assert a == b
+    assert a.count('\n') + 1 >= 500
+    assert ChatParser(SPECIAL).parse(a).weapon is not None